@@ -2,8 +2,14 @@
 Notexio Text Editor - Main Application Entry Point
 A lightweight, customizable text editor built with Python and Tkinter.
 """
+import time
+
+# Taken first so --startup-profile can include import time
+STARTUP_TIME = time.perf_counter()
+
 import tkinter as tk
 from tkinter import messagebox
+import argparse
 import os
 import sys
 
@@ -14,76 +20,209 @@ from src.editor import Editor
 from src.file_manager import FileManager
 from src.edit_operations import EditOperations
 from src.formatter import Formatter
+from src.syntax_highlighter import SyntaxHighlighter
 from src.view_manager import ViewManager
-from src.tools import Tools
 from src.theme_manager import ThemeManager
+from src.theme_packs import theme_label
 from src.safety_features import SafetyFeatures
 from src.ui_components import UIComponents
 from src.settings_manager import SettingsManager
-from src.misc_features import MiscFeatures
+from src.tab_manager import TabManager
+from src.session_manager import SessionManager
+from src.single_instance import SingleInstance
+from src.startup_profiler import StartupProfiler
 
 
 class NotexioApp:
     """Main application class."""
     
-    def __init__(self, root):
+    def __init__(self, root, profiler=None):
         self.root = root
+        self.profiler = profiler or StartupProfiler()
         self.settings_manager = SettingsManager()
         
         # Set modern window styling
         root.configure(bg="#FFFFFF")
         
         # Initialize editor
-        self.editor = Editor(root)
+        with self.profiler.phase("editor"):
+            self.editor = Editor(root)
         
         # Initialize managers
-        self.file_manager = FileManager(self.editor, self.settings_manager)
-        # Set app reference for recent files menu updates
-        self.file_manager.app = self
-        
-        # Set editor reference for UI components (circular reference)
-        self.editor.ui_components = None  # Will be set below
-        self.edit_operations = EditOperations(self.editor)
-        self.formatter = Formatter(self.editor)
-        self.view_manager = ViewManager(self.editor)
-        # Set references for cross-module communication
-        self.editor.view_manager = self.view_manager
-        self.editor.formatter = self.formatter
-        self.tools = Tools(self.editor)
-        self.theme_manager = ThemeManager(self.editor, self.settings_manager)
-        self.safety_features = SafetyFeatures(self.editor, self.file_manager)
-        self.ui_components = UIComponents(self.editor)
-        self.misc_features = MiscFeatures(self.editor, self.file_manager)
-        
-        # Connect app reference to UI components
-        self.ui_components.app = self
-        # Set UI components reference in editor for status bar updates
-        self.editor.ui_components = self.ui_components
-        
-        # Setup UI
-        self.setup_menu()
-        self.ui_components.create_toolbar()
-        self.ui_components.create_status_bar()
+        with self.profiler.phase("managers"):
+            self.file_manager = FileManager(self.editor, self.settings_manager)
+            # Set app reference for recent files menu updates
+            self.file_manager.app = self
+            self.recent_menu = None
+            self.tab_manager = TabManager(self.editor, self.settings_manager, self.file_manager)
+            self.editor.tab_manager = self.tab_manager
+            self.session_manager = SessionManager(self.editor, self.settings_manager, self.tab_manager)
+            
+            # Set editor reference for UI components (circular reference)
+            self.editor.ui_components = None  # Will be set below
+            self.edit_operations = EditOperations(self.editor)
+            self.formatter = Formatter(self.editor, self.settings_manager)
+            self.syntax_highlighter = SyntaxHighlighter(self.editor, self.settings_manager)
+            self.view_manager = ViewManager(self.editor)
+            # Set references for cross-module communication
+            self.editor.view_manager = self.view_manager
+            self.editor.formatter = self.formatter
+            self.editor.syntax_highlighter = self.syntax_highlighter
+            self.theme_manager = ThemeManager(self.editor, self.settings_manager)
+            self.editor.theme_manager = self.theme_manager
+            self.safety_features = SafetyFeatures(self.editor, self.file_manager)
+            self.ui_components = UIComponents(self.editor)
+            
+            # Tools, misc features and the log follower are created on first use
+            self._tools = None
+            self._misc_features = None
+            self._log_follower = None
+            self._batch_dialog = None
+            self._frequency_panel = None
+            self._readability_panel = None
+            self._spell_checker = None
+            self._markdown_preview = None
+            self.autocomplete = None
+            
+            # Connect app reference to UI components
+            self.ui_components.app = self
+            # Set UI components reference in editor for status bar updates
+            self.editor.ui_components = self.ui_components
+        
+        # Setup UI - menu contents are built when a menu is first opened
+        with self.profiler.phase("menu bar"):
+            self.setup_menu()
+        
+        # Load settings
+        with self.profiler.phase("settings and theme"):
+            self.load_settings()
         
+        # Reopen the documents of the previous session
+        with self.profiler.phase("session restore"):
+            self.session_manager.restore_session()
+        
+        # Bind keyboard shortcuts
+        with self.profiler.phase("shortcuts"):
+            self.bind_shortcuts()
+            
+            # Bind mouse wheel to entire window
+            self.root.bind_all("<MouseWheel>", self.on_window_mousewheel)
+            self.root.bind_all("<Button-4>", self.on_window_mousewheel)
+            self.root.bind_all("<Button-5>", self.on_window_mousewheel)
+        
+        # Everything else waits until the editor has been painted
+        self.root.after_idle(self.root.after, 0, self.finish_startup)
+        
+    def finish_startup(self):
+        """Build the deferred parts of the UI after the first paint."""
+        self.profiler.mark("first paint")
+        
+        with self.profiler.phase("toolbar"):
+            self.ui_components.create_toolbar()
+        with self.profiler.phase("status bar"):
+            self.ui_components.create_status_bar()
+            self.ui_components.update_status_bar()
+            self.view_manager.update_zoom_label()
+            
         # Connect toolbar commands
         self.connect_toolbar_commands()
         
         # Enable drag and drop
-        self.misc_features.enable_drag_drop()
+        with self.profiler.phase("drag and drop"):
+            self.misc_features.enable_drag_drop()
         
-        # Load settings
-        self.load_settings()
+        # Word completion indexes the documents that are already open
+        with self.profiler.phase("autocomplete"):
+            from src.autocomplete import AutoComplete
+            self.autocomplete = AutoComplete(self.editor, self.settings_manager)
+        
+        # The dictionary loads in the background
+        if self.settings_manager.get_setting("spell_check", False):
+            with self.profiler.phase("spell check"):
+                self.spell_checker.set_enabled(True)
+        
+        if self.settings_manager.get_setting("markdown_preview", False):
+            with self.profiler.phase("markdown preview"):
+                self.markdown_preview.set_visible(True)
+        
+        # The font family list is ready before the Font Family dialog opens
+        self.root.after_idle(self.formatter.load_font_families)
         
         # Check for recovery files
-        self.check_recovery_files()
+        with self.profiler.phase("recovery check"):
+            recovery_files = self.safety_features.check_recovery_files()
         
-        # Bind keyboard shortcuts
-        self.bind_shortcuts()
+        self.profiler.mark("startup complete")
+        self.profiler.report()
         
-        # Bind mouse wheel to entire window
-        self.root.bind_all("<MouseWheel>", self.on_window_mousewheel)
-        self.root.bind_all("<Button-4>", self.on_window_mousewheel)
-        self.root.bind_all("<Button-5>", self.on_window_mousewheel)
+        if recovery_files:
+            self.check_recovery_files(recovery_files)
+            
+    @property
+    def tools(self):
+        """Tools and statistics (created on first use)."""
+        if self._tools is None:
+            from src.tools import Tools
+            self._tools = Tools(self.editor, self.settings_manager)
+        return self._tools
+        
+    @property
+    def misc_features(self):
+        """Print, PDF export and drag & drop (created on first use)."""
+        if self._misc_features is None:
+            from src.misc_features import MiscFeatures
+            self._misc_features = MiscFeatures(self.editor, self.file_manager)
+        return self._misc_features
+        
+    @property
+    def log_follower(self):
+        """Tail/follow mode (created on first use)."""
+        if self._log_follower is None:
+            from src.log_follower import LogFollower
+            self._log_follower = LogFollower(self.editor, self.settings_manager)
+            self.editor.log_follower = self._log_follower
+        return self._log_follower
+        
+    @property
+    def batch_dialog(self):
+        """Batch processing dialog (created on first use)."""
+        if self._batch_dialog is None:
+            from src.batch_dialog import BatchDialog
+            self._batch_dialog = BatchDialog(self.editor)
+        return self._batch_dialog
+        
+    @property
+    def frequency_panel(self):
+        """Word frequency panel (created on first use)."""
+        if self._frequency_panel is None:
+            from src.frequency_panel import FrequencyPanel
+            self._frequency_panel = FrequencyPanel(self.editor, self.edit_operations)
+        return self._frequency_panel
+        
+    @property
+    def readability_panel(self):
+        """Readability panel (created on first use)."""
+        if self._readability_panel is None:
+            from src.readability_panel import ReadabilityPanel
+            self._readability_panel = ReadabilityPanel(self.editor)
+        return self._readability_panel
+        
+    @property
+    def markdown_preview(self):
+        """Markdown preview pane (created on first use)."""
+        if self._markdown_preview is None:
+            from src.markdown_preview import MarkdownPreview
+            self._markdown_preview = MarkdownPreview(self.editor, self.settings_manager)
+            self.editor.markdown_preview = self._markdown_preview
+        return self._markdown_preview
+        
+    @property
+    def spell_checker(self):
+        """Spell checking as you type (created on first use)."""
+        if self._spell_checker is None:
+            from src.spell_checker import SpellChecker
+            self._spell_checker = SpellChecker(self.editor, self.settings_manager)
+        return self._spell_checker
         
     def on_window_mousewheel(self, event):
         """Handle mouse wheel on entire window."""
@@ -103,73 +242,85 @@ class NotexioApp:
                 elif event.num == 5:
                     self.editor.text_widget.yview_scroll(1, "units")
         
-    def setup_menu(self):
-        """Setup Windows Notepad-style menu bar."""
-        menubar = tk.Menu(
-            self.root,
+    def create_menu(self, parent):
+        """Create a menu with the Windows Notepad-style look."""
+        menu = tk.Menu(
+            parent,
             tearoff=0,
-            bg="#FAFAFA",
+            bg="#FFFFFF",
             fg="#000000",
             activebackground="#0078D4",
             activeforeground="#FFFFFF",
             font=("Segoe UI", 9),
             borderwidth=0
         )
-        self.root.config(menu=menubar)
+        self.theme_manager.register(menu, "menu")
+        return menu
         
-        # File menu - Windows Notepad style
-        file_menu = tk.Menu(
-            menubar,
+    def setup_menu(self):
+        """Setup Windows Notepad-style menu bar."""
+        menubar = tk.Menu(
+            self.root,
             tearoff=0,
-            bg="#FFFFFF",
+            bg="#FAFAFA",
             fg="#000000",
             activebackground="#0078D4",
             activeforeground="#FFFFFF",
             font=("Segoe UI", 9),
             borderwidth=0
         )
-        menubar.add_cascade(label="File", menu=file_menu)
+        self.root.config(menu=menubar)
+        self.menubar = menubar
+        self.theme_manager.register(menubar, "menubar")
+        
+        # Only the cascades exist at startup; each menu fills itself when first posted
+        menus = [
+            ("File", self.build_file_menu),
+            ("Edit", self.build_edit_menu),
+            ("Format", self.build_format_menu),
+            ("View", self.build_view_menu),
+            ("Tools", self.build_tools_menu),
+            ("Theme", self.build_theme_menu),
+            ("Help", self.build_help_menu),
+        ]
+        self.menus = {}
+        for label, builder in menus:
+            menu = self.create_menu(menubar)
+            menu.configure(postcommand=lambda m=menu, b=builder: self.build_menu_once(m, b))
+            menubar.add_cascade(label=label, menu=menu)
+            self.menus[label] = menu
+            
+    def build_menu_once(self, menu, builder):
+        """postcommand handler - build a menu's contents the first time it opens."""
+        menu.configure(postcommand="")
+        builder(menu)
+        
+    def build_file_menu(self, file_menu):
+        """Build the File menu - Windows Notepad style."""
         file_menu.add_command(label="New", command=self.file_manager.new_file, accelerator="Ctrl+N")
         file_menu.add_command(label="Open...", command=self.file_manager.open_file, accelerator="Ctrl+O")
         file_menu.add_separator()
         file_menu.add_command(label="Save", command=self.file_manager.save_file, accelerator="Ctrl+S")
         file_menu.add_command(label="Save As...", command=self.file_manager.save_as_file, accelerator="Ctrl+Shift+S")
+        file_menu.add_command(label="Close Tab", command=self.tab_manager.close_tab, accelerator="Ctrl+W")
         file_menu.add_separator()
         
         # Recent files submenu
-        self.recent_menu = tk.Menu(
-            file_menu,
-            tearoff=0,
-            bg="#FFFFFF",
-            fg="#000000",
-            activebackground="#0078D4",
-            activeforeground="#FFFFFF",
-            font=("Segoe UI", 9),
-            borderwidth=0
-        )
+        self.recent_menu = self.create_menu(file_menu)
         file_menu.add_cascade(label="Open Recent", menu=self.recent_menu)
         self.update_recent_files_menu(self.recent_menu)
+        file_menu.add_command(label="Follow File (Tail)...", command=lambda: self.log_follower.toggle_follow())
         
         file_menu.add_separator()
-        file_menu.add_command(label="Print Preview...", command=self.misc_features.print_preview)
-        file_menu.add_command(label="Print...", command=self.misc_features.print_file, accelerator="Ctrl+P")
+        file_menu.add_command(label="Print Preview...", command=lambda: self.misc_features.print_preview())
+        file_menu.add_command(label="Print...", command=lambda: self.misc_features.print_file(), accelerator="Ctrl+P")
         file_menu.add_separator()
-        file_menu.add_command(label="Export as PDF...", command=self.misc_features.export_as_pdf)
+        file_menu.add_command(label="Export as PDF...", command=lambda: self.misc_features.export_as_pdf())
         file_menu.add_separator()
         file_menu.add_command(label="Exit", command=self.on_closing)
         
-        # Edit menu
-        edit_menu = tk.Menu(
-            menubar,
-            tearoff=0,
-            bg="#FFFFFF",
-            fg="#000000",
-            activebackground="#0078D4",
-            activeforeground="#FFFFFF",
-            font=("Segoe UI", 9),
-            borderwidth=0
-        )
-        menubar.add_cascade(label="Edit", menu=edit_menu)
+    def build_edit_menu(self, edit_menu):
+        """Build the Edit menu."""
         edit_menu.add_command(label="Undo", command=self.edit_operations.undo, accelerator="Ctrl+Z")
         edit_menu.add_command(label="Redo", command=self.edit_operations.redo, accelerator="Ctrl+Y")
         edit_menu.add_separator()
@@ -184,18 +335,8 @@ class NotexioApp:
         edit_menu.add_command(label="Replace...", command=self.edit_operations.replace, accelerator="Ctrl+H")
         edit_menu.add_command(label="Go to Line...", command=self.edit_operations.go_to_line, accelerator="Ctrl+G")
         
-        # Format menu
-        format_menu = tk.Menu(
-            menubar,
-            tearoff=0,
-            bg="#FFFFFF",
-            fg="#000000",
-            activebackground="#0078D4",
-            activeforeground="#FFFFFF",
-            font=("Segoe UI", 9),
-            borderwidth=0
-        )
-        menubar.add_cascade(label="Format", menu=format_menu)
+    def build_format_menu(self, format_menu):
+        """Build the Format menu."""
         format_menu.add_command(label="Font Family...", command=self.formatter.change_font_family)
         format_menu.add_command(label="Font Size...", command=self.formatter.change_font_size)
         format_menu.add_separator()
@@ -208,75 +349,75 @@ class NotexioApp:
         format_menu.add_separator()
         format_menu.add_command(label="Restore Default Formatting", command=self.formatter.restore_default_formatting)
         
-        # View menu
-        view_menu = tk.Menu(
-            menubar,
-            tearoff=0,
-            bg="#FFFFFF",
-            fg="#000000",
-            activebackground="#0078D4",
-            activeforeground="#FFFFFF",
-            font=("Segoe UI", 9),
-            borderwidth=0
-        )
-        menubar.add_cascade(label="View", menu=view_menu)
+    def build_view_menu(self, view_menu):
+        """Build the View menu."""
         view_menu.add_command(label="Zoom In", command=self.view_manager.zoom_in, accelerator="Ctrl+Plus")
         view_menu.add_command(label="Zoom Out", command=self.view_manager.zoom_out, accelerator="Ctrl+Minus")
         view_menu.add_command(label="Reset Zoom", command=self.view_manager.reset_zoom, accelerator="Ctrl+0")
         view_menu.add_separator()
         view_menu.add_command(label="Word Wrap", command=self.view_manager.toggle_word_wrap)
         view_menu.add_command(label="Line Numbers", command=self.toggle_line_numbers)
+        self.syntax_highlighting_var = tk.BooleanVar(value=self.syntax_highlighter.enabled)
+        view_menu.add_checkbutton(
+            label="Syntax Highlighting",
+            variable=self.syntax_highlighting_var,
+            command=self.toggle_syntax_highlighting
+        )
+        self.markdown_preview_var = tk.BooleanVar(value=self.settings_manager.get_setting("markdown_preview", False))
+        view_menu.add_checkbutton(
+            label="Markdown Preview",
+            variable=self.markdown_preview_var,
+            command=self.toggle_markdown_preview
+        )
+        view_menu.add_separator()
+        view_menu.add_command(label="Split Horizontally", command=lambda: self.view_manager.split_view(tk.HORIZONTAL))
+        view_menu.add_command(label="Split Vertically", command=lambda: self.view_manager.split_view(tk.VERTICAL))
+        view_menu.add_command(label="Close Split", command=self.view_manager.close_split)
+        view_menu.add_separator()
         view_menu.add_command(label="Fullscreen", command=self.view_manager.toggle_fullscreen, accelerator="F11")
         
-        # Tools menu
-        tools_menu = tk.Menu(
-            menubar,
-            tearoff=0,
-            bg="#FFFFFF",
-            fg="#000000",
-            activebackground="#0078D4",
-            activeforeground="#FFFFFF",
-            font=("Segoe UI", 9),
-            borderwidth=0
-        )
-        menubar.add_cascade(label="Tools", menu=tools_menu)
+    def build_tools_menu(self, tools_menu):
+        """Build the Tools menu."""
         tools_menu.add_command(label="Word Count", command=lambda: messagebox.showinfo("Word Count", f"Words: {self.tools.get_word_count():,}"))
         tools_menu.add_command(label="Character Count", command=lambda: messagebox.showinfo("Character Count", f"Characters: {self.tools.get_character_count():,}"))
         tools_menu.add_command(label="Line Count", command=lambda: messagebox.showinfo("Line Count", f"Lines: {self.tools.get_line_count():,}"))
         tools_menu.add_command(label="Document Statistics", command=self.tools.show_statistics)
         tools_menu.add_separator()
+        self.spell_check_var = tk.BooleanVar(value=self.settings_manager.get_setting("spell_check", False))
+        tools_menu.add_checkbutton(
+            label="Check Spelling as You Type",
+            variable=self.spell_check_var,
+            command=self.toggle_spell_check
+        )
+        self.autocomplete_var = tk.BooleanVar(value=self.settings_manager.get_setting("autocomplete", True))
+        tools_menu.add_checkbutton(
+            label="Word Completion",
+            variable=self.autocomplete_var,
+            command=self.toggle_autocomplete
+        )
         tools_menu.add_command(label="Reading Time Estimate", command=lambda: messagebox.showinfo("Reading Time", f"Estimated reading time: {self.tools.get_reading_time()}"))
+        tools_menu.add_command(label="Readability...", command=lambda: self.readability_panel.show())
+        tools_menu.add_command(label="Word Frequency...", command=lambda: self.frequency_panel.show())
         tools_menu.add_command(label="Highlight Duplicate Words", command=self.tools.highlight_duplicate_words)
         tools_menu.add_command(label="Remove Extra Spaces", command=self.tools.remove_extra_spaces)
+        tools_menu.add_separator()
+        tools_menu.add_command(label="Batch...", command=lambda: self.batch_dialog.show())
         
-        # Theme menu
-        theme_menu = tk.Menu(
-            menubar,
-            tearoff=0,
-            bg="#FFFFFF",
-            fg="#000000",
-            activebackground="#0078D4",
-            activeforeground="#FFFFFF",
-            font=("Segoe UI", 9),
-            borderwidth=0
-        )
-        menubar.add_cascade(label="Theme", menu=theme_menu)
+    def build_theme_menu(self, theme_menu):
+        """Build the Theme menu."""
         theme_menu.add_command(label="Light Mode", command=self.theme_manager.set_light_mode)
         theme_menu.add_command(label="Dark Mode", command=self.theme_manager.set_dark_mode)
+        # Other installed packs (listed by file name; parsed only when chosen)
+        other_themes = [name for name in self.theme_manager.get_theme_names() if name not in ("light", "dark")]
+        if other_themes:
+            theme_menu.add_separator()
+            for name in other_themes:
+                theme_menu.add_command(label=theme_label(name), command=lambda n=name: self.theme_manager.apply_theme(n))
+            theme_menu.add_separator()
         theme_menu.add_command(label="Customize Theme...", command=self.theme_manager.customize_theme)
         
-        # Help menu
-        help_menu = tk.Menu(
-            menubar,
-            tearoff=0,
-            bg="#FFFFFF",
-            fg="#000000",
-            activebackground="#0078D4",
-            activeforeground="#FFFFFF",
-            font=("Segoe UI", 9),
-            borderwidth=0
-        )
-        menubar.add_cascade(label="Help", menu=help_menu)
+    def build_help_menu(self, help_menu):
+        """Build the Help menu."""
         help_menu.add_command(label="About", command=self.show_about)
         
     def update_recent_files_menu(self, recent_menu):
@@ -313,9 +454,10 @@ class NotexioApp:
         height = self.settings_manager.get_setting("window_height", 600)
         self.root.geometry(f"{width}x{height}")
         
-    def check_recovery_files(self):
+    def check_recovery_files(self, recovery_files=None):
         """Check for recovery files on startup."""
-        recovery_files = self.safety_features.check_recovery_files()
+        if recovery_files is None:
+            recovery_files = self.safety_features.check_recovery_files()
         if recovery_files:
             response = messagebox.askyesno(
                 "Recovery Files Found",
@@ -332,6 +474,12 @@ class NotexioApp:
         self.root.bind("<Control-o>", lambda e: self.file_manager.open_file())
         self.root.bind("<Control-s>", lambda e: self.file_manager.save_file())
         self.root.bind("<Control-S>", lambda e: self.file_manager.save_as_file())  # Ctrl+Shift+S
+        self.root.bind("<Control-w>", lambda e: self.tab_manager.close_tab())
+        
+        # Tab shortcuts
+        self.root.bind("<Control-Tab>", lambda e: self.tab_manager.next_tab() or "break")
+        self.root.bind("<Control-Shift-Tab>", lambda e: self.tab_manager.previous_tab() or "break")
+        self.root.bind("<Control-ISO_Left_Tab>", lambda e: self.tab_manager.previous_tab() or "break")  # Linux
         
         # Edit shortcuts
         self.root.bind("<Control-z>", lambda e: self.edit_operations.undo())
@@ -359,6 +507,27 @@ class NotexioApp:
         # Print shortcut
         self.root.bind("<Control-p>", lambda e: self.misc_features.print_file())
         
+    def toggle_spell_check(self):
+        """Toggle spell checking and keep the menu check mark in sync."""
+        self.spell_checker.toggle()
+        self.spell_check_var.set(self.spell_checker.enabled)
+        
+    def toggle_autocomplete(self):
+        """Toggle word completion and keep the menu check mark in sync."""
+        if self.autocomplete is not None:
+            self.autocomplete.toggle()
+            self.autocomplete_var.set(self.autocomplete.enabled)
+        
+    def toggle_markdown_preview(self):
+        """Toggle the Markdown preview pane and keep the menu check mark in sync."""
+        self.markdown_preview.toggle()
+        self.markdown_preview_var.set(self.markdown_preview.visible)
+        
+    def toggle_syntax_highlighting(self):
+        """Toggle syntax highlighting."""
+        self.syntax_highlighter.toggle()
+        self.syntax_highlighting_var.set(self.syntax_highlighter.enabled)
+        
     def toggle_line_numbers(self):
         """Toggle line numbers display."""
         self.ui_components.toggle_line_numbers()
@@ -367,17 +536,36 @@ class NotexioApp:
     def on_closing(self):
         """Handle application closing."""
         if self.safety_features.warn_on_exit():
+            if self.editor.log_follower:
+                self.editor.log_follower.stop()
+            
             # Save window size
             self.settings_manager.set_setting("window_width", self.root.winfo_width())
             self.settings_manager.set_setting("window_height", self.root.winfo_height())
             self.settings_manager.save_settings()
             
+            # Remember open documents for the next start
+            self.session_manager.save_session()
+            
             # Create final recovery file
             if self.editor.is_modified:
                 self.safety_features.create_recovery_file()
                 
+            self.tab_manager.cleanup()
             self.root.destroy()
             
+    def open_files(self, filepaths):
+        """Open files passed on the command line or forwarded by another launch."""
+        for filepath in filepaths:
+            if os.path.isfile(filepath):
+                self.file_manager.open_file(filepath)
+            else:
+                messagebox.showerror("Error", f"File not found:\n{filepath}")
+        # Bring the window to the front for the user who just launched us
+        self.root.deiconify()
+        self.root.lift()
+        self.root.focus_force()
+        
     def show_about(self):
         """Show about dialog."""
         about_text = """Notexio Text Editor
@@ -390,17 +578,55 @@ built with Python and Tkinter.
         messagebox.showinfo("About Notexio", about_text)
 
 
+def parse_args(argv=None):
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(prog="notexio", description="Notexio Text Editor")
+    parser.add_argument("files", nargs="*", help="files to open")
+    parser.add_argument(
+        "--new-instance",
+        action="store_true",
+        help="start a separate window instead of reusing a running instance"
+    )
+    parser.add_argument(
+        "--startup-profile",
+        action="store_true",
+        help="print a per-phase startup timing breakdown"
+    )
+    return parser.parse_args(argv)
+
+
 def main():
     """Main entry point."""
-    root = tk.Tk()
-    app = NotexioApp(root)
+    args = parse_args()
+    profiler = StartupProfiler(enabled=args.startup_profile, start_time=STARTUP_TIME)
+    profiler.mark("imports")
+    
+    # Hand the files to a running instance and exit before paying for Tk startup
+    instance = None
+    if not args.new_instance and SingleInstance.is_supported():
+        instance = SingleInstance()
+        if instance.forward(args.files):
+            return
+    
+    with profiler.phase("tk init"):
+        root = tk.Tk()
+    app = NotexioApp(root, profiler)
+    
+    if args.files:
+        app.open_files(args.files)
+        
+    if instance and instance.listen():
+        instance.poll(root, app.open_files)
     
     # Override window close protocol
     root.protocol("WM_DELETE_WINDOW", app.on_closing)
     
-    root.mainloop()
+    try:
+        root.mainloop()
+    finally:
+        if instance:
+            instance.close()
 
 
 if __name__ == "__main__":
     main()
-
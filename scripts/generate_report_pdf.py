@@ -4,310 +4,250 @@ Generate a PDF report from docs/report.md using ReportLab.
 Output:
   docs/Notexio_CSE323_Report.pdf
 
+Usage:
+  python scripts/generate_report_pdf.py                  # docs/report.md
+  python scripts/generate_report_pdf.py a.md b.md -j 2   # several inputs in parallel
+  python scripts/generate_report_pdf.py --watch          # rebuild on every save
+
 Notes:
-  - This is a lightweight Markdown-to-PDF renderer (headings, paragraphs, bullets).
+  - This is a lightweight Markdown-to-PDF renderer (headings, paragraphs, bullets);
+    the parser is src/markdown_parser.py and the layout src/pdf_export.py, which the
+    editor uses to export .md files.
   - It intentionally supports only the subset used by docs/report.md.
+  - Builds are incremental: an output is only rebuilt when its Markdown or the
+    styles changed (use --force to rebuild anyway), and the converted
+    markup of every block is cached in config/cache/report_pdf/.
 """
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import argparse
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import hashlib
+import json
+import os
 from pathlib import Path
-import re
-from typing import Iterable, List, Optional
-
+import sys
+import time
+from typing import List, Optional, Tuple
 
-@dataclass(frozen=True)
-class Block:
-    kind: str  # "h1" | "h2" | "h3" | "p" | "ul" | "hr" | "blank"
-    lines: List[str]
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT))
+from src import markdown_parser, pdf_export  # noqa: E402
 
+DEFAULT_INPUT = REPO_ROOT / "docs" / "report.md"
+DEFAULT_OUTPUT = REPO_ROOT / "docs" / "Notexio_CSE323_Report.pdf"
+CACHE_DIR = REPO_ROOT / "config" / "cache" / "report_pdf"
+WATCH_POLL_INTERVAL = 0.2  # seconds
 
-def _escape_xml(s: str) -> str:
-    return (
-        s.replace("&", "&amp;")
-        .replace("<", "&lt;")
-        .replace(">", "&gt;")
-    )
+# Bump when the block conversion changes, so cached markup is not reused
+RENDERER_VERSION = 2
 
 
-def _read_md(path: Path) -> List[str]:
-    text = path.read_text(encoding="utf-8")
+def _split_lines(text: str) -> List[str]:
     # Normalize newlines
     return text.replace("\r\n", "\n").replace("\r", "\n").split("\n")
 
 
-_INLINE_RE = re.compile(
-    r"""
-    \[([^\]]+?)\]\((https?://[^)]+?)\)          # [text](url)
-    | \*\*([^*]+?)\*\*                         # **bold**
-    | `([^`]+?)`                               # `code`
-    | (?<!\*)\*(?!\*)([^*]+?)(?<!\*)\*(?!\*)   # *italic* (single asterisks)
-    | (?<!_)_(?!_)([^_]+?)(?<!_)_(?!_)         # _italic_ (single underscores)
-    """,
-    re.VERBOSE,
-)
+def _sha256(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
 
 
-def _md_inline_to_reportlab_markup(text: str) -> str:
-    """
-    Convert a small subset of Markdown inline syntax to ReportLab Paragraph markup.
-    Supports: **bold**, *italic*, _italic_, `code`, [text](url)
-    """
-    # Preserve <br/> tags inserted by our paragraph joiner.
-    segments = text.split("<br/>")
-    rendered: List[str] = []
-
-    for seg in segments:
-        out: List[str] = []
-        last = 0
-        for m in _INLINE_RE.finditer(seg):
-            out.append(_escape_xml(seg[last : m.start()]))
-
-            link_text, link_url = m.group(1), m.group(2)
-            bold = m.group(3)
-            code = m.group(4)
-            italic_star = m.group(5)
-            italic_us = m.group(6)
-
-            if link_text is not None and link_url is not None:
-                out.append(
-                    f'<link href="{_escape_xml(link_url)}">{_escape_xml(link_text)}</link>'
-                )
-            elif bold is not None:
-                out.append(f"<b>{_escape_xml(bold)}</b>")
-            elif code is not None:
-                out.append(f'<font face="Courier">{_escape_xml(code)}</font>')
-            elif italic_star is not None:
-                out.append(f"<i>{_escape_xml(italic_star)}</i>")
-            elif italic_us is not None:
-                out.append(f"<i>{_escape_xml(italic_us)}</i>")
-            else:
-                out.append(_escape_xml(m.group(0)))
-
-            last = m.end()
-
-        out.append(_escape_xml(seg[last:]))
-        rendered.append("".join(out))
-
-    return "<br/>".join(rendered)
-
-
-def _to_blocks(lines: Iterable[str]) -> List[Block]:
-    blocks: List[Block] = []
-    cur_kind: Optional[str] = None
-    cur_lines: List[str] = []
-
-    def flush():
-        nonlocal cur_kind, cur_lines
-        if cur_kind is not None:
-            blocks.append(Block(cur_kind, cur_lines))
-        cur_kind = None
-        cur_lines = []
-
-    for raw in lines:
-        line = raw.rstrip()
-        # IMPORTANT: do NOT rstrip() here; Markdown hard-breaks depend on trailing spaces.
-        line = raw
-
-        if line.strip() == "":
-            flush()
-            blocks.append(Block("blank", []))
-            continue
+_style_hash: Optional[str] = None
 
-        if line.strip() == "---":
-            flush()
-            blocks.append(Block("hr", []))
-            continue
 
-        if line.startswith("# "):
-            flush()
-            blocks.append(Block("h1", [line[2:].strip()]))
-            continue
+def style_hash() -> str:
+    """Hash of everything besides the Markdown that shapes the output."""
+    global _style_hash
+    if _style_hash is None:
+        footer = {name: getattr(pdf_export, name) for name in dir(pdf_export) if name.startswith("FOOTER_")}
+        spec = {
+            "renderer": RENDERER_VERSION,
+            "styles": pdf_export.MARKDOWN_STYLES,
+            "margins": pdf_export.MARKDOWN_MARGINS,
+            "footer": footer,
+        }
+        _style_hash = _sha256(json.dumps(spec, sort_keys=True).encode("utf-8"))
+    return _style_hash
 
-        if line.startswith("## "):
-            flush()
-            blocks.append(Block("h2", [line[3:].strip()]))
-            continue
 
-        if line.startswith("### "):
-            flush()
-            blocks.append(Block("h3", [line[4:].strip()]))
-            continue
+def _block_key(block: markdown_parser.Block) -> str:
+    return _sha256(json.dumps([block.kind, block.lines]).encode("utf-8"))
 
-        if line.startswith("- "):
-        if line.rstrip().startswith("- "):
-            if cur_kind not in (None, "ul"):
-                flush()
-            cur_kind = "ul"
-            cur_lines.append(line[2:].strip())
-            cur_lines.append(line.rstrip()[2:].strip())
-            continue
 
-        # Normal paragraph line (also allows simple hard line breaks)
-        if cur_kind not in (None, "p"):
-            flush()
-        cur_kind = "p"
-        cur_lines.append(line)
-
-    flush()
-    return blocks
-
-
-def build_pdf(md_path: Path, pdf_path: Path) -> None:
-    from reportlab.lib.pagesizes import letter
-    from reportlab.lib.units import inch
-    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-    from reportlab.platypus import (
-        SimpleDocTemplate,
-        Paragraph,
-        Spacer,
-        ListFlowable,
-        ListItem,
-        PageBreak,
-    )
+def _load_cache(path: Path) -> dict:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
 
-    styles = getSampleStyleSheet()
-    title = ParagraphStyle(
-        "NotexioTitle",
-        parent=styles["Title"],
-        fontName="Helvetica-Bold",
-        fontSize=20,
-        leading=24,
-        spaceAfter=12,
-    )
-    h2 = ParagraphStyle(
-        "NotexioH2",
-        parent=styles["Heading2"],
-        fontName="Helvetica-Bold",
-        fontSize=13,
-        leading=16,
-        spaceBefore=10,
-        spaceAfter=6,
-    )
-    h3 = ParagraphStyle(
-        "NotexioH3",
-        parent=styles["Heading3"],
-        fontName="Helvetica-Bold",
-        fontSize=11,
-        leading=14,
-        spaceBefore=8,
-        spaceAfter=4,
-    )
-    body = ParagraphStyle(
-        "NotexioBody",
-        parent=styles["BodyText"],
-        fontName="Helvetica",
-        fontSize=10.5,
-        leading=14,
-        spaceAfter=6,
-    )
-    small = ParagraphStyle(
-        "NotexioSmall",
-        parent=styles["BodyText"],
-        fontName="Helvetica",
-        fontSize=9.5,
-        leading=12,
-        spaceAfter=4,
-        textColor="#333333",
-    )
 
-    def footer(canvas, doc):
-        canvas.saveState()
-        canvas.setFont("Helvetica", 9)
-        canvas.setFillGray(0.35)
-        canvas.drawRightString(doc.pagesize[0] - 0.75 * inch, 0.6 * inch, f"Page {doc.page}")
-        canvas.restoreState()
+def _save_cache(path: Path, cache: dict) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.with_suffix(".tmp")
+    with open(temp_path, "w", encoding="utf-8") as f:
+        json.dump(cache, f, separators=(",", ":"))
+    os.replace(temp_path, path)
 
-    pdf_path.parent.mkdir(parents=True, exist_ok=True)
-    doc = SimpleDocTemplate(
-        str(pdf_path),
-        pagesize=letter,
-        leftMargin=0.85 * inch,
-        rightMargin=0.85 * inch,
-        topMargin=0.85 * inch,
-        bottomMargin=0.9 * inch,
-        title="Notexio — CSE323 Project Report",
-        author="Notexio",
-    )
 
-    blocks = _to_blocks(_read_md(md_path))
-    story = []
+def build_pdf(md_path: Path, pdf_path: Path, cache_dir: Optional[Path] = CACHE_DIR, force: bool = False) -> bool:
+    """
+    Build pdf_path from md_path. Returns False (and writes nothing) when the
+    Markdown and the styles are unchanged since the last build of pdf_path.
 
-    for b in blocks:
-        if b.kind == "blank":
-            story.append(Spacer(1, 0.12 * inch))
-            continue
-        if b.kind == "hr":
-            story.append(Spacer(1, 0.12 * inch))
-            story.append(Paragraph(_escape_xml("—" * 64), small))
-            story.append(Spacer(1, 0.12 * inch))
-            continue
-        if b.kind == "h1":
-            story.append(Paragraph(_escape_xml(b.lines[0]), title))
-            continue
-        if b.kind == "h2":
-            story.append(Paragraph(_escape_xml(b.lines[0]), h2))
-            continue
-        if b.kind == "h3":
-            story.append(Paragraph(_escape_xml(b.lines[0]), h3))
-            continue
-        if b.kind == "p":
-            # Markdown "two spaces then newline" line breaks are already in report.md;
-            # we convert them into <br/> for Paragraph.
-            joined = " ".join([ln.strip() for ln in b.lines]).strip()
-            # Preserve explicit Markdown hard-breaks "  " by turning trailing double-space into <br/>
-            # (We keep it simple: if a line ends with two spaces, treat it as a break.)
-            rebuilt_parts: List[str] = []
-            # Preserve Markdown hard-breaks: lines ending with "  " should render as a new line.
-            parts: List[str] = []
-            for ln in b.lines:
-                if ln.endswith("  "):
-                    rebuilt_parts.append(ln.rstrip() + "<br/>")
-                else:
-                    rebuilt_parts.append(ln)
-            joined = " ".join([p.strip() for p in rebuilt_parts]).strip()
-            story.append(Paragraph(_escape_xml(joined).replace("&lt;br/&gt;", "<br/>"), body))
-                hard_break = ln.endswith("  ")
-                parts.append(ln.rstrip())
-                parts.append("<br/>" if hard_break else " ")
-            joined = "".join(parts).strip()
-
-            story.append(Paragraph(_md_inline_to_reportlab_markup(joined), body))
-            continue
-        if b.kind == "ul":
-            items = [
-                ListItem(Paragraph(_escape_xml(item), body), leftIndent=12)
-                ListItem(Paragraph(_md_inline_to_reportlab_markup(item), body), leftIndent=12)
-                for item in b.lines
-            ]
-            story.append(
-                ListFlowable(
-                    items,
-                    bulletType="bullet",
-                    start="bullet",
-                    leftIndent=18,
-                    bulletFontName="Helvetica",
-                    bulletFontSize=9,
-                    bulletOffsetY=2,
-                )
-            )
-            story.append(Spacer(1, 0.06 * inch))
+    Converted markup is cached per block in cache_dir, so after an edit only
+    the changed blocks go through the inline converter. cache_dir=None
+    disables both caches.
+    """
+    md_bytes = md_path.read_bytes()
+    md_hash = _sha256(md_bytes)
+    cache_path = cache_dir / f"{_sha256(str(md_path.resolve()).encode('utf-8'))[:16]}.json" if cache_dir else None
+    cache = _load_cache(cache_path) if cache_path else {}
+
+    up_to_date = (
+        cache.get("md_hash") == md_hash
+        and cache.get("style_hash") == style_hash()
+        and cache.get("pdf") == str(pdf_path.resolve())
+        and pdf_path.exists()
+        and pdf_path.stat().st_size == cache.get("pdf_size")
+    )
+    if up_to_date and not force:
+        return False
+
+    blocks = list(markdown_parser.iter_blocks(_split_lines(md_bytes.decode("utf-8"))))
+    cached_markup = cache.get("blocks", {}) if cache.get("renderer") == RENDERER_VERSION else {}
+    used_markup = {}
+    markup = []
+    for block in blocks:
+        if block.kind in ("blank", "hr"):
+            markup.append((block.kind, None))
             continue
-
-    doc.build(story, onFirstPage=footer, onLaterPages=footer)
-
-
-def main() -> None:
-    repo_root = Path(__file__).resolve().parents[1]
-    md_path = repo_root / "docs" / "report.md"
-    pdf_path = repo_root / "docs" / "Notexio_CSE323_Report.pdf"
-
-    if not md_path.exists():
-        raise SystemExit(f"Missing input: {md_path}")
-
-    build_pdf(md_path, pdf_path)
-    print(f"Generated: {pdf_path}")
+        key = _block_key(block)
+        if key in cached_markup:
+            block_markup = cached_markup[key]
+        else:
+            block_markup = markdown_parser.block_markup(block)
+        used_markup[key] = block_markup
+        markup.append((block.kind, block_markup))
+
+    title = next((markdown_parser.heading_text(block) for block in blocks if block.kind == "h1"), md_path.stem)
+    pdf_path.parent.mkdir(parents=True, exist_ok=True)
+    pdf_export.render_markdown_pdf(markup, str(pdf_path), title)
+
+    if cache_path:
+        # Only the blocks of this version are kept, so the cache does not grow
+        _save_cache(cache_path, {
+            "md_hash": md_hash,
+            "style_hash": style_hash(),
+            "renderer": RENDERER_VERSION,
+            "pdf": str(pdf_path.resolve()),
+            "pdf_size": pdf_path.stat().st_size,
+            "blocks": used_markup,
+        })
+    return True
+
+
+def _output_for(md_path: Path) -> Path:
+    if md_path.resolve() == DEFAULT_INPUT.resolve():
+        return DEFAULT_OUTPUT
+    return md_path.with_suffix(".pdf")
+
+
+def build_all(targets: List[Tuple[Path, Path]], force: bool = False, jobs: int = 0) -> int:
+    """Build (markdown, pdf) pairs, in parallel when there are several. Returns the number of failures."""
+    failures = 0
+
+    def report(md_path: Path, pdf_path: Path, outcome) -> None:
+        nonlocal failures
+        if isinstance(outcome, Exception):
+            failures += 1
+            print(f"Failed: {md_path}: {outcome}", file=sys.stderr)
+        else:
+            print(f"{'Generated' if outcome else 'Up to date'}: {pdf_path}")
+
+    if len(targets) == 1 or jobs == 1:
+        for md_path, pdf_path in targets:
+            try:
+                outcome = build_pdf(md_path, pdf_path, force=force)
+            except Exception as e:
+                outcome = e
+            report(md_path, pdf_path, outcome)
+        return failures
+
+    with ProcessPoolExecutor(max_workers=jobs or None) as pool:
+        futures = {pool.submit(build_pdf, md_path, pdf_path, force=force): (md_path, pdf_path)
+                   for md_path, pdf_path in targets}
+        for future in as_completed(futures):
+            try:
+                outcome = future.result()
+            except Exception as e:
+                outcome = e
+            report(*futures[future], outcome)
+    return failures
+
+
+def watch(targets: List[Tuple[Path, Path]], debounce: float, jobs: int = 0) -> None:
+    """Rebuild an input after it changes, once it has been quiet for `debounce` seconds."""
+
+    def stamp(path: Path) -> Optional[int]:
+        try:
+            return path.stat().st_mtime_ns
+        except OSError:
+            return None
+
+    outputs = dict(targets)
+    stamps = {md_path: stamp(md_path) for md_path in outputs}
+    changed_at = {}
+    print(f"Watching {len(outputs)} file(s); press Ctrl+C to stop.")
+    try:
+        while True:
+            time.sleep(WATCH_POLL_INTERVAL)
+            now = time.monotonic()
+            for md_path in outputs:
+                current = stamp(md_path)
+                if current != stamps[md_path]:
+                    # Every further save restarts the quiet period
+                    stamps[md_path] = current
+                    changed_at[md_path] = now
+            ready = [md_path for md_path, when in changed_at.items() if now - when >= debounce]
+            for md_path in ready:
+                del changed_at[md_path]
+            ready = [md_path for md_path in ready if stamps[md_path] is not None]
+            if ready:
+                build_all([(md_path, outputs[md_path]) for md_path in ready], jobs=jobs)
+    except KeyboardInterrupt:
+        pass
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Generate PDFs from Markdown reports.")
+    parser.add_argument("inputs", nargs="*", type=Path, metavar="MARKDOWN",
+                        help=f"Markdown files to build (default: {DEFAULT_INPUT.relative_to(REPO_ROOT)})")
+    parser.add_argument("-o", "--output", type=Path,
+                        help="PDF to write, for a single input (default: next to the input)")
+    parser.add_argument("-f", "--force", action="store_true", help="rebuild even when nothing changed")
+    parser.add_argument("-w", "--watch", action="store_true", help="keep running and rebuild on changes")
+    parser.add_argument("--debounce", type=float, default=0.5,
+                        help="seconds an input must be unchanged before a watch rebuild (default: 0.5)")
+    parser.add_argument("-j", "--jobs", type=int, default=0,
+                        help="inputs built in parallel (default: CPU count)")
+    args = parser.parse_args(argv)
+
+    inputs = args.inputs or [DEFAULT_INPUT]
+    if args.output and len(inputs) > 1:
+        parser.error("--output needs a single input")
+    for md_path in inputs:
+        if not md_path.exists():
+            raise SystemExit(f"Missing input: {md_path}")
+    targets = [(md_path, args.output or _output_for(md_path)) for md_path in inputs]
+
+    failures = build_all(targets, force=args.force, jobs=args.jobs)
+    if args.watch:
+        watch(targets, args.debounce, args.jobs)
+    elif failures:
+        raise SystemExit(1)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,226 @@
+"""
+Word completion for Notexio text editor.
+"""
+import re
+import tkinter as tk
+
+from src.word_index import PrefixIndex, completion_words
+
+
+_PREFIX_RE = re.compile(r'\w+$')
+
+
+class AutoComplete:
+    """Completion popup fed by the words of all open documents.
+
+    The prefix index is seeded once from the loaded documents and then kept
+    up to date from the edit deltas reported by the editor, so typing only
+    re-indexes the lines it touches. While completion is off, and for a log
+    being followed, documents are dropped from the index and indexed again
+    the next time completions are needed.
+    """
+
+    MAX_ITEMS = 8
+
+    def __init__(self, editor, settings_manager):
+        self.editor = editor
+        self.settings_manager = settings_manager
+        self.index = PrefixIndex()
+        self.document_words = {}  # text widget -> Counter of its indexed words, None if not indexed
+        self.popup = None
+        self.listbox = None
+        self.popup_widget = None
+        self.prefix = ""
+        self.enabled = settings_manager.get_setting("autocomplete", True)
+
+        self.editor.add_text_delta_listener(self.on_text_delta)
+        self.editor.add_text_widget_callback(self.bind_text_widget)
+
+    @property
+    def min_prefix(self):
+        return self.settings_manager.get_setting("autocomplete_min_prefix", 3)
+
+    def toggle(self):
+        """Turn completion on or off."""
+        self.enabled = not self.enabled
+        self.settings_manager.set_setting("autocomplete", self.enabled)
+        if not self.enabled:
+            self.hide()
+            for text_widget in self.document_words:
+                self.drop_document(text_widget)
+
+    def bind_text_widget(self, text_widget):
+        """Index a document and handle completion keys in it."""
+        # A peer (split view) shows a document that is already indexed
+        if self.editor.document_widget(text_widget) is text_widget:
+            self.document_words[text_widget] = None
+            if self.enabled:
+                self.index_document(text_widget)
+        text_widget.bind("<Key>", self.on_key, add="+")
+        text_widget.bind("<FocusOut>", lambda e: self.hide(), add="+")
+        text_widget.bind("<Button-1>", lambda e: self.hide(), add="+")
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            text_widget.bind(sequence, lambda e: self.hide(), add="+")
+        text_widget.bind("<Destroy>", self.on_destroy, add="+")
+
+    def index_document(self, text_widget):
+        words = completion_words(text_widget.get(1.0, tk.END + "-1c"))
+        self.document_words[text_widget] = words
+        self.index.add(words)
+
+    def drop_document(self, text_widget):
+        """Remove a document's words from the index until it is indexed again."""
+        words = self.document_words.get(text_widget)
+        if words is not None:
+            self.index.remove(+words)
+            self.document_words[text_widget] = None
+
+    def followed_document(self):
+        """The document a log is being followed into, if any."""
+        log_follower = getattr(self.editor, 'log_follower', None)
+        if log_follower and log_follower.is_following and log_follower.text_widget:
+            return self.editor.document_widget(log_follower.text_widget)
+        return None
+
+    def on_text_delta(self, text_widget, first_line, old_text, new_text):
+        """Re-index only the lines an edit touched."""
+        text_widget = self.editor.document_widget(text_widget)
+        words = self.document_words.get(text_widget)
+        if words is None:
+            return
+        if text_widget is self.followed_document():
+            # Appended log chunks can be megabytes; index the document when it is needed
+            self.drop_document(text_widget)
+            return
+        old_words = completion_words(old_text)
+        new_words = completion_words(new_text)
+        removed = old_words - new_words
+        added = new_words - old_words
+        if removed:
+            self.index.remove(removed)
+            words.subtract(removed)
+        if added:
+            self.index.add(added)
+            words.update(added)
+
+    def on_destroy(self, event):
+        """Drop the words of a closed (or hibernated) document."""
+        words = self.document_words.pop(event.widget, None)
+        if words is not None:
+            self.index.remove(+words)
+        if event.widget is self.popup_widget:
+            self.hide()
+
+    def on_key(self, event):
+        """Navigate the popup, or update it after a word character is typed."""
+        if self.popup is not None:
+            if event.keysym in ("Down", "Up"):
+                self.move_selection(1 if event.keysym == "Down" else -1)
+                return "break"
+            if event.keysym in ("Tab", "Return", "KP_Enter"):
+                self.accept()
+                return "break"
+            if event.keysym == "Escape":
+                self.hide()
+                return "break"
+
+        if not self.enabled:
+            return
+        if (event.char and (event.char.isalnum() or event.char == "_")) or \
+                (event.keysym == "BackSpace" and self.popup is not None):
+            # Runs once the class binding has inserted (or deleted) the character
+            event.widget.after_idle(self.update_popup, event.widget)
+        elif self.popup is not None:
+            self.hide()
+
+    def update_popup(self, text_widget):
+        """Show completions for the word before the cursor."""
+        if not text_widget.winfo_exists() or text_widget is not self.editor.text_widget:
+            return
+        match = _PREFIX_RE.search(text_widget.get("insert linestart", tk.INSERT))
+        # Only complete at the end of a word
+        if match is None or len(match.group()) < self.min_prefix or \
+                text_widget.get(tk.INSERT).isalnum():
+            self.hide()
+            return
+
+        self.prefix = match.group()
+        followed = self.followed_document()
+        for document, words in list(self.document_words.items()):
+            if words is None and document is not followed:
+                self.index_document(document)
+        completions = self.index.complete(self.prefix, self.MAX_ITEMS)
+        if not completions:
+            self.hide()
+            return
+        self.show(text_widget, completions)
+
+    def show(self, text_widget, completions):
+        """Place the popup under the cursor and fill it."""
+        bbox = text_widget.bbox(tk.INSERT)
+        if bbox is None:
+            self.hide()
+            return
+        x, y, _, height = bbox
+
+        if self.popup is None or self.popup_widget is not text_widget:
+            self.hide()
+            self.popup = tk.Toplevel(text_widget)
+            self.popup.wm_overrideredirect(True)
+            self.listbox = tk.Listbox(
+                self.popup,
+                activestyle=tk.NONE,
+                exportselection=False,
+                font=text_widget.cget("font"),
+                borderwidth=1,
+                relief=tk.SOLID,
+                highlightthickness=0
+            )
+            self.listbox.pack(fill=tk.BOTH, expand=True)
+            self.listbox.bind("<ButtonPress-1>", self.on_listbox_click)
+            self.popup_widget = text_widget
+
+        self.listbox.delete(0, tk.END)
+        self.listbox.insert(tk.END, *completions)
+        self.listbox.config(height=len(completions), width=max(len(word) for word in completions) + 2)
+        self.listbox.selection_set(0)
+        self.popup.wm_geometry(f"+{text_widget.winfo_rootx() + x}+{text_widget.winfo_rooty() + y + height}")
+
+    def on_listbox_click(self, event):
+        """Accept the clicked completion before the text widget loses focus."""
+        self.listbox.selection_clear(0, tk.END)
+        self.listbox.selection_set(self.listbox.nearest(event.y))
+        self.accept()
+        return "break"
+
+    def move_selection(self, step):
+        """Move the highlighted completion."""
+        selection = self.listbox.curselection()
+        current = selection[0] if selection else 0
+        new = (current + step) % self.listbox.size()
+        self.listbox.selection_clear(0, tk.END)
+        self.listbox.selection_set(new)
+        self.listbox.see(new)
+
+    def accept(self):
+        """Replace the typed prefix with the highlighted completion."""
+        selection = self.listbox.curselection()
+        text_widget = self.popup_widget
+        if not selection or text_widget is None:
+            self.hide()
+            return
+        word = self.listbox.get(selection[0])
+        self.hide()
+        text_widget.edit_separator()
+        text_widget.delete(f"insert - {len(self.prefix)} chars", tk.INSERT)
+        text_widget.insert(tk.INSERT, word)
+        text_widget.edit_separator()
+        self.index.touch(word)
+
+    def hide(self):
+        """Close the popup."""
+        if self.popup is not None:
+            self.popup.destroy()
+        self.popup = None
+        self.listbox = None
+        self.popup_widget = None
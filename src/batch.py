@@ -0,0 +1,288 @@
+"""
+Tk-free parallel batch processing for Notexio text editor.
+
+Applies one operation (statistics, extra-space cleanup, find/replace or PDF
+export) to many files using a process pool. Files are submitted in chunks so
+the pool stays busy without queueing one future per file, and results are
+streamed to a CSV or JSONL report as they arrive.
+"""
+import csv
+import glob
+import json
+import os
+import re
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+
+from src import text_operations
+from src.file_io import read_text_file, replacement_mode
+
+
+OPERATIONS = ("stats", "remove-spaces", "replace", "export-pdf")
+
+REPORT_FIELDS = ("file", "status", "changed", "replacements", "words", "characters",
+                 "lines", "output", "error", "seconds")
+
+# Files batch operations write; a directory expands to everything but these
+GENERATED_EXTENSIONS = (".pdf",)
+
+_GLOB_MAGIC_RE = re.compile(r"[*?[]")
+
+
+def _pattern_root(pattern):
+    """Directory a glob pattern starts from: notes/**/*.txt -> notes"""
+    match = _GLOB_MAGIC_RE.search(pattern)
+    # Without wildcards the pattern is a single file
+    return os.path.dirname(pattern[:match.start()] if match else pattern)
+
+
+def expand_patterns(patterns, recursive=True):
+    """Files matching the glob patterns, as (path, path relative to its pattern's root).
+
+    Directories expand to all the files below them except generated ones
+    (GENERATED_EXTENSIONS). The whole list is collected before any file is
+    written, so a run never picks up its own output.
+    """
+    inputs = []
+    seen = set()
+    for pattern in patterns:
+        skip = ()
+        if os.path.isdir(pattern):
+            root = pattern
+            pattern = os.path.join(pattern, "**", "*")
+            skip = GENERATED_EXTENSIONS
+        else:
+            root = _pattern_root(pattern)
+        for path in glob.iglob(pattern, recursive=recursive):
+            if os.path.isfile(path) and path not in seen and not path.lower().endswith(skip):
+                seen.add(path)
+                inputs.append((path, os.path.relpath(path, root or os.curdir)))
+    return inputs
+
+
+def _output_path(path, output_dir, extension=None, relative=None):
+    """Where the result for path is written: next to it, or at its relative path in output_dir."""
+    if output_dir:
+        path = os.path.join(output_dir, relative or os.path.basename(path))
+    if extension:
+        path = os.path.splitext(path)[0] + extension
+    return path
+
+
+def _target(path, relative, operation, output_dir):
+    """File the operation may write for path, or None when it writes nothing new."""
+    if operation == "export-pdf":
+        return _output_path(path, output_dir, ".pdf", relative)
+    if operation in ("remove-spaces", "replace") and output_dir:
+        return _output_path(path, output_dir, relative=relative)
+    return None
+
+
+def _write_atomic(path, content, encoding):
+    """Write content via a temporary file so an interrupted run never truncates a note."""
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, temp_path = tempfile.mkstemp(dir=directory, prefix=".notexio-", suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'w', encoding=encoding) as f:
+            f.write(content)
+        # mkstemp creates the file private to its owner
+        os.chmod(temp_path, replacement_mode(path))
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+        raise
+
+
+def process_file(path, operation, options, dry_run=False, relative=None):
+    """Apply operation to one file and return its report row.
+
+    relative is the file's path below its pattern's root, mirrored in output_dir.
+    """
+    started = time.perf_counter()
+    result = {"file": path, "status": "ok"}
+    encoding = options.get("encoding", "utf-8")
+    output_dir = options.get("output_dir")
+    try:
+        content = read_text_file(path, encoding)
+
+        if operation == "stats":
+            stats = text_operations.document_statistics(content)
+            result.update(words=stats["words"], characters=stats["characters"],
+                          lines=stats["lines"])
+
+        elif operation in ("remove-spaces", "replace"):
+            if operation == "remove-spaces":
+                content_new = text_operations.remove_extra_spaces(content)
+            else:
+                content_new, count = text_operations.replace_all(
+                    content, options["find"], options.get("replace", ""),
+                    case_sensitive=options.get("case_sensitive", False)
+                )
+                result["replacements"] = count
+            result["changed"] = content_new != content
+            if result["changed"] or output_dir:
+                result["output"] = _output_path(path, output_dir, relative=relative)
+                if not dry_run:
+                    os.makedirs(os.path.dirname(os.path.abspath(result["output"])), exist_ok=True)
+                    _write_atomic(result["output"], content_new, encoding)
+
+        elif operation == "export-pdf":
+            result["output"] = _output_path(path, output_dir, ".pdf", relative)
+            if not dry_run:
+                os.makedirs(os.path.dirname(os.path.abspath(result["output"])), exist_ok=True)
+                from src.markdown_parser import is_markdown_file
+                from src.pdf_export import export_markdown_to_pdf, export_text_to_pdf
+                if is_markdown_file(path):
+                    title = os.path.splitext(os.path.basename(path))[0]
+                    export_markdown_to_pdf(content, result["output"], title)
+                else:
+                    export_text_to_pdf(content, result["output"])
+
+        else:
+            raise ValueError(f"unknown operation: {operation}")
+
+    except Exception as e:
+        result["status"] = "error"
+        result["error"] = f"{type(e).__name__}: {e}"
+
+    if dry_run and result["status"] == "ok":
+        result["status"] = "dry-run"
+    result["seconds"] = round(time.perf_counter() - started, 4)
+    return result
+
+
+def process_chunk(inputs, operation, options, dry_run=False):
+    """Process a chunk of (path, relative) inputs in one worker call (amortises pickling overhead)."""
+    return [process_file(path, operation, options, dry_run, relative) for path, relative in inputs]
+
+
+def _chunks(inputs, chunk_size, operation, output_dir, rejected):
+    """Split inputs into lists of at most chunk_size (path, relative) pairs.
+
+    Plain paths are accepted too (their output name is their file name). An
+    input whose output would overwrite an earlier input's output is left out
+    and its error row appended to rejected.
+    """
+    targets = {}
+    chunk = []
+    for item in inputs:
+        path, relative = (item, os.path.basename(item)) if isinstance(item, str) else item
+        target = _target(path, relative, operation, output_dir)
+        if target is not None:
+            key = os.path.normcase(os.path.abspath(target))
+            if key in targets:
+                rejected.append({
+                    "file": path, "status": "error", "output": target,
+                    "error": f"output is also the output of {targets[key]}", "seconds": 0,
+                })
+                continue
+            targets[key] = path
+        chunk.append((path, relative))
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def run_batch(paths, operation, options=None, workers=None, chunk_size=64,
+              dry_run=False, cancel_event=None, mp_context=None):
+    """Process paths in parallel, yielding one result dict per file as it completes.
+
+    paths are file paths or (path, relative) pairs from expand_patterns. At
+    most two chunks per worker are in flight, so memory stays flat even for
+    hundreds of thousands of files. With workers=1 everything runs in-process.
+    Files that would overwrite another file's output are reported as errors.
+    """
+    if operation not in OPERATIONS:
+        raise ValueError(f"unknown operation: {operation}")
+    options = dict(options or {})
+    if operation == "replace" and not options.get("find"):
+        raise ValueError("replace needs a search string")
+    if options.get("output_dir") and not dry_run:
+        os.makedirs(options["output_dir"], exist_ok=True)
+
+    workers = workers or os.cpu_count() or 1
+    rejected = []
+    chunks = _chunks(paths, chunk_size, operation, options.get("output_dir"), rejected)
+
+    if workers == 1:
+        for chunk in chunks:
+            yield from rejected
+            rejected.clear()
+            if cancel_event is not None and cancel_event.is_set():
+                return
+            yield from process_chunk(chunk, operation, options, dry_run)
+        yield from rejected
+        return
+
+    with ProcessPoolExecutor(max_workers=workers, mp_context=mp_context) as pool:
+        pending = set()
+        try:
+            while True:
+                cancelled = cancel_event is not None and cancel_event.is_set()
+                # Keep the pool fed without submitting everything up front
+                while not cancelled and len(pending) < workers * 2:
+                    chunk = next(chunks, None)
+                    if chunk is None:
+                        break
+                    pending.add(pool.submit(process_chunk, chunk, operation, options, dry_run))
+                yield from rejected
+                rejected.clear()
+                if not pending:
+                    return
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield from future.result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+class ReportWriter:
+    """Streams batch results to a CSV or JSONL report, one row per file."""
+
+    def __init__(self, path, report_format=None):
+        if report_format is None:
+            report_format = "jsonl" if path.lower().endswith((".jsonl", ".json")) else "csv"
+        self.format = report_format
+        self.file = open(path, 'w', encoding='utf-8', newline='')
+        self.writer = None
+        if self.format == "csv":
+            self.writer = csv.DictWriter(self.file, fieldnames=REPORT_FIELDS, extrasaction="ignore")
+            self.writer.writeheader()
+
+    def write(self, result):
+        """Append one result row."""
+        if self.writer is not None:
+            self.writer.writerow(result)
+        else:
+            self.file.write(json.dumps(result) + "\n")
+
+    def close(self):
+        """Flush and close the report."""
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def new_summary():
+    """Empty per-status counters for tally()."""
+    return {"files": 0, "ok": 0, "dry-run": 0, "error": 0, "changed": 0}
+
+
+def tally(summary, result):
+    """Add one result to the counters from new_summary()."""
+    summary["files"] += 1
+    summary[result["status"]] = summary.get(result["status"], 0) + 1
+    if result.get("changed"):
+        summary["changed"] += 1
+    return summary
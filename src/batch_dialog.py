@@ -0,0 +1,228 @@
+"""
+Batch processing dialog for Notexio text editor.
+"""
+import multiprocessing
+import os
+import queue
+import threading
+import tkinter as tk
+from tkinter import filedialog, messagebox, ttk
+
+from src import batch
+
+
+class BatchDialog:
+    """Runs a batch operation over many files without blocking the editor."""
+
+    OPERATION_LABELS = {
+        "Statistics": "stats",
+        "Remove Extra Spaces": "remove-spaces",
+        "Find and Replace": "replace",
+        "Export as PDF": "export-pdf",
+    }
+
+    def __init__(self, editor):
+        self.editor = editor
+        self.dialog = None
+        self.thread = None
+        self.cancel_event = threading.Event()
+        self.results = queue.Queue()
+        self.summary = None
+
+    def show(self):
+        """Show the dialog (or raise it if it is already open)."""
+        if self.dialog is not None and self.dialog.winfo_exists():
+            self.dialog.lift()
+            return
+
+        self.dialog = tk.Toplevel(self.editor.root)
+        self.dialog.title("Batch Processing")
+        self.dialog.geometry("520x460")
+        self.dialog.transient(self.editor.root)
+        self.dialog.protocol("WM_DELETE_WINDOW", self.close)
+
+        form = tk.Frame(self.dialog)
+        form.pack(fill=tk.X, padx=10, pady=10)
+        form.columnconfigure(1, weight=1)
+
+        # Files
+        tk.Label(form, text="Folder:").grid(row=0, column=0, sticky=tk.W, pady=2)
+        self.folder_var = tk.StringVar(value=os.path.dirname(self.editor.current_file or "") or os.getcwd())
+        tk.Entry(form, textvariable=self.folder_var).grid(row=0, column=1, sticky=tk.EW, pady=2)
+        tk.Button(form, text="Browse...", command=self.browse_folder).grid(row=0, column=2, padx=5)
+
+        tk.Label(form, text="Pattern:").grid(row=1, column=0, sticky=tk.W, pady=2)
+        self.pattern_var = tk.StringVar(value="**/*.txt")
+        tk.Entry(form, textvariable=self.pattern_var).grid(row=1, column=1, sticky=tk.EW, pady=2)
+
+        # Operation
+        tk.Label(form, text="Operation:").grid(row=2, column=0, sticky=tk.W, pady=2)
+        self.operation_var = tk.StringVar(value="Statistics")
+        ttk.Combobox(
+            form,
+            textvariable=self.operation_var,
+            values=list(self.OPERATION_LABELS),
+            state="readonly"
+        ).grid(row=2, column=1, sticky=tk.EW, pady=2)
+
+        tk.Label(form, text="Find:").grid(row=3, column=0, sticky=tk.W, pady=2)
+        self.find_entry = tk.Entry(form)
+        self.find_entry.grid(row=3, column=1, sticky=tk.EW, pady=2)
+
+        tk.Label(form, text="Replace with:").grid(row=4, column=0, sticky=tk.W, pady=2)
+        self.replace_entry = tk.Entry(form)
+        self.replace_entry.grid(row=4, column=1, sticky=tk.EW, pady=2)
+
+        tk.Label(form, text="Report:").grid(row=5, column=0, sticky=tk.W, pady=2)
+        self.report_var = tk.StringVar()
+        tk.Entry(form, textvariable=self.report_var).grid(row=5, column=1, sticky=tk.EW, pady=2)
+        tk.Button(form, text="Browse...", command=self.browse_report).grid(row=5, column=2, padx=5)
+
+        self.case_var = tk.BooleanVar()
+        tk.Checkbutton(form, text="Case sensitive", variable=self.case_var).grid(row=6, column=1, sticky=tk.W)
+        self.dry_run_var = tk.BooleanVar(value=True)
+        tk.Checkbutton(
+            form,
+            text="Dry run (report only, do not write files)",
+            variable=self.dry_run_var
+        ).grid(row=7, column=1, sticky=tk.W)
+
+        # Buttons
+        button_frame = tk.Frame(self.dialog)
+        button_frame.pack(pady=5)
+        self.run_button = tk.Button(button_frame, text="Run", command=self.run)
+        self.run_button.pack(side=tk.LEFT, padx=5)
+        self.cancel_button = tk.Button(button_frame, text="Cancel", command=self.cancel, state=tk.DISABLED)
+        self.cancel_button.pack(side=tk.LEFT, padx=5)
+        tk.Button(button_frame, text="Close", command=self.close).pack(side=tk.LEFT, padx=5)
+
+        # Progress and errors
+        self.progress_label = tk.Label(self.dialog, text="", anchor=tk.W)
+        self.progress_label.pack(fill=tk.X, padx=10)
+        self.log = tk.Listbox(self.dialog, height=8)
+        self.log.pack(fill=tk.BOTH, expand=True, padx=10, pady=(0, 10))
+        self.editor.theme_dialog(self.dialog)
+
+    def browse_folder(self):
+        """Choose the folder to process."""
+        folder = filedialog.askdirectory(parent=self.dialog, initialdir=self.folder_var.get())
+        if folder:
+            self.folder_var.set(folder)
+
+    def browse_report(self):
+        """Choose where to write the report."""
+        filepath = filedialog.asksaveasfilename(
+            parent=self.dialog,
+            defaultextension=".csv",
+            filetypes=[("CSV Files", "*.csv"), ("JSON Lines", "*.jsonl"), ("All Files", "*.*")]
+        )
+        if filepath:
+            self.report_var.set(filepath)
+
+    def run(self):
+        """Start the batch in a background thread."""
+        if self.thread is not None and self.thread.is_alive():
+            return
+
+        operation = self.OPERATION_LABELS[self.operation_var.get()]
+        options = {
+            "find": self.find_entry.get(),
+            "replace": self.replace_entry.get(),
+            "case_sensitive": self.case_var.get(),
+        }
+        if operation == "replace" and not options["find"]:
+            messagebox.showwarning("Batch Processing", "Enter the text to find.", parent=self.dialog)
+            return
+        if operation == "export-pdf" and not self.dry_run_var.get():
+            try:
+                import reportlab  # noqa: F401
+            except ImportError:
+                messagebox.showerror(
+                    "Error",
+                    "PDF export requires reportlab library.\nInstall it with: pip install reportlab",
+                    parent=self.dialog
+                )
+                return
+
+        pattern = os.path.join(self.folder_var.get(), self.pattern_var.get())
+        report_path = self.report_var.get().strip() or None
+
+        self.log.delete(0, tk.END)
+        # A fresh queue, so results of a run cancelled by closing the dialog are dropped
+        self.results = queue.Queue()
+        self.summary = batch.new_summary()
+        self.cancel_event.clear()
+        self.run_button.config(state=tk.DISABLED)
+        self.cancel_button.config(state=tk.NORMAL)
+        self.progress_label.config(text="Starting...")
+
+        self.thread = threading.Thread(
+            target=self._worker,
+            args=(self.results, pattern, operation, options, self.dry_run_var.get(), report_path),
+            daemon=True
+        )
+        self.thread.start()
+        self.dialog.after(100, self._poll)
+
+    def _worker(self, results, pattern, operation, options, dry_run, report_path):
+        """Run the batch and hand results to the Tk thread through a queue."""
+        report = None
+        try:
+            if report_path:
+                report = batch.ReportWriter(report_path)
+            # Spawned workers do not inherit the Tk interpreter or listener threads
+            context = multiprocessing.get_context("spawn")
+            for result in batch.run_batch(
+                batch.expand_patterns([pattern]), operation, options,
+                dry_run=dry_run, cancel_event=self.cancel_event, mp_context=context
+            ):
+                if report is not None:
+                    report.write(result)
+                results.put(result)
+        except Exception as e:
+            results.put({"file": "", "status": "error", "error": str(e)})
+        finally:
+            if report is not None:
+                report.close()
+            results.put(None)
+
+    def _poll(self):
+        """Show progress for the results received so far."""
+        if self.dialog is None or not self.dialog.winfo_exists():
+            return
+        finished = False
+        try:
+            while True:
+                result = self.results.get_nowait()
+                if result is None:
+                    finished = True
+                    break
+                batch.tally(self.summary, result)
+                if result["status"] == "error":
+                    self.log.insert(tk.END, f"{result['file']}: {result['error']}")
+        except queue.Empty:
+            pass
+
+        summary = self.summary
+        text = (f"{summary['files']:,} file(s) processed, {summary['changed']:,} changed, "
+                f"{summary['error']:,} error(s)")
+        if finished:
+            self.run_button.config(state=tk.NORMAL)
+            self.cancel_button.config(state=tk.DISABLED)
+            status = "Cancelled" if self.cancel_event.is_set() else "Done"
+            self.progress_label.config(text=f"{status}: {text}")
+        else:
+            self.progress_label.config(text=text)
+            self.dialog.after(100, self._poll)
+
+    def cancel(self):
+        """Stop submitting work; chunks already running are allowed to finish."""
+        self.cancel_event.set()
+        self.progress_label.config(text="Cancelling...")
+
+    def close(self):
+        """Cancel any running batch and close the dialog."""
+        self.cancel_event.set()
+        if self.dialog is not None:
+            self.dialog.destroy()
+            self.dialog = None
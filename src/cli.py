@@ -0,0 +1,255 @@
+"""
+Headless command line interface for Notexio text editor.
+
+Reuses the Tk-free engines, so it never imports tkinter and runs without a
+display:
+
+    notexio stats notes.txt
+    notexio replace foo bar notes.txt --in-place
+    notexio remove-spaces notes.txt -o clean.txt
+    notexio export-pdf notes.txt -o notes.pdf
+    notexio convert legacy.txt --from cp1252 --to utf-8 -o legacy-utf8.txt
+    notexio batch remove-spaces 'notes/**/*.txt' --report report.csv
+"""
+import argparse
+import json
+import os
+import sys
+
+from src import text_operations
+from src.file_io import read_text_file, write_text_file, convert_encoding
+
+
+def _write_output(args, source, content):
+    """Write a transformed document to --output, in place, or to stdout."""
+    if args.in_place:
+        if source == '-':
+            raise SystemExit("notexio: --in-place cannot be used with standard input")
+        write_text_file(source, content, args.encoding)
+    else:
+        write_text_file(args.output or '-', content, args.encoding)
+
+
+def cmd_stats(args):
+    """Print document statistics for each file."""
+    results = []
+    for filepath in args.files:
+        stats = text_operations.document_statistics(read_text_file(filepath, args.encoding))
+        stats["file"] = filepath
+        results.append(stats)
+
+    if args.json:
+        for stats in results:
+            print(json.dumps(stats))
+        return 0
+
+    for stats in results:
+        if len(results) > 1:
+            print(f"{stats['file']}:")
+        print(f"Words: {stats['words']:,}")
+        print(f"Characters (with spaces): {stats['characters']:,}")
+        print(f"Characters (without spaces): {stats['characters_no_spaces']:,}")
+        print(f"Lines: {stats['lines']:,}")
+        print(f"Reading time: {stats['reading_time']}")
+    return 0
+
+
+def cmd_readability(args):
+    """Print readability scores for each file."""
+    from src.text_analytics import ReadabilityIndex, format_readability
+
+    for filepath in args.files:
+        index = ReadabilityIndex()
+        index.update(read_text_file(filepath, args.encoding))
+        if args.json:
+            scores = index.scores()
+            scores["file"] = filepath
+            print(json.dumps(scores))
+            continue
+        if len(args.files) > 1:
+            print(f"{filepath}:")
+        print(format_readability(index.scores(), index.longest_sentences()))
+    return 0
+
+
+def cmd_duplicates(args):
+    """Print words that occur more than once, most frequent first."""
+    duplicates = text_operations.find_duplicate_words(
+        read_text_file(args.file, args.encoding),
+        min_length=args.min_length,
+        stop_words=text_operations.STOP_WORDS if args.skip_stop_words else frozenset()
+    )
+    ranked = sorted(duplicates.items(), key=lambda item: (-item[1], item[0]))
+    if args.top:
+        ranked = ranked[:args.top]
+    for word, count in ranked:
+        print(f"{count}\t{word}")
+    return 0
+
+
+def cmd_replace(args):
+    """Replace all occurrences of a string."""
+    content = read_text_file(args.file, args.encoding)
+    content_new, count = text_operations.replace_all(
+        content, args.find, args.replace, case_sensitive=args.case_sensitive
+    )
+    _write_output(args, args.file, content_new)
+    print(f"{count} replacement(s)", file=sys.stderr)
+    return 0
+
+
+def cmd_remove_spaces(args):
+    """Remove extra spaces."""
+    content = read_text_file(args.file, args.encoding)
+    _write_output(args, args.file, text_operations.remove_extra_spaces(content))
+    return 0
+
+
+def cmd_export_pdf(args):
+    """Export a text file as PDF (Markdown files are exported formatted)."""
+    from src.markdown_parser import is_markdown_file
+    from src.pdf_export import export_markdown_to_pdf, export_text_to_pdf
+    try:
+        content = read_text_file(args.file, args.encoding)
+        if is_markdown_file(args.file):
+            title = os.path.splitext(os.path.basename(args.file))[0]
+            export_markdown_to_pdf(content, args.output, title)
+        else:
+            export_text_to_pdf(content, args.output, workers=args.workers)
+    except ImportError:
+        print("notexio: PDF export requires reportlab (pip install reportlab)", file=sys.stderr)
+        return 1
+    return 0
+
+
+def cmd_convert(args):
+    """Convert a file between encodings."""
+    convert_encoding(args.file, args.output or '-', args.from_encoding, args.to_encoding, args.errors)
+    return 0
+
+
+def cmd_batch(args):
+    """Apply one operation to many files in parallel."""
+    from src import batch
+
+    options = {
+        "encoding": args.encoding,
+        "output_dir": args.output_dir,
+        "find": args.find,
+        "replace": args.replace,
+        "case_sensitive": args.case_sensitive,
+    }
+    paths = batch.expand_patterns(args.patterns)
+    summary = batch.new_summary()
+    report = batch.ReportWriter(args.report, args.report_format) if args.report else None
+    try:
+        for result in batch.run_batch(paths, args.operation, options, workers=args.workers,
+                                      chunk_size=args.chunk_size, dry_run=args.dry_run):
+            batch.tally(summary, result)
+            if report is not None:
+                report.write(result)
+            if result["status"] == "error":
+                print(f"{result['file']}: {result['error']}", file=sys.stderr)
+            elif args.verbose:
+                print(f"{result['file']}: {result['status']}", file=sys.stderr)
+    except ValueError as e:
+        print(f"notexio: {e}", file=sys.stderr)
+        return 2
+    finally:
+        if report is not None:
+            report.close()
+
+    print(f"{summary['files']} file(s): {summary['ok']} ok, {summary['dry-run']} dry-run, "
+          f"{summary['changed']} changed, {summary['error']} error(s)", file=sys.stderr)
+    return 1 if summary["error"] else 0
+
+
+def build_parser():
+    """Build the argument parser with one sub-command per operation."""
+    parser = argparse.ArgumentParser(prog="notexio", description="Notexio headless text tools")
+    parser.add_argument("--encoding", default="utf-8", help="text encoding of input files (default: utf-8)")
+    commands = parser.add_subparsers(dest="command", metavar="COMMAND")
+    commands.required = True
+
+    stats = commands.add_parser("stats", help="word, character and line counts")
+    stats.add_argument("files", nargs="+", metavar="FILE", help="files to analyse ('-' for stdin)")
+    stats.add_argument("--json", action="store_true", help="print one JSON object per file")
+    stats.set_defaults(func=cmd_stats)
+
+    readability = commands.add_parser("readability", help="Flesch, grade level and Gunning fog scores")
+    readability.add_argument("files", nargs="+", metavar="FILE", help="files to score ('-' for stdin)")
+    readability.add_argument("--json", action="store_true", help="print one JSON object per file")
+    readability.set_defaults(func=cmd_readability)
+
+    duplicates = commands.add_parser("duplicates", help="list duplicate words")
+    duplicates.add_argument("file", metavar="FILE")
+    duplicates.add_argument("--top", type=int, default=0, help="only show the N most frequent")
+    duplicates.add_argument("--min-length", type=int, default=1, help="ignore words shorter than this")
+    duplicates.add_argument("--skip-stop-words", action="store_true", help="ignore common words such as 'the' and 'a'")
+    duplicates.set_defaults(func=cmd_duplicates)
+
+    def add_output_options(command):
+        group = command.add_mutually_exclusive_group()
+        group.add_argument("-o", "--output", help="output file (default: stdout)")
+        group.add_argument("-i", "--in-place", action="store_true", help="overwrite the input file")
+
+    replace = commands.add_parser("replace", help="replace all occurrences of a string")
+    replace.add_argument("find")
+    replace.add_argument("replace")
+    replace.add_argument("file", metavar="FILE")
+    replace.add_argument("-c", "--case-sensitive", action="store_true")
+    add_output_options(replace)
+    replace.set_defaults(func=cmd_replace)
+
+    remove_spaces = commands.add_parser("remove-spaces", help="remove extra spaces")
+    remove_spaces.add_argument("file", metavar="FILE")
+    add_output_options(remove_spaces)
+    remove_spaces.set_defaults(func=cmd_remove_spaces)
+
+    export_pdf = commands.add_parser("export-pdf", help="export a text file as PDF")
+    export_pdf.add_argument("file", metavar="FILE")
+    export_pdf.add_argument("-o", "--output", required=True, help="PDF file to write")
+    export_pdf.add_argument("-j", "--workers", type=int, default=0,
+                            help="worker processes for large files (default: CPU count)")
+    export_pdf.set_defaults(func=cmd_export_pdf)
+
+    convert = commands.add_parser("convert", help="convert a file between text encodings")
+    convert.add_argument("file", metavar="FILE")
+    convert.add_argument("--from", dest="from_encoding", required=True)
+    convert.add_argument("--to", dest="to_encoding", required=True)
+    convert.add_argument("--errors", default="strict", choices=["strict", "replace", "ignore"])
+    convert.add_argument("-o", "--output", help="output file (default: stdout)")
+    convert.set_defaults(func=cmd_convert)
+
+    batch = commands.add_parser("batch", help="apply an operation to many files in parallel")
+    batch.add_argument("operation", choices=["stats", "remove-spaces", "replace", "export-pdf"])
+    batch.add_argument("patterns", nargs="+", metavar="PATTERN",
+                       help="files, directories or glob patterns ('**' recurses)")
+    batch.add_argument("--find", help="search string for the replace operation")
+    batch.add_argument("--replace", default="", help="replacement for the replace operation")
+    batch.add_argument("-c", "--case-sensitive", action="store_true")
+    batch.add_argument("--output-dir", help="write results here instead of next to the input files")
+    batch.add_argument("--report", help="stream per-file results to a CSV or JSONL file")
+    batch.add_argument("--report-format", choices=["csv", "jsonl"],
+                       help="report format (default: from the report file extension)")
+    batch.add_argument("-n", "--dry-run", action="store_true", help="report what would change without writing")
+    batch.add_argument("-j", "--workers", type=int, default=0, help="worker processes (default: CPU count)")
+    batch.add_argument("--chunk-size", type=int, default=64, help="files per task sent to a worker")
+    batch.add_argument("-v", "--verbose", action="store_true", help="print every processed file")
+    batch.set_defaults(func=cmd_batch)
+
+    return parser
+
+
+def main(argv=None):
+    """Entry point of the notexio command."""
+    args = build_parser().parse_args(argv)
+    try:
+        return args.func(args)
+    except (OSError, UnicodeError, LookupError) as e:
+        print(f"notexio: {e}", file=sys.stderr)
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,64 @@
+"""
+Chunked reading of a document for worker threads in Notexio text editor.
+"""
+import queue
+import tkinter as tk
+
+
+class DocumentReader:
+    """Hands the text of a document to a worker thread a few lines at a time.
+
+    The text widget is read on the Tk thread in after() callbacks, and only
+    MAX_PENDING chunks wait in the queue, so the document is never copied
+    whole. Iterate over the reader in the worker thread.
+    """
+
+    CHUNK_LINES = 2000
+    MAX_PENDING = 4
+    FEED_INTERVAL = 10  # ms between checks for room in the queue
+
+    def __init__(self, root, text_widget, cancel_event):
+        self.root = root
+        self.text_widget = text_widget
+        self.cancel_event = cancel_event
+        self.chunks = queue.Queue(self.MAX_PENDING)
+        self.next_line = 1
+        self.finished = False
+        self.closed = False  # set once the worker stops reading
+        self._feed()
+
+    def _feed(self):
+        """Read chunks until the queue is full (Tk thread)."""
+        if self.closed or self.cancel_event.is_set():
+            return
+        while not self.chunks.full():
+            if self.finished:
+                self.chunks.put(None)
+                return
+            try:
+                last_line = int(self.text_widget.index(tk.END + "-1c").split(".")[0])
+                following = self.next_line + self.CHUNK_LINES
+                if following > last_line:
+                    self.chunks.put(self.text_widget.get(f"{self.next_line}.0", tk.END + "-1c"))
+                    self.finished = True
+                else:
+                    self.chunks.put(self.text_widget.get(f"{self.next_line}.0", f"{following}.0"))
+                    self.next_line = following
+            except tk.TclError:
+                # The document was closed; what was read so far is all there is
+                self.finished = True
+        self.root.after(self.FEED_INTERVAL, self._feed)
+
+    def __iter__(self):
+        """Yield the chunks in order (worker thread); stops early if cancelled."""
+        try:
+            while not self.cancel_event.is_set():
+                try:
+                    chunk = self.chunks.get(timeout=0.1)
+                except queue.Empty:
+                    continue
+                if chunk is None:
+                    return
+                yield chunk
+        finally:
+            self.closed = True
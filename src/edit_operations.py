@@ -3,7 +3,8 @@ Edit operations for Notexio text editor.
 """
 import tkinter as tk
 from tkinter import simpledialog, messagebox
-import re
+
+from src import text_operations
 
 
 class EditOperations:
@@ -115,6 +116,7 @@ class EditOperations:
         
         # Bind Enter key
         self.search_entry.bind("<Return>", lambda e: self.find_next())
+        self.editor.theme_dialog(self.search_dialog)
         
     def find_next(self):
         """Find next occurrence."""
@@ -203,6 +205,36 @@ class EditOperations:
         else:
             messagebox.showinfo("Find", "No more occurrences found.")
             
+    def find_occurrence(self, pattern, regexp=False, case_sensitive=False, backwards=False):
+        """Select the next (or previous) match of pattern, wrapping around.
+
+        Uses the text widget's own search, so patterns may span lines.
+        Returns False when there is no match.
+        """
+        text_widget = self.editor.text_widget
+        start = tk.INSERT
+        if backwards and text_widget.tag_ranges(tk.SEL):
+            start = tk.SEL_FIRST
+        length = tk.IntVar()
+        position = text_widget.search(
+            pattern,
+            start,
+            forwards=not backwards,
+            backwards=backwards,
+            regexp=regexp,
+            nocase=not case_sensitive,
+            count=length
+        )
+        if not position:
+            return False
+            
+        end_pos = f"{position} + {length.get()} chars"
+        text_widget.tag_remove(tk.SEL, 1.0, tk.END)
+        text_widget.tag_add(tk.SEL, position, end_pos)
+        text_widget.mark_set(tk.INSERT, position if backwards else end_pos)
+        text_widget.see(tk.INSERT)
+        return True
+        
     def replace(self):
         """Open replace dialog."""
         if self.replace_dialog is None or not self.replace_dialog.winfo_exists():
@@ -262,6 +294,7 @@ class EditOperations:
             text="Close",
             command=self.replace_dialog.destroy
         ).pack(side=tk.LEFT, padx=5)
+        self.editor.theme_dialog(self.replace_dialog)
         
     def replace_one(self):
         """Replace current selection."""
@@ -292,24 +325,19 @@ class EditOperations:
         self.search_case_sensitive = self.case_var.get()
         
         # Get all content
-        content = self.editor.text_widget.get(1.0, tk.END)
+        content = self.editor.text_widget.get(1.0, tk.END + "-1c")
         
-        if not self.search_case_sensitive:
-            # Case-insensitive replace
-            content_new = re.sub(
-                re.escape(search_term),
-                replace_term,
-                content,
-                flags=re.IGNORECASE
-            )
-        else:
-            # Case-sensitive replace
-            content_new = content.replace(search_term, replace_term)
+        content_new, count = text_operations.replace_all(
+            content,
+            search_term,
+            replace_term,
+            case_sensitive=self.search_case_sensitive
+        )
             
-        if content_new != content:
+        if count and content_new != content:
             self.editor.text_widget.delete(1.0, tk.END)
             self.editor.text_widget.insert(1.0, content_new)
-            messagebox.showinfo("Replace", "Replace completed.")
+            messagebox.showinfo("Replace", f"Replace completed ({count:,} replaced).")
         else:
             messagebox.showinfo("Replace", "No occurrences found.")
             
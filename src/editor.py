@@ -4,15 +4,94 @@ Main editor window class for Notexio text editor.
 import tkinter as tk
 from tkinter import ttk, scrolledtext
 import os
+import sys
+
+
+class TextPeer(tk.Text):
+    """A second view of a document text widget (a Tk text peer).
+
+    Peers share the text, tags, marks and undo stack of the widget they were
+    created from, so nothing is copied; each one has its own scroll position,
+    cursor and selection. Like ScrolledText, a peer sits in a frame next to
+    its scrollbar.
+    """
+
+    def __init__(self, master, text_widget, **options):
+        self.frame = tk.Frame(master)
+        self.vbar = tk.Scrollbar(self.frame)
+        self.vbar.pack(side=tk.RIGHT, fill=tk.Y)
+        tk.BaseWidget._setup(self, self.frame, {})
+        self.widgetName = "text"
+        text_widget.peer_create(self._w, **options)
+        self.primary = text_widget
+        self.vbar.config(command=self.yview)
+        self.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
 
 
 class Editor:
     """Main editor window class."""
     
+    # Appearance options copied from the active text widget to new tabs
+    INHERITED_TEXT_OPTIONS = (
+        "font", "bg", "fg", "selectbackground", "selectforeground",
+        "insertbackground", "wrap"
+    )
+    # Options a text peer copies from the widget it views
+    PEER_TEXT_OPTIONS = INHERITED_TEXT_OPTIONS + (
+        "borderwidth", "highlightthickness", "padx", "pady",
+        "spacing1", "spacing2", "spacing3", "relief", "undo"
+    )
+    
+    # Tcl wrapper installed in front of every document text widget command.
+    # It generates <<TextChanged>> after each insert, delete or replace; errors
+    # propagate to the caller unchanged because no Python code runs in between.
+    # While delta listeners are registered it also reports the affected lines
+    # before and after the edit (see add_text_delta_listener).
+    TEXT_PROXY_SCRIPT = """
+proc ::notexio_text_proxy {widget command args} {
+    set op [lindex $args 0]
+    set hook ""
+    if {[info exists ::notexio_text_delta_hook] && $op in {insert delete replace}} {
+        set hook $::notexio_text_delta_hook
+        set lines [lindex [split [$command index end-1c] .] 0]
+        switch -exact -- $op {
+            insert {
+                set indices [list [lindex $args 1]]
+            }
+            delete {
+                set indices [lrange $args 1 end]
+                if {[llength $indices] == 1} {
+                    lappend indices "[lindex $indices 0] + 1 chars"
+                }
+            }
+            replace {
+                set indices [lrange $args 1 2]
+            }
+        }
+        set first $lines
+        set last 1
+        foreach index $indices {
+            set line [lindex [split [$command index $index] .] 0]
+            if {$line > $lines} {set line $lines}
+            if {$line < $first} {set first $line}
+            if {$line > $last} {set last $line}
+        }
+        set before [$command get $first.0 $last.end]
+    }
+    set result [uplevel 1 [linsert $args 0 $command]]
+    if {$hook ne ""} {
+        set last [expr {$last + [lindex [split [$command index end-1c] .] 0] - $lines}]
+        uplevel #0 [linsert $hook end $widget $first $before [$command get $first.0 $last.end]]
+    }
+    if {$op in {insert delete replace}} {
+        event generate $widget <<TextChanged>> -when tail
+    }
+    return $result
+}
+"""
+    
     def set_icon(self):
         """Set the application icon."""
-        import os
-        
         # Get project root directory (parent of src directory)
         project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
         icon_paths = [
@@ -22,13 +101,29 @@ class Editor:
             "assets/icon.ico"  # Relative assets
         ]
         
-        for icon_path in icon_paths:
-            if os.path.exists(icon_path):
+        # .ico files only work as window icons on Windows
+        if sys.platform == "win32":
+            for icon_path in icon_paths:
+                if os.path.exists(icon_path):
+                    try:
+                        self.root.iconbitmap(icon_path)
+                        return
+                    except Exception:
+                        continue
+        else:
+            # Other platforms use a PNG converted once and cached, so PIL is
+            # not imported on every launch
+            cached_icon = os.path.join(project_root, "config", "cache", "icon.png")
+            if not os.path.exists(cached_icon):
+                source = next((p for p in icon_paths if os.path.exists(p)), None)
+                self.create_icon_cache(source, cached_icon)
+            if os.path.exists(cached_icon):
                 try:
-                    self.root.iconbitmap(icon_path)
-                    return
+                    self.icon_image = tk.PhotoImage(file=cached_icon)
+                    self.root.iconphoto(True, self.icon_image)
                 except Exception:
-                    continue
+                    pass
+            return
         
         # If no icon file found, try to create a simple one or use default
         try:
@@ -37,31 +132,51 @@ class Editor:
         except:
             pass  # Use default icon if creation fails
             
-    def create_simple_icon(self):
-        """Create a simple icon if PIL is available."""
+    def create_icon_cache(self, source, cached_icon):
+        """Convert the .ico (or a generated icon) to a cached PNG if PIL is available."""
         try:
-            from PIL import Image, ImageDraw
-            import os
-            
-            # Create icon directory if needed
-            os.makedirs("assets", exist_ok=True)
+            from PIL import Image
             
-            # Create a 256x256 icon
-            size = 256
-            img = Image.new('RGBA', (size, size), (0, 0, 0, 0))
-            draw = ImageDraw.Draw(img)
-            
-            # Modern blue background circle
-            draw.ellipse([20, 20, size-20, size-20], fill=(0, 120, 212, 255))  # Windows blue
+            if source:
+                img = Image.open(source)
+            else:
+                img = self.draw_icon_image()
+            img = img.convert('RGBA').resize((64, 64))
+            os.makedirs(os.path.dirname(cached_icon), exist_ok=True)
+            img.save(cached_icon, format='PNG')
+        except ImportError:
+            # PIL not available, keep the default icon
+            pass
+        except Exception:
+            # Silently fail
+            pass
             
-            # Draw a stylized "N" for Notexio
-            # Left vertical line
-            draw.rectangle([80, 60, 100, size-60], fill=(255, 255, 255, 255))
-            # Diagonal line
-            points = [(100, 60), (size-100, size-60), (size-80, size-60), (80, 60)]
-            draw.polygon(points, fill=(255, 255, 255, 255))
-            # Right vertical line
-            draw.rectangle([size-100, 60, size-80, size-60], fill=(255, 255, 255, 255))
+    def draw_icon_image(self):
+        """Draw the Notexio icon with PIL."""
+        from PIL import Image, ImageDraw
+        
+        # Create a 256x256 icon
+        size = 256
+        img = Image.new('RGBA', (size, size), (0, 0, 0, 0))
+        draw = ImageDraw.Draw(img)
+        
+        # Modern blue background circle
+        draw.ellipse([20, 20, size-20, size-20], fill=(0, 120, 212, 255))  # Windows blue
+        
+        # Draw a stylized "N" for Notexio
+        # Left vertical line
+        draw.rectangle([80, 60, 100, size-60], fill=(255, 255, 255, 255))
+        # Diagonal line
+        points = [(100, 60), (size-100, size-60), (size-80, size-60), (80, 60)]
+        draw.polygon(points, fill=(255, 255, 255, 255))
+        # Right vertical line
+        draw.rectangle([size-100, 60, size-80, size-60], fill=(255, 255, 255, 255))
+        return img
+        
+    def create_simple_icon(self):
+        """Create a simple icon if PIL is available."""
+        try:
+            img = self.draw_icon_image()
             
             # Save as ICO with multiple sizes
             project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -96,9 +211,24 @@ class Editor:
         # Current file path
         self.current_file = None
         self.is_modified = False
+        # Set while a log file is being followed (tail mode)
+        self.is_following = False
         
         # UI components reference (will be set by main app)
         self.ui_components = None
+        # Tab manager, log follower, syntax highlighter and theme manager references (will be set by main app)
+        self.tab_manager = None
+        self.log_follower = None
+        self.syntax_highlighter = None
+        self.theme_manager = None
+        # Markdown preview pane (set by main app when first shown)
+        self.markdown_preview = None
+        
+        # All live document text widgets (one per loaded tab)
+        self.text_widgets = []
+        self.text_widget_callbacks = []
+        self.text_delta_listeners = []
+        self.root.tk.eval(self.TEXT_PROXY_SCRIPT)
         
         # Initialize UI components
         self.setup_ui()
@@ -109,13 +239,22 @@ class Editor:
     def setup_ui(self):
         """Setup the user interface."""
         # Menu bar will be added by main.py
-        # Create container frame for text widget (allows line numbers to be added later)
+        # Create container frame for the tabs (allows line numbers to be added later)
         self.text_container = tk.Frame(self.root)
         self.text_container.pack(fill=tk.BOTH, expand=True)
         
+        # One notebook page per open document - managed by TabManager
+        self.notebook = ttk.Notebook(self.text_container)
+        self.notebook.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        
+        tab_frame = tk.Frame(self.notebook)
+        self.notebook.add(tab_frame, text="Untitled")
+        self.text_widget = self.create_text_widget(tab_frame)
+        
+    def create_text_widget(self, parent):
+        """Create a document text widget styled like the current one."""
         # Modern Windows Notepad-style text widget - clean and minimal
-        self.text_widget = scrolledtext.ScrolledText(
-            self.text_container,
+        options = dict(
             wrap=tk.WORD,
             undo=True,
             font=("Segoe UI", 11),  # Modern Windows 11 font
@@ -133,31 +272,159 @@ class Editor:
             spacing3=0,
             relief=tk.FLAT
         )
-        self.text_widget.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        # New tabs inherit font, colors and wrap from the active document
+        current = getattr(self, 'text_widget', None)
+        if current is not None and current.winfo_exists():
+            for option in self.INHERITED_TEXT_OPTIONS:
+                options[option] = current.cget(option)
+                
+        text_widget = scrolledtext.ScrolledText(parent, **options)
+        text_widget.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self.setup_text_widget(text_widget)
+        return text_widget
+        
+    def create_text_peer(self, text_widget, parent):
+        """Create another view of a document text widget (see TextPeer)."""
+        options = {option: text_widget.cget(option) for option in self.PEER_TEXT_OPTIONS}
+        peer = TextPeer(parent, text_widget, **options)
+        self.setup_text_widget(peer)
+        return peer
+        
+    def setup_text_widget(self, text_widget):
+        """Hook a new document text widget or peer up to the editor and its features."""
+        # Announce scrolling and resizing so features can limit work to the visible lines
+        text_widget.configure(
+            yscrollcommand=lambda first, last, widget=text_widget: self.on_text_yscroll(widget, first, last)
+        )
         
         # Track modifications
-        self.text_widget.bind("<<Modified>>", self.on_text_modified)
+        text_widget.bind("<<Modified>>", self.on_text_modified)
+        self.install_text_proxy(text_widget)
         
         # Enable mouse wheel scrolling
-        self.text_widget.bind("<MouseWheel>", self.on_mousewheel)
-        self.text_widget.bind("<Button-4>", self.on_mousewheel)  # Linux
-        self.text_widget.bind("<Button-5>", self.on_mousewheel)  # Linux
+        text_widget.bind("<MouseWheel>", self.on_mousewheel)
+        text_widget.bind("<Button-4>", self.on_mousewheel)  # Linux
+        text_widget.bind("<Button-5>", self.on_mousewheel)  # Linux
+        
+        # Of a split document, the features follow the focused pane
+        text_widget.bind("<FocusIn>", self.on_text_focus, add="+")
+        
+        self.text_widgets.append(text_widget)
+        text_widget.bind("<Destroy>", self._on_text_widget_destroyed, add="+")
+        for callback in self.text_widget_callbacks:
+            callback(text_widget)
+        
+    def document_widget(self, text_widget):
+        """The document text widget a widget or peer shows (per-document state is kept for it)."""
+        return getattr(text_widget, 'primary', text_widget)
+        
+    def text_views(self, text_widget):
+        """The document text widget of a widget or peer, followed by its peers."""
+        primary = self.document_widget(text_widget)
+        return [primary] + [widget for widget in self.text_widgets if getattr(widget, 'primary', None) is primary]
+        
+    def on_text_focus(self, event):
+        """Point the editor at the focused pane of the active document."""
+        text_widget = event.widget
+        if text_widget is self.text_widget or \
+                self.document_widget(text_widget) is not self.document_widget(self.text_widget):
+            return
+        self.text_widget = text_widget
+        if self.ui_components:
+            self.ui_components.update_status_bar()
+            if self.ui_components.line_numbers_visible:
+                self.ui_components.update_line_numbers()
+        if self.syntax_highlighter:
+            self.syntax_highlighter.tag_visible(text_widget)
+            
+    def add_text_widget_callback(self, callback):
+        """Run callback for every existing and future document text widget."""
+        self.text_widget_callbacks.append(callback)
+        for text_widget in self.text_widgets:
+            callback(text_widget)
+            
+    def install_text_proxy(self, text_widget):
+        """Route the widget command through the <<TextChanged>> proxy."""
+        original = text_widget._w + "_original"
+        text_widget.tk.call("rename", text_widget._w, original)
+        text_widget.tk.call(
+            "interp", "alias", "", text_widget._w, "", "::notexio_text_proxy", text_widget._w, original
+        )
+        
+    def add_text_delta_listener(self, listener):
+        """Call listener(text_widget, first_line, old_text, new_text) after every edit.
+
+        old_text and new_text are the complete lines touched by the edit,
+        starting at first_line, before and after it.
+        """
+        if not self.text_delta_listeners:
+            self.root.tk.setvar("::notexio_text_delta_hook", self.root.register(self._on_text_delta))
+        self.text_delta_listeners.append(listener)
+        
+    def _on_text_delta(self, path, first_line, old_text, new_text):
+        """Dispatch an edit reported by the text proxy."""
+        for text_widget in self.text_widgets:
+            if text_widget._w == path:
+                for listener in self.text_delta_listeners:
+                    listener(text_widget, int(first_line), old_text, new_text)
+                return
+                
+    def _on_text_widget_destroyed(self, event):
+        """Forget destroyed text widgets."""
+        if event.widget in self.text_widgets:
+            self.text_widgets.remove(event.widget)
+            # Tk deleted the real widget command; drop the proxy alias too
+            try:
+                event.widget.tk.call("rename", event.widget._w, "")
+            except tk.TclError:
+                pass
+        
+    def theme_dialog(self, dialog):
+        """Color a dialog with the active theme (and follow later theme changes)."""
+        if self.theme_manager:
+            self.theme_manager.register_dialog(dialog)
+            
+    def on_text_yscroll(self, text_widget, first, last):
+        """Update the scrollbar and generate <<ViewportChanged>>."""
+        text_widget.vbar.set(first, last)
+        # The line numbers scroll with the focused pane
+        if text_widget is self.text_widget and self.ui_components and self.ui_components.line_numbers:
+            self.ui_components.line_numbers.yview_moveto(first)
+        text_widget.event_generate("<<ViewportChanged>>", when="tail")
         
     def on_mousewheel(self, event):
-        """Handle mouse wheel scrolling."""
+        """Handle mouse wheel scrolling (zoom with Ctrl held)."""
+        text_widget = event.widget
+        if event.state & 0x0004 and getattr(self, 'view_manager', None):
+            if getattr(event, 'delta', 0):
+                self.view_manager.zoom_wheel(1 if event.delta > 0 else -1)
+            elif getattr(event, 'num', None) in (4, 5):
+                self.view_manager.zoom_wheel(1 if event.num == 4 else -1)
+            return "break"
         # Windows and Mac
         if hasattr(event, 'delta') and event.delta:
-            self.text_widget.yview_scroll(int(-1 * (event.delta / 120)), "units")
+            text_widget.yview_scroll(int(-1 * (event.delta / 120)), "units")
         # Linux
         elif hasattr(event, 'num'):
             if event.num == 4:
-                self.text_widget.yview_scroll(-1, "units")
+                text_widget.yview_scroll(-1, "units")
             elif event.num == 5:
-                self.text_widget.yview_scroll(1, "units")
+                text_widget.yview_scroll(1, "units")
         return "break"
         
     def on_text_modified(self, event=None):
         """Handle text modification events."""
+        text_widget = event.widget if event is not None else self.text_widget
+        # Peers share the modified flag and each get the event
+        text_widget = self.document_widget(text_widget)
+        if text_widget is not self.document_widget(self.text_widget):
+            # Content loaded into a background tab is not a user edit
+            text_widget.edit_modified(False)
+            return
+        if self.is_following and self.log_follower.text_widget is text_widget:
+            # Appended log output is not a user edit
+            self.text_widget.edit_modified(False)
+            return
         if self.text_widget.edit_modified():
             self.is_modified = True
             self.update_title()
@@ -183,6 +450,13 @@ class Editor:
             
         self.root.title(title)
         
+        if self.tab_manager:
+            self.tab_manager.update_tab_title()
+        if self.syntax_highlighter:
+            self.syntax_highlighter.update_language()
+        if self.markdown_preview:
+            self.markdown_preview.update_document()
+        
     def on_closing(self):
         """Handle window closing event."""
         # Will be enhanced with unsaved changes check
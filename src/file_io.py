@@ -0,0 +1,70 @@
+"""
+Tk-free file input/output for Notexio text editor.
+"""
+import codecs
+import os
+import sys
+
+
+DEFAULT_ENCODING = 'utf-8'
+
+
+def read_text_file(filepath, encoding=DEFAULT_ENCODING):
+    """Read a whole text file ('-' reads standard input)."""
+    if filepath == '-':
+        return sys.stdin.read()
+    with open(filepath, 'r', encoding=encoding) as f:
+        return f.read()
+
+
+def write_text_file(filepath, content, encoding=DEFAULT_ENCODING):
+    """Write a whole text file ('-' writes standard output)."""
+    if filepath == '-':
+        sys.stdout.write(content)
+        return
+    with open(filepath, 'w', encoding=encoding) as f:
+        f.write(content)
+
+
+def replacement_mode(filepath):
+    """Permission bits for a file replacing filepath: the existing file's, else what open() would give."""
+    try:
+        return os.stat(filepath).st_mode & 0o7777
+    except FileNotFoundError:
+        umask = os.umask(0)
+        os.umask(umask)
+        return 0o666 & ~umask
+
+
+def iter_lines(filepath, encoding=DEFAULT_ENCODING):
+    """Yield lines of a text file without their line endings, one at a time."""
+    if filepath == '-':
+        stream = sys.stdin
+        for line in stream:
+            yield line.rstrip("\r\n")
+        return
+    with open(filepath, 'r', encoding=encoding, newline=None) as f:
+        for line in f:
+            yield line.rstrip("\n")
+
+
+def convert_encoding(source, destination, from_encoding, to_encoding,
+                     errors='strict', chunk_size=1024 * 1024):
+    """Re-encode a file in fixed-size chunks so memory stays bounded."""
+    decoder = codecs.getincrementaldecoder(from_encoding)(errors=errors)
+    encoder = codecs.getincrementalencoder(to_encoding)(errors=errors)
+
+    src = sys.stdin.buffer if source == '-' else open(source, 'rb')
+    dst = sys.stdout.buffer if destination == '-' else open(destination, 'wb')
+    try:
+        while True:
+            chunk = src.read(chunk_size)
+            if not chunk:
+                break
+            dst.write(encoder.encode(decoder.decode(chunk)))
+        dst.write(encoder.encode(decoder.decode(b"", final=True), final=True))
+    finally:
+        if src is not sys.stdin.buffer:
+            src.close()
+        if dst is not sys.stdout.buffer:
+            dst.close()
@@ -6,6 +6,8 @@ from tkinter import filedialog, messagebox
 import os
 import json
 
+from src.file_io import read_text_file, write_text_file
+
 
 class FileManager:
     """Manages file operations."""
@@ -18,7 +20,13 @@ class FileManager:
         
     def new_file(self):
         """Create a new file."""
+        tab_manager = getattr(self.editor, 'tab_manager', None)
+        if tab_manager:
+            # Each new document gets its own tab
+            tab_manager.new_tab()
+            return
         if self.check_unsaved_changes():
+            self.stop_following()
             self.editor.current_file = None
             self.editor.text_widget.delete(1.0, tk.END)
             self.editor.is_modified = False
@@ -30,7 +38,9 @@ class FileManager:
             
     def open_file(self, filepath=None):
         """Open a file."""
-        if self.check_unsaved_changes():
+        tab_manager = getattr(self.editor, 'tab_manager', None)
+        # With tabs the file opens next to the current document instead of replacing it
+        if tab_manager or self.check_unsaved_changes():
             if not filepath:
                 filepath = filedialog.askopenfilename(
                     title="Open File",
@@ -41,12 +51,21 @@ class FileManager:
                 )
                 
             if filepath:
+                if tab_manager and tab_manager.select_file(filepath):
+                    self.add_to_recent_files(filepath)
+                    return
                 try:
-                    with open(filepath, 'r', encoding='utf-8') as f:
-                        content = f.read()
+                    content = read_text_file(filepath)
                     
+                    if tab_manager:
+                        tab_manager.select(tab_manager.open_target())
+                    else:
+                        self.stop_following()
                     self.editor.text_widget.delete(1.0, tk.END)
                     self.editor.text_widget.insert(1.0, content)
+                    self.restore_formatting(filepath, self.editor.document_widget(self.editor.text_widget), content)
+                    self.editor.text_widget.edit_reset()
+                    self.editor.text_widget.edit_modified(False)
                     self.editor.current_file = filepath
                     self.editor.is_modified = False
                     self.editor.update_title()
@@ -63,9 +82,9 @@ class FileManager:
         """Save current file."""
         if self.editor.current_file:
             try:
-                with open(self.editor.current_file, 'w', encoding='utf-8') as f:
-                    content = self.editor.text_widget.get(1.0, tk.END + "-1c")
-                    f.write(content)
+                content = self.editor.text_widget.get(1.0, tk.END + "-1c")
+                write_text_file(self.editor.current_file, content)
+                self.save_formatting(self.editor.current_file, content)
                 self.editor.is_modified = False
                 self.editor.update_title()
                 return True
@@ -88,9 +107,9 @@ class FileManager:
         
         if filepath:
             try:
-                with open(filepath, 'w', encoding='utf-8') as f:
-                    content = self.editor.text_widget.get(1.0, tk.END + "-1c")
-                    f.write(content)
+                content = self.editor.text_widget.get(1.0, tk.END + "-1c")
+                write_text_file(filepath, content)
+                self.save_formatting(filepath, content)
                 self.editor.current_file = filepath
                 self.editor.is_modified = False
                 self.editor.update_title()
@@ -101,6 +120,24 @@ class FileManager:
                 return False
         return False
         
+    def save_formatting(self, filepath, content):
+        """Save the formatting of the current document next to the file."""
+        formatter = getattr(self.editor, 'formatter', None)
+        if formatter:
+            # Loaded formatting is tracked for the document widget, not a split view peer
+            formatter.save_formatting(filepath, self.editor.document_widget(self.editor.text_widget), content)
+            
+    def restore_formatting(self, filepath, text_widget, content):
+        """Reapply the formatting saved with a file."""
+        formatter = getattr(self.editor, 'formatter', None)
+        if formatter:
+            formatter.restore_formatting(filepath, text_widget, content)
+            
+    def stop_following(self):
+        """Stop tail mode before the buffer is replaced."""
+        if hasattr(self.editor, 'log_follower') and self.editor.log_follower:
+            self.editor.log_follower.stop()
+            
     def check_unsaved_changes(self):
         """Check for unsaved changes and prompt user."""
         if self.editor.is_modified:
@@ -126,7 +163,7 @@ class FileManager:
         self.settings_manager.save_recent_files(self.recent_files)
         # Update recent files menu if app reference is available
         if hasattr(self, 'app') and self.app:
-            if hasattr(self.app, 'recent_menu'):
+            if getattr(self.app, 'recent_menu', None):
                 self.app.update_recent_files_menu(self.app.recent_menu)
         
     def get_recent_files(self):
@@ -1,16 +1,74 @@
 """
 Formatting operations for Notexio text editor.
 """
+import os
+import sys
 import tkinter as tk
-from tkinter import font, colorchooser
 import tkinter.font as tkfont
+import weakref
+import zlib
+from collections import OrderedDict
+
+from src.rich_text import index_to_offset, line_starts, offset_to_index, read_formatting, write_formatting
+
+
+def font_directories():
+    """Directories the system installs fonts into."""
+    home = os.path.expanduser("~")
+    if sys.platform == "win32":
+        return [
+            os.path.join(os.environ.get("WINDIR", r"C:\Windows"), "Fonts"),
+            os.path.join(os.environ.get("LOCALAPPDATA", home), "Microsoft", "Windows", "Fonts"),
+        ]
+    if sys.platform == "darwin":
+        return ["/System/Library/Fonts", "/Library/Fonts", os.path.join(home, "Library", "Fonts")]
+    return [
+        "/usr/share/fonts",
+        "/usr/local/share/fonts",
+        os.path.join(home, ".fonts"),
+        os.path.join(home, ".local", "share", "fonts"),
+    ]
+
+
+def font_directory_fingerprint():
+    """Checksum of the font directories and their subdirectories' modification times.
+
+    Installing or removing a font touches one of them, which invalidates the
+    cached family list.
+    """
+    parts = []
+    for directory in font_directories():
+        try:
+            parts.append(f"{directory}:{os.stat(directory).st_mtime_ns}")
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        parts.append(f"{entry.path}:{entry.stat().st_mtime_ns}")
+        except OSError:
+            continue
+    key = "\n".join(sorted(parts)).encode("utf-8")
+    return f"{zlib.crc32(key):08x}"
 
 
 class Formatter:
-    """Manages text formatting."""
+    """Manages text formatting.
     
-    def __init__(self, editor):
+    Every document widget uses one shared named font, so formatting and zoom
+    changes reconfigure that font once instead of every widget. Fonts for
+    formatted selections come from a small cache keyed by their attributes.
+    """
+    
+    FONT_CACHE_SIZE = 32
+    TAG_BATCH_SIZE = 2000
+    # Tags holding user formatting, saved with the document (plus "formatted*")
+    FORMAT_TAGS = ("underline", "bold", "italic")
+    PREVIEW_TEXT = "AaBbCc XxYyZz 0123456789"
+    
+    def __init__(self, editor, settings_manager=None):
         self.editor = editor
+        self.settings_manager = settings_manager
+        # Sorted font families, loaded after startup (see load_font_families)
+        self.font_families = None
         self.current_font_family = "Segoe UI"
         self.current_font_size = 11
         self.current_text_color = "#000000"
@@ -25,42 +83,131 @@ class Formatter:
         self.default_text_color = "#000000"
         self.default_bg_color = "#FFFFFF"
         
+        # Set by the view manager (1.0 = 100%)
+        self.zoom_factor = 1.0
+        # Widgets the formatting saved with their file was loaded into; only
+        # for these does "no formatting" mean the sidecar should go
+        self.formatting_loaded = weakref.WeakSet()
+        # Shared named fonts: document text and line numbers
+        self.document_font = None
+        self.gutter_font = None
+        # (family, size, weight, slant, underline) -> named font, least recently used first
+        self.font_cache = OrderedDict()
+        # Font name -> cache key, to describe tag fonts when saving formatting
+        self.font_keys = {}
+        
         self.update_font()
         
+    def get_font(self, family, size, weight="normal", slant="roman", underline=False):
+        """Return a cached named font with these attributes, creating it once."""
+        key = (family, size, weight, slant, underline)
+        font = self.font_cache.get(key)
+        if font is not None:
+            self.font_cache.move_to_end(key)
+            return font
+        font = tkfont.Font(
+            root=self.editor.root,
+            family=family,
+            size=size,
+            weight=weight,
+            slant=slant,
+            underline=underline
+        )
+        self.font_cache[key] = font
+        self.font_keys[str(font)] = key
+        if len(self.font_cache) > self.FONT_CACHE_SIZE:
+            # Tk keeps a deleted font alive while tags still use it
+            self.font_cache.popitem(last=False)
+        return font
+        
     def update_font(self):
         """Update the font configuration."""
         # Check if text_widget exists (may not be initialized yet)
         if not hasattr(self.editor, 'text_widget') or not self.editor.text_widget:
             return
             
-        font_config = (
-            self.current_font_family,
-            self.current_font_size,
-            self.current_font_weight,
-            self.current_font_slant
-        )
-        
-        # Configure text widget font
-        self.editor.text_widget.config(
-            font=font_config,
-            foreground=self.current_text_color,
-            background=self.current_bg_color,
-            insertbackground=self.current_text_color
-        )
+        size = max(1, round(self.current_font_size * self.zoom_factor))
+        if self.document_font is None:
+            self.document_font = tkfont.Font(
+                root=self.editor.root,
+                family=self.current_font_family,
+                size=size,
+                weight=self.current_font_weight,
+                slant=self.current_font_slant
+            )
+            self.gutter_font = tkfont.Font(root=self.editor.root, family=self.current_font_family, size=size)
+            # New tabs inherit the font name from the active widget
+            for text_widget in getattr(self.editor, 'text_widgets', [self.editor.text_widget]):
+                text_widget.config(font=self.document_font)
+        else:
+            # Widgets using the named font relayout once; weight and slant survive zoom
+            self.document_font.configure(
+                family=self.current_font_family,
+                size=size,
+                weight=self.current_font_weight,
+                slant=self.current_font_slant
+            )
+            self.gutter_font.configure(family=self.current_font_family, size=size)
         
         # Update base font size in view manager for zoom
         if hasattr(self.editor, 'view_manager') and self.editor.view_manager:
             self.editor.view_manager.base_font_size = self.current_font_size
+            
+    def update_colors(self):
+        """Apply the text and background colors to every open tab."""
+        for text_widget in getattr(self.editor, 'text_widgets', [self.editor.text_widget]):
+            text_widget.config(
+                foreground=self.current_text_color,
+                background=self.current_bg_color,
+                insertbackground=self.current_text_color
+            )
+            
+    def set_zoom(self, zoom_factor):
+        """Scale the document font (1.0 = the chosen font size)."""
+        self.zoom_factor = zoom_factor
+        self.update_font()
+        
+    def load_font_families(self):
+        """Load the sorted family list from the settings cache, or ask Tk once.
+
+        The cache is keyed by a fingerprint of the font directories, so it is
+        rebuilt only after fonts are installed or removed.
+        """
+        if self.font_families is not None:
+            return self.font_families
+        fingerprint = font_directory_fingerprint()
+        if self.settings_manager:
+            cached = self.settings_manager.get_setting("font_families")
+            if cached and self.settings_manager.get_setting("font_families_fingerprint") == fingerprint:
+                self.font_families = cached
+                return self.font_families
+        
+        # "@" families are the vertical variants Windows lists for CJK fonts
+        families = {family for family in tkfont.families(self.editor.root) if not family.startswith("@")}
+        self.font_families = sorted(families, key=lambda family: (family.lower(), family))
+        if self.settings_manager:
+            self.settings_manager.update_settings({
+                "font_families": self.font_families,
+                "font_families_fingerprint": fingerprint
+            })
+        return self.font_families
         
     def change_font_family(self):
         """Change font family."""
         dialog = tk.Toplevel(self.editor.root)
         dialog.title("Font Family")
-        dialog.geometry("300x400")
+        dialog.geometry("320x460")
         dialog.transient(self.editor.root)
         
-        # Get available fonts
-        available_fonts = sorted(tkfont.families())
+        # Get available fonts (cached after startup)
+        available_fonts = self.load_font_families()
+        # Families currently listed, narrowed as the filter grows
+        shown = {"query": "", "fonts": available_fonts}
+        
+        # Type-ahead filter
+        filter_var = tk.StringVar()
+        filter_entry = tk.Entry(dialog, textvariable=filter_var)
+        filter_entry.pack(fill=tk.X, padx=10, pady=(10, 0))
         
         # Listbox with scrollbar
         frame = tk.Frame(dialog)
@@ -69,35 +216,70 @@ class Formatter:
         scrollbar = tk.Scrollbar(frame)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         
-        listbox = tk.Listbox(frame, yscrollcommand=scrollbar.set)
+        listbox = tk.Listbox(frame, yscrollcommand=scrollbar.set, exportselection=False)
         scrollbar.config(command=listbox.yview)
+        listbox.insert(tk.END, *available_fonts)
+        listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        
+        # Live preview in the highlighted family
+        preview = tk.Label(dialog, text=self.PREVIEW_TEXT, anchor=tk.W, height=2)
+        preview.pack(fill=tk.X, padx=10)
         
-        for f in available_fonts:
-            listbox.insert(tk.END, f)
+        def show_preview(event=None):
+            selection = listbox.curselection()
+            if selection:
+                preview.config(font=self.get_font(shown["fonts"][selection[0]], 14))
+                
+        def select(index):
+            listbox.selection_clear(0, tk.END)
+            if shown["fonts"]:
+                listbox.selection_set(index)
+                listbox.see(index)
+            show_preview()
+            
+        def apply_filter(*args):
+            query = filter_var.get().strip().lower()
+            # A longer query can only narrow the previous result
+            source = shown["fonts"] if query.startswith(shown["query"]) else available_fonts
+            matches = [family for family in source if query in family.lower()]
+            # Families starting with the query first
+            fonts = [family for family in matches if family.lower().startswith(query)]
+            fonts += [family for family in matches if not family.lower().startswith(query)]
+            shown["query"] = query
+            shown["fonts"] = fonts
+            listbox.delete(0, tk.END)
+            if fonts:
+                listbox.insert(tk.END, *fonts)
+            select(0)
             
+        filter_var.trace_add("write", apply_filter)
+        listbox.bind("<<ListboxSelect>>", show_preview)
+        
         # Select current font
         try:
-            index = available_fonts.index(self.current_font_family)
-            listbox.selection_set(index)
-            listbox.see(index)
+            select(available_fonts.index(self.current_font_family))
         except ValueError:
             pass
             
-        listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        
-        def apply_font():
+        def apply_font(event=None):
             selection = listbox.curselection()
             if selection:
-                self.current_font_family = available_fonts[selection[0]]
+                self.current_font_family = shown["fonts"][selection[0]]
                 self.update_font()
                 dialog.destroy()
                 
+        listbox.bind("<Double-Button-1>", apply_font)
+        filter_entry.bind("<Return>", apply_font)
+        filter_entry.bind("<Down>", lambda e: listbox.focus_set())
+        filter_entry.focus_set()
+                
         # Buttons
         button_frame = tk.Frame(dialog)
         button_frame.pack(pady=10)
         
         tk.Button(button_frame, text="OK", command=apply_font).pack(side=tk.LEFT, padx=5)
         tk.Button(button_frame, text="Cancel", command=dialog.destroy).pack(side=tk.LEFT, padx=5)
+        self.editor.theme_dialog(dialog)
         
     def change_font_size(self):
         """Change font size."""
@@ -122,6 +304,7 @@ class Formatter:
                 
     def change_text_color(self):
         """Change text color."""
+        from tkinter import colorchooser
         color = colorchooser.askcolor(
             title="Choose Text Color",
             color=self.current_text_color,
@@ -130,10 +313,11 @@ class Formatter:
         
         if color[1]:  # User didn't cancel
             self.current_text_color = color[1]
-            self.update_font()
+            self.update_colors()
             
     def change_bg_color(self):
         """Change background color."""
+        from tkinter import colorchooser
         color = colorchooser.askcolor(
             title="Choose Background Color",
             color=self.current_bg_color,
@@ -142,7 +326,7 @@ class Formatter:
         
         if color[1]:  # User didn't cancel
             self.current_bg_color = color[1]
-            self.update_font()
+            self.update_colors()
             
     def toggle_bold(self):
         """Toggle bold formatting."""
@@ -191,13 +375,13 @@ class Formatter:
             sel_start = self.editor.text_widget.index(tk.SEL_FIRST)
             sel_end = self.editor.text_widget.index(tk.SEL_LAST)
             
-            # Create font for tag
-            tag_font = tkfont.Font(
-                family=self.current_font_family,
-                size=self.current_font_size,
-                weight=self.current_font_weight,
-                slant=self.current_font_slant,
-                underline=self.current_font_underline
+            # Reuse the font for these attributes
+            tag_font = self.get_font(
+                self.current_font_family,
+                self.current_font_size,
+                self.current_font_weight,
+                self.current_font_slant,
+                self.current_font_underline
             )
             
             # Configure tag
@@ -212,6 +396,93 @@ class Formatter:
         except tk.TclError:
             pass  # No selection
             
+    def formatting_tags(self, text_widget):
+        """Tags of a document that carry user formatting."""
+        return [tag for tag in text_widget.tag_names() if tag in self.FORMAT_TAGS or tag.startswith("formatted")]
+        
+    def tag_style(self, text_widget, tag):
+        """Describe a formatting tag's options for the style table."""
+        style = {"tag": tag}
+        font_key = self.font_keys.get(str(text_widget.tag_cget(tag, "font")))
+        if font_key:
+            style["font"] = list(font_key)
+        for option in ("foreground", "background"):
+            value = str(text_widget.tag_cget(tag, option))
+            if value:
+                style[option] = value
+        underline = str(text_widget.tag_cget(tag, "underline"))
+        if underline and text_widget.tk.getboolean(underline):
+            style["underline"] = True
+        return style
+        
+    def formatting_runs(self, text_widget, content):
+        """(styles, runs) of a document's formatting (one tag_ranges call per tag)."""
+        styles = []
+        runs = []
+        starts = None
+        length = len(content)
+        for tag in self.formatting_tags(text_widget):
+            ranges = text_widget.tag_ranges(tag)
+            if not ranges:
+                continue
+            if starts is None:
+                starts = line_starts(content)
+            style_id = len(styles)
+            styles.append(self.tag_style(text_widget, tag))
+            for i in range(0, len(ranges), 2):
+                start = index_to_offset(ranges[i], starts, length)
+                end = index_to_offset(ranges[i + 1], starts, length)
+                if end > start:
+                    runs.append((start, end - start, style_id))
+        return styles, runs
+        
+    def save_formatting(self, filepath, text_widget, content):
+        """Save a document's formatting runs next to it.
+        
+        Never fails the save of the text itself: errors are reported and the
+        sidecar is left as it was.
+        """
+        try:
+            styles, runs = self.formatting_runs(text_widget, content)
+            if not runs and text_widget not in self.formatting_loaded:
+                # Whatever formatting the file has was never loaded; keep it
+                return
+            write_formatting(filepath, content, styles, runs)
+        except Exception as e:
+            print(f"Error saving formatting: {e}")
+            
+    def restore_formatting(self, filepath, text_widget, content):
+        """Reapply the formatting saved for a document, if it still matches its text."""
+        self.formatting_loaded.add(text_widget)
+        saved = read_formatting(filepath, content)
+        if saved is not None:
+            self.apply_formatting(text_widget, content, *saved)
+            
+    def apply_formatting(self, text_widget, content, styles, runs):
+        """Tag a document with (styles, runs) as returned by formatting_runs."""
+        self.formatting_loaded.add(text_widget)
+        starts = line_starts(content)
+        indices = [[] for _ in styles]
+        for start, length, style_id in runs:
+            indices[style_id].extend((offset_to_index(start, starts), offset_to_index(start + length, starts)))
+            
+        for style, style_indices in zip(styles, indices):
+            options = {}
+            if "font" in style:
+                options["font"] = self.get_font(*style["font"])
+            for option in ("foreground", "background"):
+                if option in style:
+                    options[option] = style[option]
+            if style.get("underline"):
+                options["underline"] = True
+            try:
+                text_widget.tag_configure(style["tag"], **options)
+                for i in range(0, len(style_indices), self.TAG_BATCH_SIZE):
+                    text_widget.tag_add(style["tag"], *style_indices[i:i + self.TAG_BATCH_SIZE])
+            except (tk.TclError, TypeError):
+                # A style this version cannot apply
+                continue
+                
     def restore_default_formatting(self):
         """Restore default formatting."""
         # Remove all formatting tags first
@@ -228,4 +499,5 @@ class Formatter:
         self.current_font_slant = "roman"
         self.current_font_underline = False
         self.update_font()
+        self.update_colors()
 
@@ -0,0 +1,203 @@
+"""
+Word frequency panel for Notexio text editor.
+"""
+import queue
+import threading
+import tkinter as tk
+from tkinter import ttk
+
+from src import text_operations
+from src.document_reader import DocumentReader
+from src.text_analytics import FrequencyIndex
+
+
+class FrequencyPanel:
+    """Top words, bigrams and trigrams of the current document.
+
+    Counting runs in a worker thread over a paragraph-cached index, so after
+    an edit only the changed paragraphs are counted again. The document is
+    handed to the worker in chunks rather than copied whole.
+    """
+
+    TOP_K = 50
+    REFRESH_DELAY = 500  # ms after the last edit
+    TABS = ((1, "Words", "Word"), (2, "Bigrams", "Bigram"), (3, "Trigrams", "Trigram"))
+
+    def __init__(self, editor, edit_operations):
+        self.editor = editor
+        self.edit_operations = edit_operations
+        self.index = FrequencyIndex()
+        self.window = None
+        self.trees = {}
+        self.document_widget = None
+        self.refresh_after_id = None
+        self.watch_after_id = None
+        self.worker = None
+        self.dirty = False
+        self.cancel_event = threading.Event()
+        self.results = queue.Queue()
+        self.editor.add_text_widget_callback(self.bind_text_widget)
+
+    def bind_text_widget(self, text_widget):
+        """Refresh the panel when the document changes."""
+        text_widget.bind("<<TextChanged>>", self.on_text_changed, add="+")
+
+    def show(self):
+        """Show the panel (or raise it if it is already open)."""
+        if self.window is not None and self.window.winfo_exists():
+            self.window.lift()
+            return
+
+        self.window = tk.Toplevel(self.editor.root)
+        self.window.title("Word Frequency")
+        self.window.geometry("360x480")
+        self.window.transient(self.editor.root)
+        self.window.protocol("WM_DELETE_WINDOW", self.close)
+
+        self.summary_label = tk.Label(self.window, text="Counting...", anchor=tk.W, justify=tk.LEFT)
+        self.summary_label.pack(fill=tk.X, padx=10, pady=(10, 5))
+
+        self.stop_words_var = tk.BooleanVar(value=True)
+        tk.Checkbutton(
+            self.window,
+            text="Skip common words",
+            variable=self.stop_words_var,
+            command=self.refresh
+        ).pack(anchor=tk.W, padx=10)
+
+        notebook = ttk.Notebook(self.window)
+        notebook.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
+        self.trees = {}
+        for n, title, heading in self.TABS:
+            frame = tk.Frame(notebook)
+            tree = ttk.Treeview(frame, columns=("count",), selectmode="browse")
+            tree.heading("#0", text=heading)
+            tree.heading("count", text="Count")
+            tree.column("count", width=70, anchor=tk.E, stretch=False)
+            scrollbar = ttk.Scrollbar(frame, orient=tk.VERTICAL, command=tree.yview)
+            tree.configure(yscrollcommand=scrollbar.set)
+            scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+            tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+            # Every click on an entry jumps to its next occurrence
+            tree.bind("<ButtonRelease-1>", lambda e, t=tree: self.jump(t))
+            tree.bind("<Return>", lambda e, t=tree: self.jump(t))
+            tree.bind("<Shift-Return>", lambda e, t=tree: self.jump(t, backwards=True))
+            notebook.add(frame, text=title)
+            self.trees[n] = tree
+
+        button_frame = tk.Frame(self.window)
+        button_frame.pack(pady=(0, 10))
+        tk.Button(button_frame, text="Previous", command=lambda: self.jump(self.current_tree(notebook), backwards=True)).pack(side=tk.LEFT, padx=5)
+        tk.Button(button_frame, text="Next", command=lambda: self.jump(self.current_tree(notebook))).pack(side=tk.LEFT, padx=5)
+        tk.Button(button_frame, text="Close", command=self.close).pack(side=tk.LEFT, padx=5)
+        self.editor.theme_dialog(self.window)
+
+        # A count cancelled by closing the panel stops at the next paragraph
+        if self.worker is not None:
+            self.worker.join()
+        self.results = queue.Queue()
+        self.cancel_event.clear()
+        self.refresh()
+        self.watch_after_id = self.window.after(1000, self._watch_active_document)
+
+    def current_tree(self, notebook):
+        """Treeview of the selected notebook tab."""
+        return self.trees[notebook.index(notebook.select()) + 1]
+
+    def on_text_changed(self, event):
+        """Debounce refreshes while the user is typing."""
+        if self.window is None or event.widget is not self.editor.text_widget:
+            return
+        if self.refresh_after_id is not None:
+            self.window.after_cancel(self.refresh_after_id)
+        self.refresh_after_id = self.window.after(self.REFRESH_DELAY, self.refresh)
+
+    def refresh(self):
+        """Recount the current document in the worker thread."""
+        self.refresh_after_id = None
+        if self.window is None:
+            return
+        if self.worker is not None and self.worker.is_alive():
+            # Picked up again when the running count finishes
+            self.dirty = True
+            return
+
+        self.dirty = False
+        self.document_widget = self.editor.text_widget
+        reader = DocumentReader(self.editor.root, self.document_widget, self.cancel_event)
+        stop_words = text_operations.STOP_WORDS if self.stop_words_var.get() else frozenset()
+        self.worker = threading.Thread(target=self._count, args=(self.results, reader, stop_words), daemon=True)
+        self.worker.start()
+        self.window.after(50, self._poll)
+
+    def _count(self, results, reader, stop_words):
+        """Update the index and collect the top terms (worker thread)."""
+        if not self.index.update(reader, self.cancel_event):
+            results.put(None)
+            return
+        top = {n: self.index.top(n, self.TOP_K, stop_words) for n, _, _ in self.TABS}
+        results.put((self.index.summary(), top))
+
+    def _poll(self):
+        """Show the worker's results once they are ready."""
+        if self.window is None:
+            return
+        try:
+            result = self.results.get_nowait()
+        except queue.Empty:
+            self.window.after(50, self._poll)
+            return
+
+        if result is not None:
+            self.show_results(*result)
+        else:
+            # The index dropped its totals and counts the document again
+            self.dirty = True
+        if self.dirty:
+            self.refresh()
+
+    def _watch_active_document(self):
+        """Recount when another tab becomes active (tab switches are not edits)."""
+        if self.window is None:
+            return
+        if self.document_widget is not self.editor.text_widget and not self.worker.is_alive():
+            self.refresh()
+        self.watch_after_id = self.window.after(1000, self._watch_active_document)
+
+    def show_results(self, summary, top):
+        """Fill the summary and the three lists."""
+        self.summary_label.config(
+            text=f"Words: {summary['tokens']:,}    Vocabulary: {summary['vocabulary']:,}\n"
+                 f"Type/token ratio: {summary['type_token_ratio']:.3f}"
+        )
+        for n, tree in self.trees.items():
+            selected = tree.selection()
+            selected_term = tree.item(selected[0], "text") if selected else None
+            tree.delete(*tree.get_children())
+            for term, count in top[n]:
+                item = tree.insert("", tk.END, text=term, values=(f"{count:,}",))
+                if term == selected_term:
+                    tree.selection_set(item)
+
+    def jump(self, tree, backwards=False):
+        """Select the next occurrence of the chosen entry in the document."""
+        selected = tree.selection()
+        if not selected:
+            return
+        words = tree.item(selected[0], "text").split(" ")
+        # Whole words, separated by any whitespace (including line breaks)
+        pattern = r"\s+".join(rf"\m{word}\M" for word in words)
+        self.edit_operations.find_occurrence(pattern, regexp=True, backwards=backwards)
+
+    def close(self):
+        """Stop counting and close the panel."""
+        self.cancel_event.set()
+        if self.refresh_after_id is not None and self.window is not None:
+            self.window.after_cancel(self.refresh_after_id)
+            self.refresh_after_id = None
+        if self.window is not None:
+            if self.watch_after_id is not None:
+                self.window.after_cancel(self.watch_after_id)
+                self.watch_after_id = None
+            self.window.destroy()
+            self.window = None
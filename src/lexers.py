@@ -0,0 +1,278 @@
+"""
+Tk-free line lexers for syntax highlighting in Notexio text editor.
+
+A lexer turns one line into (start, end, token type) spans. Constructs that
+span lines (triple-quoted strings, fenced code blocks, block comments) are
+carried in a small hashable state: lex_line(line, state) returns the state
+at the start of the next line, so a document can be re-lexed from any line
+whose start state is known.
+"""
+import os
+import re
+
+
+# Token types (each has a "syntax_<type>" text tag)
+TOKEN_TYPES = (
+    "keyword", "builtin", "string", "comment", "number", "definition",
+    "constant", "key", "heading", "emphasis", "code", "link", "label",
+)
+
+
+class Lexer:
+    """Plain text: no tokens."""
+
+    name = "Plain text"
+    extensions = ()
+    rules = ()  # (token type, regex) pairs tried left to right
+    multiline_tokens = ()  # rule names handled by open_state
+
+    def __init__(self):
+        self.pattern = None
+        if self.rules:
+            self.pattern = re.compile("|".join(
+                f"(?P<{token_type}_{i}>{regex})" for i, (token_type, regex) in enumerate(self.rules)
+            ), re.MULTILINE)
+
+    @classmethod
+    def detect(cls, head):
+        """Score how likely it is that the first lines of a file use this language."""
+        return 0
+
+    def lex_line(self, line, state=None):
+        """Return (tokens, state at the start of the next line)."""
+        tokens = []
+        position = 0
+        if state is not None:
+            position, state = self.continue_state(line, state, tokens)
+            if state is not None:
+                return tokens, state
+        return tokens, self.scan(line, position, tokens)
+
+    def scan(self, line, position, tokens):
+        """Tokenize line from position; returns the state left open at its end."""
+        if self.pattern is None:
+            return None
+        while True:
+            match = self.pattern.search(line, position)
+            if match is None:
+                return None
+            token_type = match.lastgroup.rsplit("_", 1)[0]
+            if token_type in self.multiline_tokens:
+                state = self.open_state(line, match, tokens)
+                if state is not None:
+                    return state
+                position = tokens[-1][1]
+                continue
+            tokens.append((match.start(), match.end(), token_type))
+            position = max(match.end(), match.start() + 1)
+
+    def open_state(self, line, match, tokens):
+        """Start a multi-line construct; returns its state if it runs past the line."""
+        return None
+
+    def continue_state(self, line, state, tokens):
+        """Continue a multi-line construct; returns (position, state)."""
+        return 0, None
+
+
+def _words(words):
+    return r"\b(?:" + "|".join(words.split()) + r")\b"
+
+
+class PythonLexer(Lexer):
+    name = "Python"
+    extensions = (".py", ".pyw", ".pyi")
+    rules = (
+        ("comment", r"#.*"),
+        ("triple", r"(?:\b[rRbBuUfF]{1,2})?(?:'''|\"\"\")"),
+        ("string", r"(?:\b[rRbBuUfF]{1,2})?(?:'(?:[^'\\\n]|\\.)*'?|\"(?:[^\"\\\n]|\\.)*\"?)"),
+        ("definition", r"(?<=\bdef\s)\w+|(?<=\bclass\s)\w+"),
+        ("keyword", _words(
+            "and as assert async await break class continue def del elif else except finally for "
+            "from global if import in is lambda nonlocal not or pass raise return try while with yield "
+            "match case")),
+        ("constant", _words("True False None self cls")),
+        ("builtin", _words(
+            "abs all any bool bytes callable chr dict dir enumerate filter float format getattr "
+            "hasattr hash int isinstance issubclass iter len list map max min next object open "
+            "print range repr reversed round set setattr sorted str sum super tuple type zip "
+            "Exception ValueError TypeError KeyError IndexError OSError RuntimeError")),
+        ("number", r"\b(?:0[xX][0-9a-fA-F_]+|0[bB][01_]+|0[oO][0-7_]+|\d[\d_]*\.?\d*(?:[eE][+-]?\d+)?j?)\b"),
+        ("builtin", r"@\w+(?:\.\w+)*"),
+    )
+    multiline_tokens = ("triple",)
+
+    @classmethod
+    def detect(cls, head):
+        score = 0
+        if re.match(r"#!.*python", head):
+            score += 10
+        score += len(re.findall(r"^\s*(?:def|class|import|from\s+\S+\s+import)\b", head, re.MULTILINE)) * 2
+        score += len(re.findall(r":\s*$", head, re.MULTILINE))
+        return score
+
+    def open_state(self, line, match, tokens):
+        delimiter = match.group()[-3:]
+        end = line.find(delimiter, match.end())
+        if end == -1:
+            tokens.append((match.start(), len(line), "string"))
+            return delimiter
+        tokens.append((match.start(), end + 3, "string"))
+        return None
+
+    def continue_state(self, line, state, tokens):
+        end = line.find(state)
+        if end == -1:
+            if line:
+                tokens.append((0, len(line), "string"))
+            return len(line), state
+        tokens.append((0, end + 3, "string"))
+        return end + 3, None
+
+
+class JsonLexer(Lexer):
+    name = "JSON"
+    extensions = (".json", ".geojson", ".jsonl")
+    rules = (
+        ("key", r"\"(?:[^\"\\\n]|\\.)*\"(?=\s*:)"),
+        ("string", r"\"(?:[^\"\\\n]|\\.)*\"?"),
+        ("constant", _words("true false null")),
+        ("number", r"-?\b\d+(?:\.\d+)?(?:[eE][+-]?\d+)?\b"),
+    )
+
+    @classmethod
+    def detect(cls, head):
+        stripped = head.lstrip()
+        if not stripped.startswith(("{", "[")):
+            return 0
+        return 5 + min(5, len(re.findall(r"\"[^\"\n]*\"\s*:", head)))
+
+
+class MarkdownLexer(Lexer):
+    name = "Markdown"
+    extensions = (".md", ".markdown", ".mdown")
+    rules = (
+        ("code", r"`[^`\n]+`"),
+        ("emphasis", r"\*\*[^*\n]+\*\*|__[^_\n]+__|\*[^*\s][^*\n]*\*|\b_[^_\n]+_\b"),
+        ("link", r"!?\[[^\]\n]*\]\([^)\n]*\)|<https?://[^>\s]+>"),
+    )
+
+    _FENCE_RE = re.compile(r"^\s*(```|~~~)")
+    _HEADING_RE = re.compile(r"^#{1,6}(?:\s|$)")
+    _BLOCK_RE = re.compile(r"^\s*(?:>|[-*+]\s|\d+[.)]\s)")
+
+    @classmethod
+    def detect(cls, head):
+        score = len(re.findall(r"^#{1,6}\s", head, re.MULTILINE)) * 2
+        score += len(re.findall(r"^\s*```", head, re.MULTILINE)) * 2
+        score += len(re.findall(r"\[[^\]\n]+\]\([^)\n]+\)", head))
+        return score
+
+    def lex_line(self, line, state=None):
+        fence = self._FENCE_RE.match(line)
+        if state is not None:
+            # Inside a fenced code block until the matching fence
+            tokens = [(0, len(line), "code")] if line else []
+            return tokens, (None if fence and fence.group(1) == state else state)
+        if fence:
+            return [(0, len(line), "code")], fence.group(1)
+        if self._HEADING_RE.match(line):
+            return [(0, len(line), "heading")], None
+        tokens = []
+        block = self._BLOCK_RE.match(line)
+        position = 0
+        if block:
+            tokens.append((block.start(), block.end(), "keyword"))
+            position = block.end()
+        self.scan(line, position, tokens)
+        return tokens, None
+
+
+class AssemblyLexer(Lexer):
+    name = "Assembly"
+    extensions = (".s", ".asm", ".S", ".inc")
+    rules = (
+        ("comment", r"@.*|;.*|//.*|^\s*#.*"),
+        ("block", r"/\*"),
+        ("string", r"\"(?:[^\"\\\n]|\\.)*\"?|'(?:[^'\\\n]|\\.)'"),
+        ("definition", r"(?<![\w.])\.[A-Za-z_]\w*"),
+        ("builtin", r"\b(?:[rRxXwWvVqQdDsS]\d{1,2}|[sS][pP]|[lL][rR]|[pP][cC]|[fF][pP]|[iI][pP]|"
+                    r"[re]?[abcd]x|[re]?[sd]i|[re]?[sb]p|[abcd][lh]|r\d{1,2}[dwb]?)\b"),
+        ("number", r"#-?(?:0[xX][0-9a-fA-F]+|\d+)\b|\$-?(?:0[xX][0-9a-fA-F]+|\d+)\b|"
+                   r"\b(?:0[xX][0-9a-fA-F]+|\d+)\b"),
+    )
+    multiline_tokens = ("block",)
+
+    # Optional label, then the instruction mnemonic (directives are left to the rules)
+    _STATEMENT_RE = re.compile(r"^\s*(?:([A-Za-z_.$][\w.$]*):)?\s*([A-Za-z][\w.]*)?")
+
+    @classmethod
+    def detect(cls, head):
+        score = len(re.findall(r"^\s*\.(?:global|globl|text|data|section|bss|align)\b", head, re.MULTILINE)) * 3
+        score += len(re.findall(
+            r"^\s*(?:[A-Za-z_]\w*:\s*)?(?:mov|ldr|str|add|sub|cmp|b|bl|bx|beq|bne|bge|blt|push|pop|"
+            r"jmp|call|ret|lea|int|syscall)\b",
+            head, re.MULTILINE | re.IGNORECASE))
+        score += len(re.findall(r"^[A-Za-z_]\w*:\s*(?:[@;].*)?$", head, re.MULTILINE))
+        return score
+
+    def lex_line(self, line, state=None):
+        tokens = []
+        position = 0
+        if state is not None:
+            position, state = self.continue_state(line, state, tokens)
+            if state is not None:
+                return tokens, state
+        statement = self._STATEMENT_RE.match(line, position)
+        if statement and statement.end() > position:
+            if statement.group(1):
+                tokens.append((statement.start(1), statement.end(1), "label"))
+            if statement.group(2):
+                tokens.append((statement.start(2), statement.end(2), "keyword"))
+            position = statement.end()
+        return tokens, self.scan(line, position, tokens)
+
+    def open_state(self, line, match, tokens):
+        end = line.find("*/", match.end())
+        if end == -1:
+            tokens.append((match.start(), len(line), "comment"))
+            return "*/"
+        tokens.append((match.start(), end + 2, "comment"))
+        return None
+
+    def continue_state(self, line, state, tokens):
+        end = line.find("*/")
+        if end == -1:
+            if line:
+                tokens.append((0, len(line), "comment"))
+            return len(line), state
+        tokens.append((0, end + 2, "comment"))
+        return end + 2, None
+
+
+LEXERS = (PythonLexer, JsonLexer, MarkdownLexer, AssemblyLexer)
+
+# Extensions that say nothing about the content
+_GENERIC_EXTENSIONS = ("", ".txt", ".text", ".log", ".recovery")
+
+
+def select_lexer(filepath=None, head=""):
+    """Pick a lexer by file extension, falling back to the content of the first lines."""
+    if filepath:
+        name = os.path.basename(filepath)
+        # Recovery files keep the original name: note.txt_20251220_181829.recovery
+        if name.endswith(".recovery"):
+            name = name.rsplit("_", 2)[0]
+        extension = os.path.splitext(name)[1]
+        for lexer in LEXERS:
+            if extension in lexer.extensions or extension.lower() in lexer.extensions:
+                return lexer()
+        if extension.lower() not in _GENERIC_EXTENSIONS:
+            return Lexer()
+
+    best, best_score = None, 3
+    for lexer in LEXERS:
+        score = lexer.detect(head)
+        if score > best_score:
+            best, best_score = lexer, score
+    return best() if best else Lexer()
@@ -0,0 +1,211 @@
+"""
+Tail/follow mode for growing log files in Notexio text editor.
+"""
+import tkinter as tk
+from tkinter import filedialog, messagebox
+import codecs
+import os
+
+
+class LogFollower:
+    """Follows a growing file, appending only new bytes to the text widget."""
+
+    def __init__(self, editor, settings_manager):
+        self.editor = editor
+        self.settings_manager = settings_manager
+        self.filepath = None
+        self.text_widget = None
+        self.file = None
+        self.offset = 0
+        self.decoder = None
+        self.after_id = None
+        self.is_following = False
+
+    @property
+    def max_lines(self):
+        """Maximum number of lines kept in the buffer while following."""
+        return int(self.settings_manager.get_setting("follow_max_lines", 10000))
+
+    @property
+    def poll_interval(self):
+        """Timer interval in milliseconds between reads."""
+        return int(self.settings_manager.get_setting("follow_interval_ms", 250))
+
+    @property
+    def max_read_bytes(self):
+        """Upper bound of bytes read per timer tick to keep the UI responsive."""
+        return int(self.settings_manager.get_setting("follow_max_read_bytes", 4 * 1024 * 1024))
+
+    def toggle_follow(self):
+        """Start following a file, or stop if already following."""
+        if self.is_following:
+            self.stop()
+            return
+
+        filepath = self.editor.current_file
+        if not filepath or self.editor.is_modified:
+            filepath = filedialog.askopenfilename(
+                title="Follow File",
+                filetypes=[
+                    ("Log Files", "*.log"),
+                    ("Text Files", "*.txt"),
+                    ("All Files", "*.*")
+                ]
+            )
+        if filepath:
+            self.start(filepath)
+
+    def start(self, filepath):
+        """Start following a file from its tail."""
+        self.stop()
+        try:
+            self.file = open(filepath, 'rb')
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to follow file:\n{str(e)}")
+            return False
+
+        self.filepath = filepath
+        self.decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+
+        # Only load the part of the file that fits in the scrollback
+        size = os.fstat(self.file.fileno()).st_size
+        self.offset = self._find_tail_offset(size)
+
+        # Stay attached to this document even if another tab gets selected
+        self.text_widget = text_widget = self.editor.text_widget
+        # The undo stack would otherwise grow with every appended chunk
+        text_widget.config(undo=False)
+        text_widget.edit_reset()
+        text_widget.delete(1.0, tk.END)
+
+        self.editor.current_file = filepath
+        self.editor.is_modified = False
+        self.editor.update_title()
+
+        self.is_following = True
+        self.editor.is_following = True
+        self._update_status()
+        self._poll()
+        return True
+
+    def stop(self):
+        """Stop following the current file."""
+        if self.after_id is not None:
+            try:
+                self.editor.root.after_cancel(self.after_id)
+            except tk.TclError:
+                pass
+            self.after_id = None
+
+        if self.file:
+            try:
+                self.file.close()
+            except Exception:
+                pass
+            self.file = None
+
+        if self.is_following:
+            self.is_following = False
+            self.editor.is_following = False
+            try:
+                self.text_widget.config(undo=True)
+                self.text_widget.edit_reset()
+            except tk.TclError:
+                pass
+            self.text_widget = None
+            self._update_status()
+
+    def _find_tail_offset(self, size):
+        """Find the offset of the first of the last max_lines lines."""
+        block_size = 64 * 1024
+        newlines = 0
+        pos = size
+        while pos > 0:
+            read_size = min(block_size, pos)
+            pos -= read_size
+            self.file.seek(pos)
+            block = self.file.read(read_size)
+            count = block.count(b"\n")
+            if newlines + count > self.max_lines:
+                # Walk back to the exact line boundary inside this block
+                idx = len(block)
+                for _ in range(self.max_lines - newlines + 1):
+                    idx = block.rfind(b"\n", 0, idx)
+                return pos + idx + 1
+            newlines += count
+        return 0
+
+    def _poll(self):
+        """Read newly appended bytes and schedule the next read."""
+        self.after_id = None
+        if not self.is_following or not self.file:
+            return
+        if not self.text_widget.winfo_exists():
+            # The followed tab was closed
+            self.stop()
+            return
+
+        try:
+            size = os.fstat(self.file.fileno()).st_size
+            try:
+                disk_size = os.path.getsize(self.filepath)
+            except OSError:
+                disk_size = size
+
+            if disk_size < self.offset:
+                # File was truncated or rotated - start again from the top
+                self.file.close()
+                self.file = open(self.filepath, 'rb')
+                self.offset = 0
+                self.decoder.reset()
+                self.text_widget.delete(1.0, tk.END)
+                size = disk_size
+
+            if size > self.offset:
+                self.file.seek(self.offset)
+                data = self.file.read(min(size - self.offset, self.max_read_bytes))
+                self.offset += len(data)
+                self._append(self.decoder.decode(data))
+                # More data already waiting - read again as soon as Tk is idle
+                if self.offset < size:
+                    self.after_id = self.editor.root.after_idle(self._poll)
+                    return
+        except Exception as e:
+            self.stop()
+            messagebox.showerror("Error", f"Stopped following file:\n{str(e)}")
+            return
+
+        self.after_id = self.editor.root.after(self.poll_interval, self._poll)
+
+    def _append(self, text):
+        """Append a batch of text in a single insert and trim the scrollback."""
+        if not text:
+            return
+
+        text_widget = self.text_widget
+        # Only auto-scroll when the user is already looking at the end
+        at_bottom = text_widget.yview()[1] >= 0.999
+
+        text_widget.insert(tk.END + "-1c", text)
+
+        # Trim the top of the buffer in one delete
+        total_lines = int(text_widget.index(tk.END + "-1c").split('.')[0]) - 1
+        excess = total_lines - self.max_lines
+        if excess > 0:
+            text_widget.delete(1.0, f"{excess + 1}.0")
+
+        if at_bottom:
+            text_widget.see(tk.END)
+
+        text_widget.edit_modified(False)
+
+    def _update_status(self):
+        """Show follow state in the status bar."""
+        ui_components = getattr(self.editor, 'ui_components', None)
+        if ui_components and hasattr(ui_components, 'status_text') and ui_components.status_text:
+            if self.is_following:
+                ui_components.status_text.config(
+                    text=f"Following {os.path.basename(self.filepath)}"
+                )
+            else:
+                ui_components.update_status_bar()
@@ -0,0 +1,195 @@
+"""
+Tk-free Markdown parsing for Notexio text editor.
+
+Supports the subset used by docs/report.md: "#" to "###" headings,
+paragraphs (a line ending in two spaces is a hard break), "- " bullet lists,
+"---" rules, and **bold**, *italic*, _italic_, `code` and [text](url) inline.
+
+Every line's kind follows from the line alone, and a block is a run of
+paragraph or list lines or a single line of any other kind. Blocks are
+therefore parsed from a stream of lines, and an edit only needs the blocks
+around it parsed again (see MarkdownDocument).
+"""
+import bisect
+import os
+import re
+from collections import namedtuple
+
+
+MARKDOWN_EXTENSIONS = (".md", ".markdown", ".mdown")
+
+# kind: "h1" | "h2" | "h3" | "p" | "ul" | "hr" | "blank"; lines: the source lines
+Block = namedtuple("Block", "kind lines")
+
+# Kinds whose consecutive lines form one block
+_RUN_KINDS = ("p", "ul")
+
+
+def is_markdown_file(path):
+    return os.path.splitext(path or "")[1].lower() in MARKDOWN_EXTENSIONS
+
+
+def escape_xml(s):
+    return s.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+
+
+def line_kind(line):
+    """Block kind of one source line."""
+    stripped = line.strip()
+    if stripped == "":
+        return "blank"
+    if stripped == "---":
+        return "hr"
+    if line.startswith("# "):
+        return "h1"
+    if line.startswith("## "):
+        return "h2"
+    if line.startswith("### "):
+        return "h3"
+    if line.rstrip().startswith("- "):
+        return "ul"
+    return "p"
+
+
+def iter_blocks(lines):
+    """Yield the blocks of an iterable of lines as soon as each one ends."""
+    run_kind = None
+    run = []
+    for line in lines:
+        kind = line_kind(line)
+        if kind == run_kind:
+            run.append(line)
+            continue
+        if run:
+            yield Block(run_kind, tuple(run))
+        if kind in _RUN_KINDS:
+            run_kind, run = kind, [line]
+        else:
+            run_kind, run = None, []
+            yield Block(kind, (line,))
+    if run:
+        yield Block(run_kind, tuple(run))
+
+
+def heading_text(block):
+    return block.lines[0].split(" ", 1)[1].strip()
+
+
+def list_items(block):
+    return [line.rstrip()[2:].strip() for line in block.lines]
+
+
+_INLINE_RE = re.compile(
+    r"""
+    \[([^\]]+?)\]\((https?://[^)]+?)\)          # [text](url)
+    | \*\*([^*]+?)\*\*                         # **bold**
+    | `([^`]+?)`                               # `code`
+    | (?<!\*)\*(?!\*)([^*]+?)(?<!\*)\*(?!\*)   # *italic* (single asterisks)
+    | (?<!_)_(?!_)([^_]+?)(?<!_)_(?!_)         # _italic_ (single underscores)
+    """,
+    re.VERBOSE,
+)
+
+
+def iter_inline(text):
+    """Yield (style, text, url) spans of a line of inline markup.
+
+    style is None, "bold", "italic", "code" or "link"; url is only set for links.
+    """
+    last = 0
+    for match in _INLINE_RE.finditer(text):
+        if match.start() > last:
+            yield None, text[last:match.start()], None
+        link_text, link_url, bold, code, italic_star, italic_us = match.groups()
+        if link_text is not None:
+            yield "link", link_text, link_url
+        elif bold is not None:
+            yield "bold", bold, None
+        elif code is not None:
+            yield "code", code, None
+        else:
+            yield "italic", italic_star if italic_star is not None else italic_us, None
+        last = match.end()
+    if last < len(text):
+        yield None, text[last:], None
+
+
+def inline_to_reportlab_markup(text):
+    """Convert inline Markdown to ReportLab Paragraph markup (keeps "<br/>" breaks)."""
+    rendered = []
+    for segment in text.split("<br/>"):
+        out = []
+        for style, span, url in iter_inline(segment):
+            span = escape_xml(span)
+            if style == "link":
+                out.append(f'<link href="{escape_xml(url)}">{span}</link>')
+            elif style == "bold":
+                out.append(f"<b>{span}</b>")
+            elif style == "code":
+                out.append(f'<font face="Courier">{span}</font>')
+            elif style == "italic":
+                out.append(f"<i>{span}</i>")
+            else:
+                out.append(span)
+        rendered.append("".join(out))
+    return "<br/>".join(rendered)
+
+
+def paragraph_text(block):
+    """A paragraph's lines joined, with "<br/>" for hard breaks."""
+    parts = []
+    for line in block.lines:
+        parts.append(line.rstrip())
+        parts.append("<br/>" if line.endswith("  ") else " ")
+    return "".join(parts).strip()
+
+
+def block_markup(block):
+    """ReportLab markup of a block: a string, one string per item ("ul") or None."""
+    if block.kind in ("h1", "h2", "h3"):
+        return escape_xml(heading_text(block))
+    if block.kind == "p":
+        return inline_to_reportlab_markup(paragraph_text(block))
+    if block.kind == "ul":
+        return [inline_to_reportlab_markup(item) for item in list_items(block)]
+    return None
+
+
+class MarkdownDocument:
+    """The blocks of a Markdown text, kept current edit by edit."""
+
+    def __init__(self, text=""):
+        self.blocks = list(iter_blocks(text.split("\n")))
+        self.starts = []  # first line (1-based) of every block
+        self._update_starts(0)
+
+    def _update_starts(self, index):
+        line = self.starts[index - 1] + len(self.blocks[index - 1].lines) if index else 1
+        del self.starts[index:]
+        for block in self.blocks[index:]:
+            self.starts.append(line)
+            line += len(block.lines)
+
+    def block_at(self, line):
+        """Index of the block containing a line."""
+        return max(0, bisect.bisect_right(self.starts, line) - 1)
+
+    def apply_edit(self, first_line, old_text, new_text):
+        """Re-parse after whole lines from first_line changed from old_text to new_text.
+
+        Returns (index, removed, added): blocks[index:index + removed] were
+        replaced by the `added` blocks.
+        """
+        last_line = first_line + old_text.count("\n")
+        # A neighbouring block can merge with (or split from) the edited lines
+        first = max(0, self.block_at(first_line) - 1)
+        last = min(len(self.blocks) - 1, self.block_at(last_line) + 1)
+        start = self.starts[first]
+        lines = [line for block in self.blocks[first:last + 1] for line in block.lines]
+        lines[first_line - start:last_line - start + 1] = new_text.split("\n")
+
+        added = list(iter_blocks(lines))
+        removed = last - first + 1
+        self.blocks[first:last + 1] = added
+        self._update_starts(first)
+        return first, removed, added
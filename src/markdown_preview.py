@@ -0,0 +1,285 @@
+"""
+Live Markdown preview pane for Notexio text editor.
+"""
+import itertools
+import tkinter as tk
+
+from src.markdown_parser import MarkdownDocument, heading_text, is_markdown_file, iter_inline
+
+
+PREVIEW_FONT = "Segoe UI"
+CODE_FONT = "Courier New"
+
+# Tag options of the block kinds and inline styles
+PREVIEW_TAGS = {
+    "h1": {"font": (PREVIEW_FONT, 20, "bold"), "spacing1": 8, "spacing3": 4},
+    "h2": {"font": (PREVIEW_FONT, 16, "bold"), "spacing1": 6, "spacing3": 3},
+    "h3": {"font": (PREVIEW_FONT, 13, "bold"), "spacing1": 4, "spacing3": 2},
+    "ul": {"lmargin1": 12, "lmargin2": 28},
+    "hr": {"foreground": "#A0A0A0", "justify": tk.CENTER},
+    "bold": {"font": (PREVIEW_FONT, 11, "bold")},
+    "italic": {"font": (PREVIEW_FONT, 11, "italic")},
+    "code": {"font": (CODE_FONT, 10)},
+    "link": {"foreground": "#0078D4", "underline": True},
+}
+
+
+def block_spans(block):
+    """(text, tags) pieces of a block as shown in the preview.
+
+    Every block ends with a newline, so each one owns a non-empty range.
+    """
+    kind = block.kind
+    if kind in ("h1", "h2", "h3"):
+        return [(heading_text(block) + "\n", (kind,))]
+    if kind == "hr":
+        return [("─" * 24 + "\n", (kind,))]
+    if kind == "blank":
+        return [("\n", (kind,))]
+
+    spans = []
+    for number, line in enumerate(block.lines, 1):
+        text = line.rstrip()
+        if kind == "ul":
+            spans.append(("• ", (kind,)))
+            text = text[2:]
+        for style, span, _ in iter_inline(text.strip()):
+            spans.append((span, (kind, style) if style else (kind,)))
+        if kind == "ul" or number == len(block.lines) or line.endswith("  "):
+            spans.append(("\n", (kind,)))
+        else:
+            spans.append((" ", (kind,)))
+    return spans
+
+
+class MarkdownPreview:
+    """Renders the active Markdown document beside the editor as it is edited.
+
+    Edits are applied to a MarkdownDocument as they happen, which re-parses
+    only the blocks around them. Every block has an id that lasts until the
+    block changes, and a mark of that name at its start in the preview; on
+    idle, blocks whose id is gone are deleted and new ones inserted, so the
+    rest of the preview is left as it is. Scrolling either side scrolls the
+    other to the same block.
+    """
+
+    def __init__(self, editor, settings_manager):
+        self.editor = editor
+        self.settings_manager = settings_manager
+        self.visible = False
+        self.frame = None
+        self.text = None
+        self.widget = None  # document text widget being previewed
+        self.document = None
+        self.ids = []  # block id of every block of the document
+        self.blocks = {}  # block id -> block
+        self.rendered = []  # block ids in the preview, in order
+        self.next_id = itertools.count()
+        self.render_after_id = None
+        self.sync_after_id = None
+        self.source_line = None  # top line of the document at the last scroll sync
+        self.bound = False
+
+    def toggle(self):
+        """Show or hide the preview pane."""
+        self.set_visible(not self.visible)
+        self.settings_manager.set_setting("markdown_preview", self.visible)
+
+    def set_visible(self, visible):
+        self.visible = visible
+        if not visible:
+            if self.frame is not None:
+                self.frame.destroy()
+                self.frame = self.text = None
+            self.forget_document()
+            return
+        if not self.bound:
+            self.editor.add_text_widget_callback(self.bind_text_widget)
+            self.editor.add_text_delta_listener(self.on_text_delta)
+            self.bound = True
+        if self.frame is None:
+            self.create_pane()
+        self.update_document()
+
+    def create_pane(self):
+        """Preview text widget to the right of the document tabs."""
+        self.frame = tk.Frame(self.editor.text_container)
+        self.frame.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True, before=self.editor.notebook)
+        scrollbar = tk.Scrollbar(self.frame, orient=tk.VERTICAL, command=self.on_preview_scrollbar)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.text = tk.Text(
+            self.frame, wrap=tk.WORD, font=(PREVIEW_FONT, 11), padx=15, pady=15,
+            borderwidth=0, highlightthickness=0, cursor="arrow", yscrollcommand=scrollbar.set
+        )
+        self.text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        for tag, options in PREVIEW_TAGS.items():
+            self.text.tag_config(tag, **options)
+        self.text.config(state=tk.DISABLED)
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            # After the class binding has scrolled the preview
+            self.text.bind(sequence, lambda e: self.text.after_idle(self.sync_source), add="+")
+        if getattr(self.editor, 'theme_manager', None):
+            self.editor.theme_manager.register(self.text, "text")
+
+    def bind_text_widget(self, text_widget):
+        text_widget.bind("<<ViewportChanged>>", self.on_viewport_changed, add="+")
+
+    def forget_document(self):
+        self.widget = None
+        self.document = None
+        self.ids = []
+        self.blocks = {}
+        self.rendered = []
+        self.source_line = None
+
+    def update_document(self):
+        """Preview the active document, or explain why there is nothing to show."""
+        if not self.visible:
+            return
+        text_widget = self.editor.document_widget(self.editor.text_widget)
+        if not is_markdown_file(self.editor.current_file):
+            if self.widget is not None or not self.text.get(1.0, "end-1c"):
+                self.forget_document()
+                self.replace_text("Markdown preview: open a .md file to see it rendered here.")
+            return
+        if text_widget is self.widget:
+            return
+
+        self.forget_document()
+        self.replace_text("")
+        self.widget = text_widget
+        self.document = MarkdownDocument(text_widget.get(1.0, "end-1c"))
+        self.ids = [next(self.next_id) for _ in self.document.blocks]
+        self.blocks = dict(zip(self.ids, self.document.blocks))
+        self.schedule_render()
+
+    def replace_text(self, text):
+        self.text.config(state=tk.NORMAL)
+        self.text.mark_unset(*(mark for mark in self.text.mark_names() if mark.startswith("block")))
+        self.text.delete(1.0, tk.END)
+        self.text.insert(1.0, text)
+        self.text.config(state=tk.DISABLED)
+
+    def on_text_delta(self, text_widget, first_line, old_text, new_text):
+        """Re-parse the blocks around an edit; unchanged blocks keep their ids."""
+        if self.editor.document_widget(text_widget) is not self.widget or self.document is None:
+            return
+        index, removed, added = self.document.apply_edit(first_line, old_text, new_text)
+        old_ids = self.ids[index:index + removed]
+        old_blocks = [self.blocks.pop(block_id) for block_id in old_ids]
+        new_ids = [None] * len(added)
+        # The neighbours re-parsed with the edit are usually unchanged
+        head = 0
+        while head < min(len(old_ids), len(added)) and old_blocks[head] == added[head]:
+            new_ids[head] = old_ids[head]
+            head += 1
+        tail = 0
+        while (tail < min(len(old_ids), len(added)) - head
+               and old_blocks[-1 - tail] == added[-1 - tail]):
+            new_ids[-1 - tail] = old_ids[-1 - tail]
+            tail += 1
+        self.ids[index:index + removed] = [
+            block_id if block_id is not None else next(self.next_id) for block_id in new_ids
+        ]
+        for block_id, block in zip(self.ids[index:index + len(added)], added):
+            self.blocks[block_id] = block
+        self.schedule_render()
+
+    def schedule_render(self):
+        if self.render_after_id is None:
+            self.render_after_id = self.text.after_idle(self.render)
+
+    def render(self):
+        """Delete the blocks that changed from the preview and insert their replacements."""
+        self.render_after_id = None
+        if self.text is None or self.document is None:
+            return
+        alive = set(self.ids)
+        self.text.config(state=tk.NORMAL)
+
+        # Backwards, so a block ends where the next block that stays begins
+        end = "end-1c"
+        for block_id in reversed(self.rendered):
+            mark = f"block{block_id}"
+            if block_id in alive:
+                end = mark
+            else:
+                self.text.delete(mark, end)
+                self.text.mark_unset(mark)
+
+        # Backwards again: text inserted at a block's mark goes before it
+        # (marks have right gravity), and the new block's mark is set after
+        following = "end-1c"
+        rendered = set(self.rendered)
+        for block_id in reversed(self.ids):
+            mark = f"block{block_id}"
+            if block_id not in rendered:
+                start = self.text.index(following)
+                pieces = []
+                for text, tags in block_spans(self.blocks[block_id]):
+                    pieces += [text, tags]
+                self.text.insert(start, *pieces)
+                self.text.mark_set(mark, start)
+            following = mark
+
+        self.text.config(state=tk.DISABLED)
+        self.rendered = list(self.ids)
+        self.source_line = None
+        self.sync_preview()
+
+    def on_viewport_changed(self, event):
+        if self.widget is not None and event.widget is self.source_view() and self.sync_after_id is None:
+            self.sync_after_id = self.text.after_idle(self.sync_preview)
+
+    def source_view(self):
+        """The pane of the previewed document that has focus (a document may be split)."""
+        text_widget = self.editor.text_widget
+        return text_widget if self.editor.document_widget(text_widget) is self.widget else self.widget
+
+    def block_lines(self, position):
+        """First preview line of the block at a position in self.rendered, and of the next."""
+        first = int(self.text.index(f"block{self.rendered[position]}").split(".")[0])
+        if position + 1 < len(self.rendered):
+            following = f"block{self.rendered[position + 1]}"
+        else:
+            following = "end-1c"
+        return first, int(self.text.index(following).split(".")[0])
+
+    def sync_preview(self):
+        """Scroll the preview to the block at the top of the document."""
+        self.sync_after_id = None
+        if self.widget is None or not self.rendered or self.rendered != self.ids:
+            return
+        top = int(self.source_view().index("@0,0").split(".")[0])
+        if top == self.source_line:
+            # Scrolled here from the preview
+            return
+        self.source_line = top
+        position = self.document.block_at(top)
+        fraction = (top - self.document.starts[position]) / len(self.document.blocks[position].lines)
+        first, following = self.block_lines(position)
+        self.text.yview(f"{first + int(fraction * (following - first))}.0")
+
+    def on_preview_scrollbar(self, *args):
+        self.text.yview(*args)
+        self.sync_source()
+
+    def sync_source(self):
+        """Scroll the document to the block at the top of the preview."""
+        if self.widget is None or not self.rendered or self.rendered != self.ids:
+            return
+        top = self.text.index("@0,0")
+        # Last block starting at or above the top of the preview
+        low, high = 0, len(self.rendered) - 1
+        while low < high:
+            middle = (low + high + 1) // 2
+            if self.text.compare(f"block{self.rendered[middle]}", "<=", top):
+                low = middle
+            else:
+                high = middle - 1
+        first, following = self.block_lines(low)
+        line = int(top.split(".")[0])
+        fraction = (line - first) / max(1, following - first)
+        lines = len(self.document.blocks[low].lines)
+        self.source_line = self.document.starts[low] + int(fraction * lines)
+        self.source_view().yview(f"{self.source_line}.0")
@@ -6,6 +6,10 @@ from tkinter import filedialog, messagebox
 import os
 import sys
 
+from src.markdown_parser import is_markdown_file
+from src.pdf_export_dialog import PdfExportDialog
+from src.print_preview import PrintPreview
+
 
 class MiscFeatures:
     """Manages miscellaneous features like drag & drop, print, and PDF export."""
@@ -13,6 +17,7 @@ class MiscFeatures:
     def __init__(self, editor, file_manager):
         self.editor = editor
         self.file_manager = file_manager
+        self.pdf_export_dialog = None
         
     def enable_drag_drop(self):
         """Enable drag and drop file opening."""
@@ -116,48 +121,14 @@ class MiscFeatures:
             messagebox.showerror("Print Error", f"Failed to print:\n{str(e)}")
             
     def print_preview(self):
-        """Show print preview (simplified - shows content in message box)."""
-        content = self.editor.text_widget.get(1.0, tk.END + "-1c")
-        
-        # Create preview window
-        preview = tk.Toplevel(self.editor.root)
-        preview.title("Print Preview")
-        preview.geometry("600x700")
-        
-        # Create text widget for preview
-        from tkinter import scrolledtext
-        preview_text = scrolledtext.ScrolledText(
-            preview,
-            wrap=tk.WORD,
-            font=("Courier", 10)
-        )
-        preview_text.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
-        preview_text.insert(1.0, content)
-        preview_text.config(state=tk.DISABLED)
-        
-        # Print button
-        button_frame = tk.Frame(preview)
-        button_frame.pack(pady=10)
-        
-        tk.Button(
-            button_frame,
-            text="Print",
-            command=lambda: [preview.destroy(), self.print_file()]
-        ).pack(side=tk.LEFT, padx=5)
-        
-        tk.Button(
-            button_frame,
-            text="Close",
-            command=preview.destroy
-        ).pack(side=tk.LEFT, padx=5)
+        """Show the document paginated as it would be printed to PDF."""
+        PrintPreview(self.editor, self.print_file)
         
     def export_as_pdf(self):
-        """Export document as PDF."""
+        """Export document as PDF; Markdown files are exported formatted."""
         try:
-            from reportlab.lib.pagesizes import letter
-            from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
-            from reportlab.lib.styles import getSampleStyleSheet
-            from reportlab.lib.units import inch
+            # Fail early if reportlab is missing, before asking for a file name
+            import reportlab  # noqa: F401
             
             # Get content
             content = self.editor.text_widget.get(1.0, tk.END + "-1c")
@@ -170,26 +141,15 @@ class MiscFeatures:
             )
             
             if filepath:
-                # Create PDF
-                doc = SimpleDocTemplate(filepath, pagesize=letter)
-                styles = getSampleStyleSheet()
-                story = []
-                
-                # Split content into paragraphs
-                paragraphs = content.split('\n')
-                
-                for para in paragraphs:
-                    if para.strip():
-                        p = Paragraph(para.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;'), styles['Normal'])
-                        story.append(p)
-                        story.append(Spacer(1, 0.2*inch))
-                    else:
-                        story.append(Spacer(1, 0.1*inch))
-                        
-                # Build PDF
-                doc.build(story)
-                
-                messagebox.showinfo("Export PDF", f"Document exported successfully to:\n{filepath}")
+                # Written in the background; the dialog reports the outcome
+                current_file = self.editor.current_file
+                if self.pdf_export_dialog is None:
+                    self.pdf_export_dialog = PdfExportDialog(self.editor)
+                self.pdf_export_dialog.start(
+                    content, filepath,
+                    markdown=is_markdown_file(current_file),
+                    title=os.path.splitext(os.path.basename(current_file or ""))[0]
+                )
                 
         except ImportError:
             messagebox.showerror(
@@ -198,4 +158,3 @@ class MiscFeatures:
             )
         except Exception as e:
             messagebox.showerror("Export PDF Error", f"Failed to export PDF:\n{str(e)}")
-
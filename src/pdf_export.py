@@ -0,0 +1,471 @@
+"""
+Tk-free PDF export for Notexio text editor.
+
+Text is set in Courier, so every character has the same width and a line's
+width is its length: wrapping and page breaks are plain arithmetic on
+precomputed page metrics, and PageLayout can be shared with anything that
+needs to agree with the PDF about where pages break. Pages are rendered one
+at a time while the lines are streamed from the document and written
+straight to the file, so no per-line flowables are built; large documents
+are rendered in chunks by a process pool.
+
+Markdown documents are exported as formatted text instead, laid out by
+ReportLab from the blocks of src/markdown_parser.py.
+"""
+import collections
+import itertools
+import os
+import re
+import tempfile
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+
+from src.file_io import replacement_mode
+from src.markdown_parser import block_markup, iter_blocks
+
+# Documents at least this large are rendered in parallel, in chunks of CHUNK_SIZE characters
+PARALLEL_MIN_SIZE = 4 * 1024 * 1024
+CHUNK_SIZE = 1024 * 1024
+
+# Page footer, shared with scripts/generate_report_pdf.py: "Page N" at the bottom right
+FOOTER_FONT = "Helvetica"
+FOOTER_FONT_SIZE = 9
+FOOTER_GRAY = 0.35
+FOOTER_RIGHT = 54  # 0.75 inch from the right edge
+FOOTER_Y = 43.2  # 0.6 inch from the bottom
+
+
+class ExportCancelled(Exception):
+    """Raised when an export is cancelled through its cancel event."""
+
+
+# Control characters (tabs are expanded first) print as spaces
+_CONTROL_RE = re.compile(r"[\x00-\x1f\x7f]")
+_NON_ASCII_RE = re.compile(r"[^\x00-\x7f]")
+
+
+def _octal_escape(match):
+    # Standard fonts use WinAnsiEncoding (cp1252)
+    return "\\%03o" % match.group().encode("cp1252")[0]
+
+
+def page_text_operators(rows):
+    """PDF content stream operators showing rows one leading apart.
+
+    The rows of a page are escaped as one string instead of one call per
+    row, which is most of the cost of writing a page.
+    """
+    text = "\n".join(rows).replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+    if not text.isascii():
+        text = _NON_ASCII_RE.sub(_octal_escape, text)
+    return "(" + text.replace("\n", ") Tj T* (") + ") Tj"
+
+
+def footer_text(page_number):
+    return f"Page {page_number}"
+
+
+def draw_footer(canvas, page_number, page_width):
+    """Draw the page footer on a reportlab canvas."""
+    canvas.saveState()
+    canvas.setFont(FOOTER_FONT, FOOTER_FONT_SIZE)
+    canvas.setFillGray(FOOTER_GRAY)
+    canvas.drawRightString(page_width - FOOTER_RIGHT, FOOTER_Y, footer_text(page_number))
+    canvas.restoreState()
+
+
+def footer_operators(page_number, page_width):
+    """The footer of draw_footer as content stream operators."""
+    from reportlab.pdfbase.pdfmetrics import stringWidth
+
+    text = footer_text(page_number)
+    x = page_width - FOOTER_RIGHT - stringWidth(text, FOOTER_FONT, FOOTER_FONT_SIZE)
+    return f"q {FOOTER_GRAY:g} g BT /F2 {FOOTER_FONT_SIZE:g} Tf {x:.2f} {FOOTER_Y:g} Td ({text}) Tj ET Q"
+
+
+def iter_lines(content, start=0):
+    """Lines of a string (from offset start) without splitting it into a list."""
+    while True:
+        end = content.find("\n", start)
+        if end == -1:
+            yield content[start:]
+            return
+        yield content[start:end]
+        start = end + 1
+
+
+class PageLayout:
+    """Monospace page geometry (in points) and the rows each page holds."""
+
+    FONT_NAME = "Courier"
+    CHAR_WIDTH = 0.6  # Courier advance width in em (600/1000 for every glyph)
+
+    def __init__(self, page_width=612, page_height=792, margin=54, font_size=9, leading=None, tab_size=4):
+        # 612 x 792 is US Letter, the page size used before
+        self.page_width = page_width
+        self.page_height = page_height
+        self.margin = margin
+        self.font_size = font_size
+        self.leading = leading or font_size * 1.2
+        self.tab_size = tab_size
+        self.char_width = font_size * self.CHAR_WIDTH
+        # The epsilon keeps exact fits from being lost to float rounding
+        self.columns = max(1, int((page_width - 2 * margin + 1e-6) // self.char_width))
+        self.rows = max(1, int((page_height - 2 * margin + 1e-6) // self.leading))
+
+    def clean(self, line):
+        """A line as it is printed: tabs expanded, control characters and
+        characters Courier has no glyph for replaced."""
+        if "\t" in line:
+            line = line.expandtabs(self.tab_size)
+        if not line.isascii():
+            line = line.encode("cp1252", "replace").decode("cp1252")
+        if not line.isprintable():
+            line = _CONTROL_RE.sub(" ", line)
+        return line
+
+    def row_count(self, line):
+        """Number of printed rows of one line (what len(wrap(line)) would be)."""
+        return max(1, -(-len(self.clean(line)) // self.columns))
+
+    def wrap(self, line):
+        """Printed rows of one line (an empty line is one empty row)."""
+        line = self.clean(line)
+        columns = self.columns
+        if len(line) <= columns:
+            return [line]
+        return [line[i:i + columns] for i in range(0, len(line), columns)]
+
+    def iter_pages(self, lines):
+        """Yield (rows, line, row) for every page, where line is the number of
+        the line at the top of the page and row its first row printed there
+        (non-zero when the page continues a wrapped line)."""
+        rows_per_page = self.rows
+        page = []
+        top = (1, 0)
+        for line_number, line in enumerate(lines, 1):
+            for row_number, row in enumerate(self.wrap(line)):
+                if len(page) == rows_per_page:
+                    yield page, *top
+                    page = []
+                    top = (line_number, row_number)
+                page.append(row)
+        # An empty document still has one (empty) page
+        yield page, *top
+
+    def iter_page_starts(self, content):
+        """Yield (offset of the line, line number, row) for the top of every page.
+
+        These are the page breaks of iter_pages, found by counting rows
+        instead of building them, so a document can be paginated without
+        rendering it.
+        """
+        rows_per_page = self.rows
+        used = 0  # rows on the current page
+        offset = 0
+        yield 0, 1, 0
+        for line_number, line in enumerate(iter_lines(content), 1):
+            rows = self.row_count(line)
+            # Row of this line that would start the next page
+            first = rows_per_page - used
+            while first < rows:
+                yield offset, line_number, first
+                first += rows_per_page
+            used = rows - first + rows_per_page
+            offset += len(line) + 1
+
+    def page_rows(self, content, offset, row):
+        """Rows of the page starting at row of the line at offset (see iter_page_starts)."""
+        rows = (printed for line in iter_lines(content, offset) for printed in self.wrap(line))
+        return list(itertools.islice(rows, row, row + self.rows))
+
+
+def render_page(rows, page_number, layout):
+    """Compressed content stream of one page: its rows and the footer."""
+    top = layout.page_height - layout.margin - layout.font_size
+    operators = (
+        f"BT /F1 {layout.font_size:g} Tf {layout.leading:g} TL 1 0 0 1 {layout.margin:g} {top:g} Tm "
+        f"{page_text_operators(rows)} ET\n{footer_operators(page_number, layout.page_width)}"
+    )
+    return zlib.compress(operators.encode("ascii"), 6)
+
+
+class PdfFileWriter:
+    """Writes a PDF of Courier text pages straight to disk as pages arrive.
+
+    Only page content streams are added, so the file is assembled from
+    parts rendered anywhere (in order) and the bytes depend only on the
+    pages. Nothing time- or run-specific is written. The file appears under
+    its name when closed; abort() leaves nothing behind.
+    """
+
+    # Fixed objects; page i (from 0) has content 6 + 2i and page object 7 + 2i
+    CATALOG, PAGES, FONT, FOOTER_FONT, INFO, FIRST_PAGE = 1, 2, 3, 4, 5, 6
+
+    def __init__(self, pdf_path, layout):
+        self.pdf_path = pdf_path
+        self.layout = layout
+        directory = os.path.dirname(os.path.abspath(pdf_path))
+        fd, self.temp_path = tempfile.mkstemp(dir=directory, prefix=".notexio-", suffix=".pdf.tmp")
+        self.file = os.fdopen(fd, "wb")
+        self.offsets = {}
+        self.page_count = 0
+        self.file.write(b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n")
+        self._object(self.FONT, f"<< /Type /Font /Subtype /Type1 /BaseFont /{layout.FONT_NAME} "
+                                "/Encoding /WinAnsiEncoding >>")
+        self._object(self.FOOTER_FONT, f"<< /Type /Font /Subtype /Type1 /BaseFont /{FOOTER_FONT} "
+                                       "/Encoding /WinAnsiEncoding >>")
+        self._object(self.INFO, "<< /Producer (Notexio) >>")
+
+    def _object(self, number, body, stream=None):
+        self.offsets[number] = self.file.tell()
+        self.file.write(f"{number} 0 obj\n{body}\n".encode("ascii"))
+        if stream is not None:
+            self.file.write(b"stream\n" + stream + b"\nendstream\n")
+        self.file.write(b"endobj\n")
+
+    def add_page(self, stream):
+        """Append a page given its compressed content stream (see render_page)."""
+        content = self.FIRST_PAGE + 2 * self.page_count
+        self._object(content, f"<< /Length {len(stream)} /Filter /FlateDecode >>", stream)
+        self._object(
+            content + 1,
+            f"<< /Type /Page /Parent {self.PAGES} 0 R "
+            f"/MediaBox [0 0 {self.layout.page_width:g} {self.layout.page_height:g}] "
+            f"/Resources << /Font << /F1 {self.FONT} 0 R /F2 {self.FOOTER_FONT} 0 R >> >> "
+            f"/Contents {content} 0 R >>"
+        )
+        self.page_count += 1
+
+    def close(self):
+        """Write the page tree and cross-reference table and move the file into place."""
+        kids = " ".join(f"{self.FIRST_PAGE + 2 * i + 1} 0 R" for i in range(self.page_count))
+        self._object(self.PAGES, f"<< /Type /Pages /Kids [{kids}] /Count {self.page_count} >>")
+        self._object(self.CATALOG, f"<< /Type /Catalog /Pages {self.PAGES} 0 R >>")
+        size = self.FIRST_PAGE + 2 * self.page_count
+        xref = self.file.tell()
+        entries = ["xref", f"0 {size}", "0000000000 65535 f "]
+        entries.extend(f"{self.offsets[number]:010d} 00000 n " for number in range(1, size))
+        self.file.write(("\n".join(entries) + "\n").encode("ascii"))
+        self.file.write(
+            f"trailer\n<< /Size {size} /Root {self.CATALOG} 0 R /Info {self.INFO} 0 R >>\n"
+            f"startxref\n{xref}\n%%EOF\n".encode("ascii")
+        )
+        self.file.close()
+        # mkstemp creates the file private to its owner
+        os.chmod(self.temp_path, replacement_mode(self.pdf_path))
+        os.replace(self.temp_path, self.pdf_path)
+
+    def abort(self):
+        """Drop the partly written file."""
+        self.file.close()
+        try:
+            os.unlink(self.temp_path)
+        except OSError:
+            pass
+
+
+def _count_rows(text, layout):
+    """Worker: (lines, printed rows) of a chunk of whole lines."""
+    lines = rows = 0
+    for line in iter_lines(text):
+        lines += 1
+        rows += layout.row_count(line)
+    return lines, rows
+
+
+def _render_pages(text, skip_rows, page_count, first_page, layout):
+    """Worker: render page_count pages from the rows of text, after skip_rows rows."""
+    rows = itertools.islice(
+        (row for line in iter_lines(text) for row in layout.wrap(line)), skip_rows, None
+    )
+    return [
+        render_page(list(itertools.islice(rows, layout.rows)), first_page + i, layout)
+        for i in range(page_count)
+    ]
+
+
+def _chunk_bounds(content, chunk_size):
+    """(start, end) offsets of chunks of whole lines, about chunk_size characters each."""
+    bounds = []
+    start = 0
+    while True:
+        end = content.find("\n", start + chunk_size)
+        if end == -1:
+            bounds.append((start, len(content)))
+            return bounds
+        bounds.append((start, end))
+        start = end + 1
+
+
+def _render_in_parallel(content, writer, layout, progress, cancel_event, workers, mp_context):
+    """Render pages chunk by chunk in a process pool and add them to writer in order.
+
+    A first pass counts the printed rows of every chunk, which gives the
+    number and row offset of the first page starting in it. Each chunk is
+    then rendered with enough of the following lines to fill its last page,
+    so pages come out exactly as a sequential export would write them.
+    """
+    bounds = _chunk_bounds(content, CHUNK_SIZE)
+    rows_per_page = layout.rows
+    with ProcessPoolExecutor(max_workers=workers, mp_context=mp_context) as pool:
+        try:
+            counts = list(pool.map(_count_rows, (content[start:end] for start, end in bounds),
+                                   itertools.repeat(layout)))
+            tasks = []
+            first_row = first_line = 0
+            for (start, end), (lines, rows) in zip(bounds, counts):
+                # Pages whose top row falls in this chunk
+                first_page = -(-first_row // rows_per_page)
+                page_count = -(-(first_row + rows) // rows_per_page) - first_page
+                if page_count:
+                    # A page started here can take up to a page of rows (so of lines) from later chunks
+                    lookahead = end
+                    for _ in range(rows_per_page):
+                        if lookahead >= len(content):
+                            break
+                        lookahead = content.find("\n", lookahead + 1)
+                        if lookahead == -1:
+                            lookahead = len(content)
+                    tasks.append((start, lookahead, first_page * rows_per_page - first_row,
+                                  page_count, first_page + 1, first_line + lines))
+                first_row += rows
+                first_line += lines
+
+            pending = collections.deque()
+            tasks = iter(tasks)
+            while True:
+                # Keep the pool fed, but only a few chunks of pages in memory
+                while len(pending) < workers * 2:
+                    task = next(tasks, None)
+                    if task is None:
+                        break
+                    start, end, skip_rows, page_count, first_page, last_line = task
+                    future = pool.submit(_render_pages, content[start:end], skip_rows, page_count,
+                                         first_page, layout)
+                    pending.append((future, last_line))
+                if not pending:
+                    return
+                future, last_line = pending.popleft()
+                for stream in future.result():
+                    writer.add_page(stream)
+                if cancel_event is not None and cancel_event.is_set():
+                    raise ExportCancelled()
+                if progress is not None:
+                    progress(last_line)
+        except BaseException:
+            pool.shutdown(wait=False, cancel_futures=True)
+            raise
+
+
+def export_text_to_pdf(content, pdf_path, layout=None, progress=None, cancel_event=None,
+                       workers=1, mp_context=None):
+    """Export plain text to a PDF file. Raises ImportError without reportlab.
+
+    progress(line number) is called as pages are written; setting
+    cancel_event stops the export with ExportCancelled and writes nothing.
+    Documents larger than PARALLEL_MIN_SIZE are rendered by a pool of
+    workers (0 for one per CPU); the file is the same either way.
+    """
+    # Font metrics for the footer; fail before creating anything
+    from reportlab.pdfbase import pdfmetrics  # noqa: F401
+
+    layout = layout or PageLayout()
+    workers = workers or os.cpu_count() or 1
+    writer = PdfFileWriter(pdf_path, layout)
+    try:
+        if workers > 1 and len(content) >= PARALLEL_MIN_SIZE:
+            _render_in_parallel(content, writer, layout, progress, cancel_event, workers, mp_context)
+        else:
+            for page_number, (rows, line_number, _) in enumerate(layout.iter_pages(iter_lines(content)), 1):
+                if cancel_event is not None and cancel_event.is_set():
+                    raise ExportCancelled()
+                writer.add_page(render_page(rows, page_number, layout))
+                if progress is not None:
+                    progress(line_number)
+        writer.close()
+    except BaseException:
+        writer.abort()
+        raise
+
+
+# Paragraph styles of Markdown export: name -> (parent in the sample stylesheet, ParagraphStyle options)
+MARKDOWN_STYLES = {
+    "title": ("Title", {"fontName": "Helvetica-Bold", "fontSize": 20, "leading": 24, "spaceAfter": 12}),
+    "h2": ("Heading2", {"fontName": "Helvetica-Bold", "fontSize": 13, "leading": 16,
+                        "spaceBefore": 10, "spaceAfter": 6}),
+    "h3": ("Heading3", {"fontName": "Helvetica-Bold", "fontSize": 11, "leading": 14,
+                        "spaceBefore": 8, "spaceAfter": 4}),
+    "body": ("BodyText", {"fontName": "Helvetica", "fontSize": 10.5, "leading": 14, "spaceAfter": 6}),
+    "small": ("BodyText", {"fontName": "Helvetica", "fontSize": 9.5, "leading": 12, "spaceAfter": 4,
+                           "textColor": "#333333"}),
+}
+# Page margins in inches
+MARKDOWN_MARGINS = {"leftMargin": 0.85, "rightMargin": 0.85, "topMargin": 0.85, "bottomMargin": 0.9}
+
+
+def render_markdown_pdf(markup, pdf_path, title="", cancel_event=None):
+    """Lay out (block kind, markup) pairs (see markdown_parser.block_markup) as a PDF.
+
+    Raises ImportError without reportlab, or ExportCancelled before anything
+    is written when cancel_event is set.
+    """
+    from reportlab.lib.pagesizes import letter
+    from reportlab.lib.units import inch
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, ListFlowable, ListItem
+
+    sample = getSampleStyleSheet()
+    styles = {
+        name: ParagraphStyle(f"Notexio{name.title()}", parent=sample[parent], **options)
+        for name, (parent, options) in MARKDOWN_STYLES.items()
+    }
+    heading_styles = {"h1": styles["title"], "h2": styles["h2"], "h3": styles["h3"]}
+
+    def footer(canvas, doc):
+        draw_footer(canvas, doc.page, doc.pagesize[0])
+
+    doc = SimpleDocTemplate(
+        pdf_path,
+        pagesize=letter,
+        title=title,
+        author="Notexio",
+        **{name: inches * inch for name, inches in MARKDOWN_MARGINS.items()},
+    )
+
+    story = []
+    for kind, markup_text in markup:
+        if cancel_event is not None and cancel_event.is_set():
+            raise ExportCancelled()
+        if kind == "blank":
+            story.append(Spacer(1, 0.12 * inch))
+        elif kind == "hr":
+            story.append(Spacer(1, 0.12 * inch))
+            story.append(Paragraph("—" * 64, styles["small"]))
+            story.append(Spacer(1, 0.12 * inch))
+        elif kind in heading_styles:
+            story.append(Paragraph(markup_text, heading_styles[kind]))
+        elif kind == "p":
+            story.append(Paragraph(markup_text, styles["body"]))
+        elif kind == "ul":
+            items = [ListItem(Paragraph(item, styles["body"]), leftIndent=12) for item in markup_text]
+            story.append(ListFlowable(
+                items,
+                bulletType="bullet",
+                start="bullet",
+                leftIndent=18,
+                bulletFontName="Helvetica",
+                bulletFontSize=9,
+                bulletOffsetY=2,
+            ))
+            story.append(Spacer(1, 0.06 * inch))
+
+    doc.build(story, onFirstPage=footer, onLaterPages=footer)
+
+
+def export_markdown_to_pdf(content, pdf_path, title="", cancel_event=None):
+    """Export Markdown as a formatted PDF. Raises ImportError without reportlab."""
+    blocks = iter_blocks(iter_lines(content))
+    render_markdown_pdf(
+        ((block.kind, block_markup(block)) for block in blocks), pdf_path, title, cancel_event
+    )
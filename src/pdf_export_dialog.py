@@ -0,0 +1,128 @@
+"""
+PDF export progress dialog for Notexio text editor.
+"""
+import multiprocessing
+import queue
+import threading
+import tkinter as tk
+from tkinter import messagebox, ttk
+
+from src.pdf_export import ExportCancelled, export_markdown_to_pdf, export_text_to_pdf
+
+
+class PdfExportDialog:
+    """Exports a document to PDF in a background thread with progress and cancel."""
+
+    POLL_INTERVAL = 100  # ms
+
+    def __init__(self, editor):
+        self.editor = editor
+        self.dialog = None
+        self.thread = None
+        self.cancel_event = threading.Event()
+        self.messages = queue.Queue()
+
+    def is_running(self):
+        return self.thread is not None and self.thread.is_alive()
+
+    def start(self, content, pdf_path, markdown=False, title=""):
+        """Export content to pdf_path; the editor stays usable meanwhile.
+
+        Markdown is exported as formatted text, with an indeterminate progress bar.
+        """
+        if self.is_running():
+            self.dialog.lift()
+            return
+
+        self.pdf_path = pdf_path
+        self.total_lines = content.count("\n") + 1
+        # A fresh queue, so messages of an earlier export are dropped
+        self.messages = queue.Queue()
+        self.cancel_event.clear()
+
+        self.dialog = tk.Toplevel(self.editor.root)
+        self.dialog.title("Export as PDF")
+        self.dialog.geometry("360x120")
+        self.dialog.resizable(False, False)
+        self.dialog.transient(self.editor.root)
+        self.dialog.protocol("WM_DELETE_WINDOW", self.cancel)
+
+        self.progress_label = tk.Label(self.dialog, text="Starting...", anchor=tk.W)
+        self.progress_label.pack(fill=tk.X, padx=10, pady=(10, 5))
+        if markdown:
+            self.progress_bar = ttk.Progressbar(self.dialog, mode="indeterminate")
+            self.progress_bar.start()
+            self.progress_label.config(text="Laying out Markdown...")
+        else:
+            self.progress_bar = ttk.Progressbar(self.dialog, maximum=self.total_lines)
+        self.progress_bar.pack(fill=tk.X, padx=10)
+        self.cancel_button = tk.Button(self.dialog, text="Cancel", command=self.cancel)
+        self.cancel_button.pack(pady=10)
+        self.editor.theme_dialog(self.dialog)
+
+        self.thread = threading.Thread(
+            target=self._worker,
+            args=(self.messages, content, pdf_path, markdown, title),
+            daemon=True
+        )
+        self.thread.start()
+        self.dialog.after(self.POLL_INTERVAL, self._poll)
+
+    def _worker(self, messages, content, pdf_path, markdown, title):
+        """Write the PDF and report through a queue (Tk is only used by _poll)."""
+        try:
+            if markdown:
+                export_markdown_to_pdf(content, pdf_path, title, cancel_event=self.cancel_event)
+                messages.put(("done", None))
+                return
+            # Large documents use every core; spawned workers do not inherit the Tk interpreter
+            export_text_to_pdf(
+                content, pdf_path,
+                progress=lambda line: messages.put(("progress", line)),
+                cancel_event=self.cancel_event,
+                workers=0,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+            messages.put(("done", None))
+        except ExportCancelled:
+            messages.put(("cancelled", None))
+        except Exception as e:
+            messages.put(("error", e))
+
+    def _poll(self):
+        """Show the latest progress; close when the export has finished."""
+        if self.dialog is None or not self.dialog.winfo_exists():
+            return
+        line = None
+        outcome = None
+        try:
+            while outcome is None:
+                kind, value = self.messages.get_nowait()
+                if kind == "progress":
+                    line = value
+                else:
+                    outcome = (kind, value)
+        except queue.Empty:
+            pass
+
+        if line is not None:
+            self.progress_bar.config(value=line)
+            self.progress_label.config(text=f"Line {line:,} of {self.total_lines:,}")
+        if outcome is None:
+            self.dialog.after(self.POLL_INTERVAL, self._poll)
+            return
+
+        self.dialog.destroy()
+        self.dialog = None
+        kind, value = outcome
+        if kind == "done":
+            messagebox.showinfo("Export PDF", f"Document exported successfully to:\n{self.pdf_path}")
+        elif kind == "error":
+            messagebox.showerror("Export PDF Error", f"Failed to export PDF:\n{str(value)}")
+
+    def cancel(self):
+        """Stop the export after the current page; nothing is written."""
+        self.cancel_event.set()
+        if self.dialog is not None and self.dialog.winfo_exists():
+            self.cancel_button.config(state=tk.DISABLED)
+            self.progress_label.config(text="Cancelling...")
@@ -0,0 +1,192 @@
+"""
+Print preview for Notexio text editor.
+"""
+import threading
+import tkinter as tk
+from collections import OrderedDict
+
+from src.pdf_export import (
+    FOOTER_FONT, FOOTER_FONT_SIZE, FOOTER_GRAY, FOOTER_RIGHT, FOOTER_Y, PageLayout, footer_text
+)
+
+
+class PrintPreview:
+    """Shows a document as the pages the PDF export would print.
+
+    Page breaks come from the exporter's PageLayout and are found by a
+    background pass over a snapshot of the text. Only the pages in view are
+    drawn on the canvas, and the rows of recently drawn pages are kept in a
+    small LRU cache.
+    """
+
+    PAGE_GAP = 20  # px around pages
+    CACHE_SIZE = 32  # pages whose rows are kept
+    POLL_INTERVAL = 100  # ms between page count updates while paginating
+    PAGE_STARTS_BATCH = 256  # page starts collected before they are shown
+
+    def __init__(self, editor, print_command):
+        self.editor = editor
+        self.print_command = print_command
+        self.layout = PageLayout()
+        self.content = editor.text_widget.get(1.0, tk.END + "-1c")
+        self.page_starts = []  # (offset, line, row) per page, filled in the background
+        self.paginated = False
+        self.stop_event = threading.Event()
+        self.page_cache = OrderedDict()  # page index -> rows
+        self.drawn = set()
+        self.scale = 1.0
+        self.redraw_after_id = None
+
+        self.window = tk.Toplevel(editor.root)
+        self.window.title("Print Preview")
+        self.window.geometry("700x800")
+        self.window.protocol("WM_DELETE_WINDOW", self.close)
+
+        toolbar = tk.Frame(self.window)
+        toolbar.pack(fill=tk.X, padx=10, pady=5)
+        tk.Button(toolbar, text="Print", command=self.print_document).pack(side=tk.LEFT, padx=5)
+        tk.Button(toolbar, text="Close", command=self.close).pack(side=tk.LEFT, padx=5)
+        tk.Label(toolbar, text="Go to page:").pack(side=tk.LEFT, padx=(15, 5))
+        self.page_entry = tk.Entry(toolbar, width=6)
+        self.page_entry.pack(side=tk.LEFT)
+        self.page_entry.bind("<Return>", lambda e: self.go_to_page())
+        self.page_label = tk.Label(toolbar, text="Paginating...", anchor=tk.W)
+        self.page_label.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=10)
+
+        body = tk.Frame(self.window)
+        body.pack(fill=tk.BOTH, expand=True)
+        scrollbar = tk.Scrollbar(body, orient=tk.VERTICAL)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.canvas = tk.Canvas(body, bg="#808080", highlightthickness=0)
+        self.canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self.canvas.config(yscrollcommand=lambda first, last: (scrollbar.set(first, last), self.schedule_redraw()))
+        scrollbar.config(command=self.canvas.yview)
+        self.canvas.bind("<Configure>", lambda e: self.update_geometry())
+        self.canvas.bind("<MouseWheel>", lambda e: self.canvas.yview_scroll(-1 if e.delta > 0 else 1, "units"))
+        self.canvas.bind("<Button-4>", lambda e: self.canvas.yview_scroll(-1, "units"))
+        self.canvas.bind("<Button-5>", lambda e: self.canvas.yview_scroll(1, "units"))
+        self.editor.theme_dialog(self.window)
+
+        threading.Thread(target=self._paginate, daemon=True).start()
+        self.window.after(self.POLL_INTERVAL, self._poll)
+
+    def _paginate(self):
+        """Find every page start (runs in a thread; list.extend is atomic)."""
+        batch = []
+        for start in self.layout.iter_page_starts(self.content):
+            if self.stop_event.is_set():
+                return
+            batch.append(start)
+            if len(batch) == self.PAGE_STARTS_BATCH:
+                self.page_starts.extend(batch)
+                batch = []
+        self.page_starts.extend(batch)
+        self.paginated = True
+
+    def _poll(self):
+        """Grow the scroll region as pages are found."""
+        if not self.window.winfo_exists():
+            return
+        # Read before updating, so pages found in between get one more update
+        paginated = self.paginated
+        self.update_geometry()
+        if not paginated:
+            self.window.after(self.POLL_INTERVAL, self._poll)
+
+    def update_geometry(self):
+        """Fit pages to the canvas width and size the scroll region to the known pages."""
+        width = self.canvas.winfo_width()
+        scale = max(0.3, min(1.5, (width - 2 * self.PAGE_GAP) / self.layout.page_width))
+        if scale != self.scale:
+            self.scale = scale
+            self.canvas.delete("page")
+            self.drawn.clear()
+        height = self.PAGE_GAP + len(self.page_starts) * self.page_pitch()
+        self.canvas.config(scrollregion=(0, 0, width, height))
+        self.redraw()
+
+    def page_pitch(self):
+        return self.layout.page_height * self.scale + self.PAGE_GAP
+
+    def schedule_redraw(self):
+        if self.redraw_after_id is None:
+            self.redraw_after_id = self.window.after_idle(self.redraw)
+
+    def redraw(self):
+        """Draw the pages in view and drop the ones scrolled away."""
+        self.redraw_after_id = None
+        if not self.window.winfo_exists():
+            return
+        page_count = len(self.page_starts)
+        pitch = self.page_pitch()
+        top = self.canvas.canvasy(0)
+        bottom = self.canvas.canvasy(self.canvas.winfo_height())
+        first = max(0, int((top - self.PAGE_GAP) // pitch))
+        last = min(page_count - 1, int(bottom // pitch))
+        visible = set(range(first, last + 1))
+
+        for index in self.drawn - visible:
+            self.canvas.delete(f"page{index}")
+        for index in sorted(visible - self.drawn):
+            self.draw_page(index)
+        self.drawn = visible
+
+        suffix = "" if self.paginated else "+"
+        if page_count:
+            self.page_label.config(text=f"Page {first + 1} of {page_count}{suffix}")
+
+    def page_rows(self, index):
+        """Rows of a page, from the LRU cache when it was drawn recently."""
+        rows = self.page_cache.get(index)
+        if rows is None:
+            offset, _, row = self.page_starts[index]
+            rows = self.layout.page_rows(self.content, offset, row)
+            self.page_cache[index] = rows
+            if len(self.page_cache) > self.CACHE_SIZE:
+                self.page_cache.popitem(last=False)
+        else:
+            self.page_cache.move_to_end(index)
+        return rows
+
+    def draw_page(self, index):
+        layout = self.layout
+        scale = self.scale
+        tags = ("page", f"page{index}")
+        x = max(self.PAGE_GAP, (self.canvas.winfo_width() - layout.page_width * scale) / 2)
+        y = self.PAGE_GAP + index * self.page_pitch()
+        self.canvas.create_rectangle(
+            x, y, x + layout.page_width * scale, y + layout.page_height * scale,
+            fill="#FFFFFF", outline="#404040", tags=tags
+        )
+        self.canvas.create_text(
+            x + layout.margin * scale, y + layout.margin * scale,
+            text="\n".join(self.page_rows(index)), anchor=tk.NW,
+            font=("Courier", -max(1, round(layout.font_size * scale))), tags=tags
+        )
+        gray = round(FOOTER_GRAY * 255)
+        self.canvas.create_text(
+            x + (layout.page_width - FOOTER_RIGHT) * scale, y + (layout.page_height - FOOTER_Y) * scale,
+            text=footer_text(index + 1), anchor=tk.SE, fill=f"#{gray:02x}{gray:02x}{gray:02x}",
+            font=(FOOTER_FONT, -max(1, round(FOOTER_FONT_SIZE * scale))), tags=tags
+        )
+
+    def go_to_page(self):
+        """Scroll to the page number typed in the entry."""
+        try:
+            number = int(self.page_entry.get())
+        except ValueError:
+            return
+        page_count = len(self.page_starts)
+        if not page_count:
+            return
+        number = max(1, min(page_count, number))
+        region_height = self.PAGE_GAP + page_count * self.page_pitch()
+        self.canvas.yview_moveto((number - 1) * self.page_pitch() / region_height)
+
+    def print_document(self):
+        self.close()
+        self.print_command()
+
+    def close(self):
+        self.stop_event.set()
+        self.window.destroy()
@@ -0,0 +1,132 @@
+"""
+Readability panel for Notexio text editor.
+"""
+import queue
+import threading
+import tkinter as tk
+
+from src.document_reader import DocumentReader
+from src.text_analytics import ReadabilityIndex, format_readability
+
+
+class ReadabilityPanel:
+    """Readability scores of the current document, kept up to date while typing.
+
+    Scoring runs in a worker thread over a paragraph-cached index, so each
+    refresh only analyses the paragraphs that changed since the last one.
+    """
+
+    REFRESH_DELAY = 500  # ms after the last edit
+
+    def __init__(self, editor):
+        self.editor = editor
+        self.index = ReadabilityIndex()
+        self.window = None
+        self.document_widget = None
+        self.refresh_after_id = None
+        self.watch_after_id = None
+        self.worker = None
+        self.dirty = False
+        self.cancel_event = threading.Event()
+        self.results = queue.Queue()
+        self.editor.add_text_widget_callback(self.bind_text_widget)
+
+    def bind_text_widget(self, text_widget):
+        """Refresh the panel when the document changes."""
+        text_widget.bind("<<TextChanged>>", self.on_text_changed, add="+")
+
+    def show(self):
+        """Show the panel (or raise it if it is already open)."""
+        if self.window is not None and self.window.winfo_exists():
+            self.window.lift()
+            return
+
+        self.window = tk.Toplevel(self.editor.root)
+        self.window.title("Readability")
+        self.window.geometry("460x340")
+        self.window.transient(self.editor.root)
+        self.window.protocol("WM_DELETE_WINDOW", self.close)
+
+        self.report = tk.Label(self.window, text="Scoring...", anchor=tk.NW, justify=tk.LEFT, wraplength=430)
+        self.report.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        tk.Button(self.window, text="Close", command=self.close).pack(pady=(0, 10))
+        self.editor.theme_dialog(self.window)
+
+        # A run cancelled by closing the panel stops at the next paragraph
+        if self.worker is not None:
+            self.worker.join()
+        self.results = queue.Queue()
+        self.cancel_event.clear()
+        self.refresh()
+        self.watch_after_id = self.window.after(1000, self._watch_active_document)
+
+    def on_text_changed(self, event):
+        """Debounce refreshes while the user is typing."""
+        if self.window is None or event.widget is not self.editor.text_widget:
+            return
+        if self.refresh_after_id is not None:
+            self.window.after_cancel(self.refresh_after_id)
+        self.refresh_after_id = self.window.after(self.REFRESH_DELAY, self.refresh)
+
+    def refresh(self):
+        """Re-score the current document in the worker thread."""
+        self.refresh_after_id = None
+        if self.window is None:
+            return
+        if self.worker is not None and self.worker.is_alive():
+            # Picked up again when the running update finishes
+            self.dirty = True
+            return
+
+        self.dirty = False
+        self.document_widget = self.editor.text_widget
+        reader = DocumentReader(self.editor.root, self.document_widget, self.cancel_event)
+        self.worker = threading.Thread(target=self._score, args=(self.results, reader), daemon=True)
+        self.worker.start()
+        self.window.after(50, self._poll)
+
+    def _score(self, results, reader):
+        """Update the index and format the report (worker thread)."""
+        if not self.index.update(reader, self.cancel_event):
+            results.put(None)
+            return
+        results.put(format_readability(self.index.scores(), self.index.longest_sentences()))
+
+    def _poll(self):
+        """Show the worker's report once it is ready."""
+        if self.window is None:
+            return
+        try:
+            report = self.results.get_nowait()
+        except queue.Empty:
+            self.window.after(50, self._poll)
+            return
+
+        if report is not None:
+            self.report.config(text=report)
+        else:
+            # The index dropped its totals and scores the document again
+            self.dirty = True
+        if self.dirty:
+            self.refresh()
+
+    def _watch_active_document(self):
+        """Re-score when another tab becomes active (tab switches are not edits)."""
+        if self.window is None:
+            return
+        if self.document_widget is not self.editor.text_widget and not self.worker.is_alive():
+            self.refresh()
+        self.watch_after_id = self.window.after(1000, self._watch_active_document)
+
+    def close(self):
+        """Stop scoring and close the panel."""
+        self.cancel_event.set()
+        if self.window is not None:
+            if self.refresh_after_id is not None:
+                self.window.after_cancel(self.refresh_after_id)
+                self.refresh_after_id = None
+            if self.watch_after_id is not None:
+                self.window.after_cancel(self.watch_after_id)
+                self.watch_after_id = None
+            self.window.destroy()
+            self.window = None
@@ -0,0 +1,117 @@
+"""
+Tk-free storage of formatting runs for Notexio text editor.
+
+Formatting is kept next to the document in a small JSON sidecar: a style
+table plus one flat integer array of (start, length, style id) runs, with
+each start stored relative to the previous one. The sidecar records a
+checksum of the text it belongs to and is ignored once the file has been
+changed by another program.
+"""
+import bisect
+import json
+import os
+import zlib
+from itertools import accumulate
+
+
+FORMAT_NAME = "notexio-formatting"
+FORMAT_VERSION = 1
+
+
+def sidecar_path(filepath):
+    """Hidden sidecar next to a document: notes.txt -> .notes.txt.notexio"""
+    directory, name = os.path.split(os.path.abspath(filepath))
+    return os.path.join(directory, f".{name}.notexio")
+
+
+def content_checksum(content):
+    return f"{zlib.crc32(content.encode('utf-8')):08x}"
+
+
+def line_starts(content):
+    """Character offset of the start of every line."""
+    return [0] + list(accumulate(len(line) + 1 for line in content.split("\n")))[:-1]
+
+
+def index_to_offset(index, starts, length):
+    """Text widget index "line.column" -> character offset, at most length.
+
+    Ranges may end at the widget's "end" (the line after the last), which
+    maps to the end of the text.
+    """
+    line, column = str(index).split(".")
+    line = int(line)
+    if line > len(starts):
+        return length
+    return min(starts[line - 1] + int(column), length)
+
+
+def offset_to_index(offset, starts):
+    """Character offset -> text widget index "line.column"."""
+    line = bisect.bisect_right(starts, offset)
+    return f"{line}.{offset - starts[line - 1]}"
+
+
+def encode_runs(runs):
+    """Flatten (start, length, style id) runs, sorted, with delta-encoded starts."""
+    flat = []
+    previous = 0
+    for start, length, style_id in sorted(runs):
+        flat.extend((start - previous, length, style_id))
+        previous = start
+    return flat
+
+
+def decode_runs(flat):
+    """Inverse of encode_runs."""
+    runs = []
+    start = 0
+    for i in range(0, len(flat) - 2, 3):
+        start += flat[i]
+        runs.append((start, flat[i + 1], flat[i + 2]))
+    return runs
+
+
+def write_formatting(filepath, content, styles, runs):
+    """Write the formatting of a document; removes the sidecar when there is none."""
+    path = sidecar_path(filepath)
+    if not runs:
+        if os.path.exists(path):
+            os.remove(path)
+        return
+    data = {
+        "format": FORMAT_NAME,
+        "version": FORMAT_VERSION,
+        "length": len(content),
+        "checksum": content_checksum(content),
+        "styles": styles,
+        "runs": encode_runs(runs),
+    }
+    temp_path = path + ".tmp"
+    with open(temp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, separators=(",", ":"))
+    os.replace(temp_path, path)
+
+
+def read_formatting(filepath, content):
+    """(styles, runs) saved for this exact content, or None."""
+    path = sidecar_path(filepath)
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("format") != FORMAT_NAME or data.get("version") != FORMAT_VERSION:
+            return None
+        if data["length"] != len(content) or data["checksum"] != content_checksum(content):
+            return None
+        styles = data["styles"]
+        runs = decode_runs(data["runs"])
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        return None
+    if not all(isinstance(style, dict) and isinstance(style.get("tag"), str) for style in styles):
+        return None
+    if not all(0 <= style_id < len(styles) and 0 <= start and start + length <= len(content)
+               for start, length, style_id in runs):
+        return None
+    return styles, runs
@@ -140,5 +140,7 @@ class SafetyFeatures:
             
     def warn_on_exit(self):
         """Check for unsaved changes and warn user before exit."""
+        if getattr(self.editor, 'tab_manager', None):
+            return self.editor.tab_manager.check_all_unsaved()
         return self.file_manager.check_unsaved_changes()
 
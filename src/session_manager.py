@@ -0,0 +1,179 @@
+"""
+Session persistence for Notexio text editor.
+"""
+import json
+import os
+from datetime import datetime
+
+
+class SessionManager:
+    """Saves and restores the set of open documents between runs."""
+
+    def __init__(self, editor, settings_manager, tab_manager,
+                 session_file="config/session.json", recovery_dir="recovery"):
+        self.editor = editor
+        self.settings_manager = settings_manager
+        self.tab_manager = tab_manager
+        self.session_file = session_file
+        # Unsaved session content lives apart from the startup recovery scan
+        self.session_recovery_dir = os.path.join(recovery_dir, "session")
+        self.pending = []
+        self.restore_after_id = None
+        self.restore_batch_size = 10
+
+    def save_session(self):
+        """Save open documents, their order, cursor, scroll and selection."""
+        documents = []
+        active = 0
+        recovery_files = set()
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+
+        for document in self.tab_manager.get_documents():
+            filepath = self.tab_manager.get_document_path(document)
+            is_modified = self.tab_manager.is_document_modified(document)
+            if not filepath and not is_modified:
+                continue
+
+            entry = {
+                "filepath": filepath,
+                "view_state": self.tab_manager.get_view_state(document),
+                "modified": is_modified,
+                "recovery": None
+            }
+            if document.recovery_path:
+                # Still unloaded from the last session - its recovery file is its only content
+                entry["recovery"] = document.recovery_path
+                recovery_files.add(os.path.abspath(document.recovery_path))
+            elif is_modified:
+                entry["recovery"] = self._write_recovery(document, len(documents), timestamp)
+                if entry["recovery"]:
+                    recovery_files.add(os.path.abspath(entry["recovery"]))
+
+            if document is self.tab_manager.current:
+                active = len(documents)
+            documents.append(entry)
+
+        # Documents still queued from the last restore are carried over as-is
+        for entry, _ in self.pending:
+            documents.append(entry)
+            if entry.get("recovery"):
+                recovery_files.add(os.path.abspath(entry["recovery"]))
+
+        self._cleanup_recovery(keep=recovery_files)
+
+        session = {"version": 1, "active": active, "documents": documents}
+        try:
+            os.makedirs(os.path.dirname(self.session_file), exist_ok=True)
+            with open(self.session_file, 'w', encoding='utf-8') as f:
+                json.dump(session, f, indent=4)
+            return True
+        except Exception as e:
+            print(f"Error saving session: {e}")
+            return False
+
+    def _write_recovery(self, document, index, timestamp):
+        """Write a modified document's content to the session recovery store."""
+        try:
+            content = self.tab_manager.get_content(document)
+            if content is None:
+                return None
+            os.makedirs(self.session_recovery_dir, exist_ok=True)
+            recovery_path = os.path.join(
+                self.session_recovery_dir, f"session_{timestamp}_{index}.recovery"
+            )
+            with open(recovery_path, 'w', encoding='utf-8') as f:
+                f.write(content)
+            return recovery_path
+        except Exception as e:
+            print(f"Error saving session recovery: {e}")
+            return None
+
+    def _cleanup_recovery(self, keep):
+        """Remove session recovery files no longer referenced."""
+        if not os.path.isdir(self.session_recovery_dir):
+            return
+        for filename in os.listdir(self.session_recovery_dir):
+            filepath = os.path.join(self.session_recovery_dir, filename)
+            if os.path.abspath(filepath) not in keep:
+                try:
+                    os.remove(filepath)
+                except OSError:
+                    pass
+
+    def load_session(self):
+        """Load the saved session, or None if there is none."""
+        try:
+            if os.path.exists(self.session_file):
+                with open(self.session_file, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+        except Exception as e:
+            print(f"Error loading session: {e}")
+        return None
+
+    def restore_session(self):
+        """Restore the active document now and queue the rest in the background."""
+        if not self.settings_manager.get_setting("restore_session", True):
+            return False
+        session = self.load_session()
+        if not session:
+            return False
+
+        entries = []
+        for entry in session.get("documents", []):
+            recovery = entry.get("recovery")
+            filepath = entry.get("filepath")
+            if recovery and os.path.exists(recovery):
+                entries.append(entry)
+            elif filepath and os.path.exists(filepath):
+                entry["recovery"] = None
+                entries.append(entry)
+        if not entries:
+            return False
+
+        saved = session.get("documents", [])
+        active = session.get("active", 0)
+        active_entry = saved[active] if 0 <= active < len(saved) else None
+        if active_entry not in entries:
+            active_entry = entries[0]
+        active_index = entries.index(active_entry)
+
+        # The active document is loaded right away into the startup tab
+        self._restore_entry(active_entry, select=True, lazy=False, position=0)
+
+        # Documents before it keep their order in front, the rest go after it
+        self.pending = [
+            (entry, index if index < active_index else "end")
+            for index, entry in enumerate(entries) if index != active_index
+        ]
+        self.restore_after_id = self.editor.root.after_idle(self._restore_pending)
+        return True
+
+    def _restore_pending(self):
+        """Add the next batch of queued documents as lazy tabs."""
+        self.restore_after_id = None
+        batch, self.pending = self.pending[:self.restore_batch_size], self.pending[self.restore_batch_size:]
+        for entry, position in batch:
+            self._restore_entry(entry, select=False, lazy=True, position=position)
+        if self.pending:
+            self.restore_after_id = self.editor.root.after_idle(self._restore_pending)
+
+    def _restore_entry(self, entry, select, lazy, position):
+        """Open one session document as a tab."""
+        tab_manager = self.tab_manager
+        filepath = entry.get("filepath")
+        recovery = entry.get("recovery")
+        view_state = entry.get("view_state")
+
+        # Replace the empty startup tab instead of leaving it behind
+        blank = tab_manager.current if select and tab_manager.is_blank(tab_manager.current) else None
+        document = tab_manager.new_tab(
+            filepath,
+            select=select,
+            lazy=lazy,
+            view_state=view_state,
+            recovery_path=recovery,
+            position=position
+        )
+        if blank is not None:
+            tab_manager.close_tab(blank)
+        return document
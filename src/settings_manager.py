@@ -24,7 +24,17 @@ class SettingsManager:
             "word_wrap": True,
             "line_numbers": False,
             "auto_save": False,
-            "auto_save_interval": 300
+            "auto_save_interval": 300,
+            "follow_max_lines": 10000,
+            "follow_interval_ms": 250,
+            "tab_hibernate_after": 600,
+            "restore_session": True,
+            "duplicate_min_length": 3,
+            "duplicate_skip_stop_words": True,
+            "spell_check": False,
+            "spell_dictionary": "",
+            "autocomplete": True,
+            "autocomplete_min_prefix": 3
         }
         
         try:
@@ -61,6 +71,11 @@ class SettingsManager:
         self.settings[key] = value
         self.save_settings()
         
+    def update_settings(self, values):
+        """Set several settings with a single save."""
+        self.settings.update(values)
+        self.save_settings()
+        
     def save_recent_files(self, recent_files):
         """Save recent files list."""
         self.set_setting("recent_files", recent_files)
@@ -0,0 +1,192 @@
+"""
+Single-instance mode for Notexio text editor.
+"""
+import errno
+import json
+import os
+import queue
+import socket
+import stat
+import tempfile
+import threading
+
+
+class SingleInstance:
+    """Forwards file-open requests to an already running Notexio.
+
+    The first instance listens on a per-user Unix domain socket; later
+    launches send their file arguments to it and exit.
+    """
+
+    def __init__(self, socket_path=None):
+        self.socket_path = socket_path or self.default_socket_path()
+        self.server = None
+        self.thread = None
+        self.requests = queue.Queue()
+        self.after_id = None
+
+    @staticmethod
+    def is_supported():
+        """Unix domain sockets are not available on every platform."""
+        return hasattr(socket, "AF_UNIX")
+
+    @staticmethod
+    def default_socket_path():
+        """Per-user socket path, preferring the private runtime directory."""
+        if hasattr(os, "getuid"):
+            user = str(os.getuid())
+        else:
+            import getpass
+            user = getpass.getuser()
+        runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+        if runtime_dir and os.path.isdir(runtime_dir):
+            return os.path.join(runtime_dir, f"notexio-{user}.sock")
+        # The temp directory is shared: keep the socket in a directory only this user can enter
+        return os.path.join(tempfile.gettempdir(), f"notexio-{user}", "notexio.sock")
+
+    def _is_private(self, path, kind):
+        """Check that path is of the given kind, owned by this user and closed to others."""
+        info = os.lstat(path)
+        if not kind(info.st_mode):
+            return False
+        if not hasattr(os, "getuid"):
+            return True
+        return info.st_uid == os.getuid() and not info.st_mode & 0o077
+
+    def _is_trusted(self):
+        """Check that the socket was created by this user, not planted by another one."""
+        try:
+            return (self._is_private(os.path.dirname(self.socket_path), stat.S_ISDIR)
+                    and self._is_private(self.socket_path, stat.S_ISSOCK))
+        except OSError:
+            return False
+
+    def forward(self, files, timeout=0.5):
+        """Send files to the running instance. Returns False if none is running."""
+        if not self.is_supported() or not self._is_trusted():
+            return False
+        message = json.dumps({"open": [os.path.abspath(f) for f in files]}) + "\n"
+        try:
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+                client.settimeout(timeout)
+                client.connect(self.socket_path)
+                client.sendall(message.encode("utf-8"))
+                client.shutdown(socket.SHUT_WR)
+                # Wait for the acknowledgement so nothing is lost if we exit now
+                return client.recv(16).startswith(b"ok")
+        except (OSError, socket.timeout):
+            return False
+
+    def listen(self):
+        """Start accepting requests. Returns False if another instance owns the socket."""
+        if not self.is_supported():
+            return False
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            self._make_directory()
+            self._bind(server)
+        except OSError as e:
+            server.close()
+            print(f"Single-instance mode disabled: {e}")
+            return False
+
+        server.listen(8)
+        self.server = server
+        self.thread = threading.Thread(target=self._accept_loop, daemon=True)
+        self.thread.start()
+        return True
+
+    def _make_directory(self):
+        """Create the socket's directory, refusing one that other users can reach."""
+        directory = os.path.dirname(self.socket_path)
+        try:
+            os.mkdir(directory, 0o700)
+        except FileExistsError:
+            pass
+        if not self._is_private(directory, stat.S_ISDIR):
+            raise PermissionError(f"{directory} is accessible to other users")
+
+    def _bind(self, server):
+        """Bind the socket, recovering from a stale socket file left by a crash."""
+        old_umask = os.umask(0o077)
+        try:
+            try:
+                server.bind(self.socket_path)
+            except OSError as e:
+                if e.errno != errno.EADDRINUSE:
+                    raise
+                if self._is_alive():
+                    raise
+                # Nobody is listening - the file is left over from a crashed instance
+                os.unlink(self.socket_path)
+                server.bind(self.socket_path)
+        finally:
+            os.umask(old_umask)
+
+    def _is_alive(self):
+        """Check whether an instance is accepting connections on the socket."""
+        try:
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+                probe.settimeout(0.2)
+                probe.connect(self.socket_path)
+                return True
+        except (OSError, socket.timeout):
+            return False
+
+    def _accept_loop(self):
+        """Receive requests in a background thread and queue them for Tk."""
+        while self.server is not None:
+            try:
+                connection, _ = self.server.accept()
+            except OSError:
+                break
+            with connection:
+                try:
+                    connection.settimeout(1.0)
+                    data = b""
+                    while True:
+                        chunk = connection.recv(65536)
+                        if not chunk:
+                            break
+                        data += chunk
+                    request = json.loads(data.decode("utf-8") or "{}")
+                    files = request.get("open", []) if isinstance(request, dict) else None
+                    if not isinstance(files, list) or not all(isinstance(f, str) for f in files):
+                        # Not a request from another Notexio; keep listening
+                        continue
+                    self.requests.put(files)
+                    connection.sendall(b"ok\n")
+                except (OSError, ValueError):
+                    continue
+
+    def poll(self, root, handler, interval=100):
+        """Hand queued requests to handler on the Tk thread."""
+        try:
+            while True:
+                handler(self.requests.get_nowait())
+        except queue.Empty:
+            pass
+        except Exception as e:
+            print(f"Error opening forwarded files: {e}")
+        finally:
+            # One failed request must not end single-instance handling
+            self.after_id = root.after(interval, self.poll, root, handler, interval)
+
+    def close(self):
+        """Stop listening and remove the socket file."""
+        server, self.server = self.server, None
+        if server is None:
+            return
+        try:
+            # Wakes up the blocked accept() in the listener thread
+            server.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        try:
+            server.close()
+        except OSError:
+            pass
+        try:
+            os.unlink(self.socket_path)
+        except OSError:
+            pass
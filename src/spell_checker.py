@@ -0,0 +1,242 @@
+"""
+Spell checking for Notexio text editor.
+"""
+import os
+import re
+import threading
+import tkinter as tk
+from tkinter import messagebox
+
+from src.spell_dictionary import SpellDictionary, find_word_list
+
+
+# Letters with optional inner apostrophes ("don't"); digits and underscores split words
+SPELL_WORD_RE = re.compile(r"[^\W\d_]+(?:'[^\W\d_]+)*")
+
+
+class SpellChecker:
+    """Marks misspelled words in the visible lines and the lines being edited.
+
+    The dictionary is loaded in a background thread the first time checking
+    is enabled. Checks run on an idle timer after edits and scrolling, so
+    typing never waits for them.
+    """
+
+    CHECK_DELAY = 300  # ms after the last edit or scroll
+    MARGIN_LINES = 20  # checked above and below the visible lines
+    TAG_BATCH_SIZE = 2000
+
+    def __init__(self, editor, settings_manager, user_dictionary="config/user_dictionary.txt"):
+        self.editor = editor
+        self.settings_manager = settings_manager
+        self.user_dictionary = user_dictionary
+        self.dictionary = None
+        self.loading = False
+        self.enabled = False
+        self.known = {}  # word -> spelled correctly (memo of dictionary lookups)
+        self.dirty_lines = {}  # text widget -> line numbers edited since the last check
+        self.check_after_id = None
+        self.bound = False
+
+    def toggle(self):
+        """Turn checking as you type on or off."""
+        self.set_enabled(not self.enabled)
+        self.settings_manager.set_setting("spell_check", self.enabled)
+
+    def set_enabled(self, enabled):
+        """Enable or disable checking (loads the dictionary on first use)."""
+        self.enabled = enabled
+        if not enabled:
+            for text_widget in self.editor.text_widgets:
+                text_widget.tag_remove("misspelled", 1.0, tk.END)
+            return
+        if not self.bound:
+            self.editor.add_text_widget_callback(self.bind_text_widget)
+            self.bound = True
+        if self.dictionary is None:
+            self.load_dictionary()
+        else:
+            self.schedule_check()
+
+    def bind_text_widget(self, text_widget):
+        """Watch a document for edits, scrolling and right-clicks."""
+        text_widget.tag_config("misspelled", underline=True)
+        try:
+            text_widget.tag_config("misspelled", underlinefg="#E81123")
+        except tk.TclError:
+            # underlinefg needs Tk 8.6.11
+            text_widget.tag_config("misspelled", foreground="#E81123")
+        text_widget.bind("<<TextChanged>>", self.on_text_changed, add="+")
+        text_widget.bind("<<ViewportChanged>>", lambda e: self.schedule_check(), add="+")
+        text_widget.bind("<Button-3>", self.show_suggestions, add="+")
+
+    def load_dictionary(self):
+        """Load the word list in a background thread."""
+        if self.loading:
+            return
+        word_list = find_word_list(self.settings_manager.get_setting("spell_dictionary"))
+        if word_list is None:
+            self.enabled = False
+            messagebox.showwarning(
+                "Spell Check",
+                "No word list found.\n\nInstall a system word list (/usr/share/dict/words), "
+                "put one at config/dictionary.txt, or set \"spell_dictionary\" in settings."
+            )
+            return
+
+        self.loading = True
+        loaded = {}
+
+        def load():
+            try:
+                loaded["dictionary"] = SpellDictionary.load(word_list)
+            except Exception as e:
+                loaded["error"] = e
+
+        thread = threading.Thread(target=load, daemon=True)
+        thread.start()
+        self.editor.root.after(50, self._wait_for_dictionary, thread, loaded)
+
+    def _wait_for_dictionary(self, thread, loaded):
+        """Start checking once the dictionary has loaded."""
+        if thread.is_alive():
+            self.editor.root.after(50, self._wait_for_dictionary, thread, loaded)
+            return
+        self.loading = False
+        if "error" in loaded:
+            self.enabled = False
+            messagebox.showerror("Spell Check", f"Could not load the dictionary:\n{loaded['error']}")
+            return
+        self.dictionary = loaded["dictionary"]
+        for word in self.read_user_dictionary():
+            self.dictionary.add(word)
+        self.schedule_check()
+
+    def read_user_dictionary(self):
+        """Words added with "Add to Dictionary"."""
+        if not os.path.exists(self.user_dictionary):
+            return []
+        try:
+            with open(self.user_dictionary, "r", encoding="utf-8") as f:
+                return [line.strip() for line in f if line.strip()]
+        except OSError:
+            return []
+
+    def on_text_changed(self, event):
+        """Remember the edited line and check it once typing pauses."""
+        if not self.enabled:
+            return
+        line = int(event.widget.index(tk.INSERT).split(".")[0])
+        self.dirty_lines.setdefault(event.widget, set()).update((line - 1, line))
+        self.schedule_check()
+
+    def schedule_check(self):
+        """Check after a short idle period (restarts on every call)."""
+        if not self.enabled or self.dictionary is None:
+            return
+        if self.check_after_id is not None:
+            self.editor.root.after_cancel(self.check_after_id)
+        self.check_after_id = self.editor.root.after(self.CHECK_DELAY, self.check)
+
+    def check(self):
+        """Check the visible lines (plus a margin) and the edited lines."""
+        self.check_after_id = None
+        text_widget = self.editor.text_widget
+        if not self.enabled or self.dictionary is None or not text_widget.winfo_exists():
+            return
+
+        last_document_line = int(text_widget.index("end-1c").split(".")[0])
+        # Every pane of a split document (the tags are shared)
+        views = self.editor.text_views(text_widget)
+        checked = []
+        for view in views:
+            first_line = int(view.index("@0,0").split(".")[0])
+            last_line = int(view.index(f"@0,{view.winfo_height()}").split(".")[0])
+            first_line = max(1, first_line - self.MARGIN_LINES)
+            last_line = min(last_document_line, last_line + self.MARGIN_LINES)
+            self.check_lines(view, first_line, last_line)
+            checked.append((first_line, last_line))
+
+        dirty_lines = set()
+        for view in views:
+            dirty_lines.update(self.dirty_lines.pop(view, ()))
+        for line in sorted(dirty_lines):
+            if 1 <= line <= last_document_line and \
+                    not any(first_line <= line <= last_line for first_line, last_line in checked):
+                self.check_lines(text_widget, line, line)
+
+    def check_lines(self, text_widget, first_line, last_line):
+        """Re-mark misspellings in a range of lines."""
+        content = text_widget.get(f"{first_line}.0", f"{last_line}.end")
+        indices = []
+        for line_number, line in enumerate(content.split("\n"), first_line):
+            for match in SPELL_WORD_RE.finditer(line):
+                if not self.is_correct(match.group()):
+                    indices.append(f"{line_number}.{match.start()}")
+                    indices.append(f"{line_number}.{match.end()}")
+
+        text_widget.tag_remove("misspelled", f"{first_line}.0", f"{last_line}.end")
+        for i in range(0, len(indices), self.TAG_BATCH_SIZE):
+            text_widget.tag_add("misspelled", *indices[i:i + self.TAG_BATCH_SIZE])
+
+    def is_correct(self, word):
+        """Dictionary lookup, memoized per word."""
+        correct = self.known.get(word)
+        if correct is None:
+            # Single letters and acronyms are not checked
+            correct = len(word) < 2 or word.isupper() or word in self.dictionary
+            self.known[word] = correct
+        return correct
+
+    def show_suggestions(self, event):
+        """Context menu with suggestions for the misspelled word under the mouse."""
+        text_widget = event.widget
+        if not self.enabled or self.dictionary is None:
+            return
+        index = text_widget.index(f"@{event.x},{event.y}")
+        ranges = text_widget.tag_prevrange("misspelled", f"{index} + 1 chars")
+        if not ranges or not text_widget.compare(ranges[0], "<=", index) or \
+                not text_widget.compare(index, "<", ranges[1]):
+            return
+        start, end = ranges
+        word = text_widget.get(start, end)
+
+        menu = tk.Menu(text_widget, tearoff=0)
+        suggestions = self.dictionary.suggestions(word)
+        for suggestion in suggestions:
+            if word[:1].isupper():
+                suggestion = suggestion[:1].upper() + suggestion[1:]
+            menu.add_command(
+                label=suggestion,
+                command=lambda s=suggestion: self.replace_word(text_widget, start, end, s)
+            )
+        if not suggestions:
+            menu.add_command(label="(no suggestions)", state=tk.DISABLED)
+        menu.add_separator()
+        menu.add_command(label="Ignore All", command=lambda: self.accept_word(word))
+        menu.add_command(label="Add to Dictionary", command=lambda: self.accept_word(word, save=True))
+        menu.tk_popup(event.x_root, event.y_root)
+        return "break"
+
+    def replace_word(self, text_widget, start, end, replacement):
+        """Replace a misspelled word with a suggestion (one undo step)."""
+        text_widget.edit_separator()
+        text_widget.delete(start, end)
+        text_widget.insert(start, replacement)
+        text_widget.edit_separator()
+
+    def accept_word(self, word, save=False):
+        """Stop marking a word, optionally adding it to the personal dictionary."""
+        self.dictionary.add(word)
+        self.known.clear()
+        if save:
+            try:
+                os.makedirs(os.path.dirname(self.user_dictionary), exist_ok=True)
+                with open(self.user_dictionary, "a", encoding="utf-8") as f:
+                    f.write(word + "\n")
+            except OSError as e:
+                print(f"Error saving user dictionary: {e}")
+        for text_widget in self.editor.text_widgets:
+            self.dirty_lines.pop(text_widget, None)
+            text_widget.tag_remove("misspelled", 1.0, tk.END)
+        self.check()
@@ -0,0 +1,227 @@
+"""
+Tk-free spelling dictionary for Notexio text editor.
+
+Words are kept in one sorted, newline-separated byte string with an offset
+array (binary search with bisect) behind a Bloom filter, so most misspelled
+words are rejected without touching the word list. The compiled form is
+cached on disk and loaded with a single read on later launches.
+"""
+import bisect
+import os
+import struct
+import zlib
+from array import array
+
+
+DEFAULT_WORD_LISTS = (
+    "config/dictionary.txt",
+    "/usr/share/dict/words",
+    "/usr/share/dict/american-english",
+    "/usr/share/dict/british-english",
+)
+
+CACHE_MAGIC = b"NXDICT1\0"
+# magic, source fingerprint, word count, blob size, bloom bits, bloom hashes
+_HEADER = struct.Struct("<8s16sIIII")
+
+
+def find_word_list(configured=None):
+    """First existing word list: the configured one, then the usual locations."""
+    for path in ((configured,) if configured else ()) + DEFAULT_WORD_LISTS:
+        if path and os.path.isfile(path):
+            return path
+    return None
+
+
+def _fingerprint(path):
+    """Identify a word list version by path, size and modification time."""
+    stat = os.stat(path)
+    key = f"{os.path.abspath(path)}|{stat.st_size}|{stat.st_mtime_ns}".encode("utf-8")
+    return zlib.crc32(key).to_bytes(4, "little") + bytes(12)
+
+
+def bounded_edit_distance(a, b, limit):
+    """Levenshtein distance between a and b, or limit + 1 once it must exceed limit."""
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        row_min = i
+        for j, char_b in enumerate(b, 1):
+            value = min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + (char_a != char_b)
+            )
+            current.append(value)
+            row_min = min(row_min, value)
+        if row_min > limit:
+            return limit + 1
+        previous = current
+    return previous[-1]
+
+
+class _WordView:
+    """Sequence view of the packed word list for bisect."""
+
+    def __init__(self, blob, offsets):
+        self.blob = blob
+        self.offsets = offsets
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, i):
+        return self.blob[self.offsets[i]:self.offsets[i + 1] - 1]
+
+
+class SpellDictionary:
+    """Sorted word list with a Bloom filter front."""
+
+    BITS_PER_WORD = 10  # about 1% false positives with 7 hashes
+    HASHES = 7
+
+    def __init__(self, blob=b"", offsets=None, bloom=None, hashes=HASHES):
+        self.blob = blob
+        self.offsets = offsets if offsets is not None else array("I", [0])
+        self.words = _WordView(self.blob, self.offsets)
+        self.bloom = bloom if bloom is not None else bytearray(1)
+        self.bloom_bits = len(self.bloom) * 8
+        self.hashes = hashes
+        self.extra_words = set()  # personal dictionary and ignored words
+
+    @classmethod
+    def from_words(cls, words):
+        """Build a dictionary from an iterable of words."""
+        encoded = sorted({word.strip().lower().encode("utf-8") for word in words if word.strip()})
+        offsets = array("I", [0])
+        position = 0
+        for word in encoded:
+            position += len(word) + 1
+            offsets.append(position)
+        blob = b"\n".join(encoded) + (b"\n" if encoded else b"")
+        bloom = bytearray(max(1, len(encoded) * cls.BITS_PER_WORD // 8))
+        dictionary = cls(blob, offsets, bloom)
+        for word in encoded:
+            dictionary._bloom_add(word)
+        return dictionary
+
+    @classmethod
+    def load(cls, word_list, cache_dir="config/cache"):
+        """Load a word list, using (or creating) its compiled cache."""
+        fingerprint = _fingerprint(word_list)
+        cache_path = os.path.join(cache_dir, "dictionary.bin")
+        try:
+            dictionary = cls.read_cache(cache_path, fingerprint)
+            if dictionary is not None:
+                return dictionary
+        except (OSError, ValueError, struct.error):
+            pass
+
+        with open(word_list, "r", encoding="utf-8", errors="ignore") as f:
+            dictionary = cls.from_words(f)
+        try:
+            dictionary.write_cache(cache_path, fingerprint)
+        except OSError as e:
+            print(f"Error caching dictionary: {e}")
+        return dictionary
+
+    @classmethod
+    def read_cache(cls, cache_path, fingerprint):
+        """Read a compiled dictionary; None if missing or built from another list."""
+        if not os.path.exists(cache_path):
+            return None
+        with open(cache_path, "rb") as f:
+            data = f.read()
+        magic, cached_fingerprint, count, blob_size, bloom_size, hashes = _HEADER.unpack_from(data)
+        if magic != CACHE_MAGIC or cached_fingerprint != fingerprint:
+            return None
+        position = _HEADER.size
+        offsets = array("I")
+        offsets.frombytes(data[position:position + (count + 1) * offsets.itemsize])
+        position += (count + 1) * offsets.itemsize
+        blob = data[position:position + blob_size]
+        position += blob_size
+        bloom = bytearray(data[position:position + bloom_size])
+        if len(offsets) != count + 1 or len(blob) != blob_size or len(bloom) != bloom_size:
+            raise ValueError("truncated dictionary cache")
+        return cls(blob, offsets, bloom, hashes)
+
+    def write_cache(self, cache_path, fingerprint):
+        """Write the compiled dictionary (atomically)."""
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        temp_path = cache_path + ".tmp"
+        with open(temp_path, "wb") as f:
+            f.write(_HEADER.pack(CACHE_MAGIC, fingerprint, len(self.words), len(self.blob),
+                                 len(self.bloom), self.hashes))
+            f.write(self.offsets.tobytes())
+            f.write(self.blob)
+            f.write(self.bloom)
+        os.replace(temp_path, cache_path)
+
+    def _bloom_positions(self, word):
+        """Bit positions of a word (double hashing over two checksums)."""
+        first = zlib.crc32(word)
+        second = zlib.adler32(word) | 1
+        return ((first + i * second) % self.bloom_bits for i in range(self.hashes))
+
+    def _bloom_add(self, word):
+        for position in self._bloom_positions(word):
+            self.bloom[position >> 3] |= 1 << (position & 7)
+
+    def _bloom_contains(self, word):
+        bloom = self.bloom
+        return all(bloom[position >> 3] & (1 << (position & 7)) for position in self._bloom_positions(word))
+
+    def __len__(self):
+        return len(self.words)
+
+    def __contains__(self, word):
+        word = word.lower()
+        if word in self.extra_words:
+            return True
+        encoded = word.encode("utf-8")
+        if not self._bloom_contains(encoded):
+            return False
+        i = bisect.bisect_left(self.words, encoded)
+        return i < len(self.words) and self.words[i] == encoded
+
+    def add(self, word):
+        """Accept a word for this session (personal dictionary, Ignore All)."""
+        self.extra_words.add(word.lower())
+
+    def suggestions(self, word, max_distance=2, limit=8):
+        """Dictionary words within max_distance edits of word, closest first."""
+        word = word.lower()
+        found = {}
+
+        # Distance one: try every single edit against the Bloom filter and word list
+        letters = "abcdefghijklmnopqrstuvwxyz'"
+        splits = [(word[:i], word[i:]) for i in range(len(word) + 1)]
+        edits = {left + right[1:] for left, right in splits if right}
+        edits |= {left + right[1] + right[0] + right[2:] for left, right in splits if len(right) > 1}
+        edits |= {left + c + right[1:] for left, right in splits if right for c in letters}
+        edits |= {left + c + right for left, right in splits for c in letters}
+        edits.discard(word)
+        for candidate in edits:
+            if candidate in self:
+                found[candidate] = 1
+
+        # Distance two: scan words with the same first letter and a similar length
+        if max_distance > 1 and len(found) < limit and word:
+            prefix = word[0].encode("utf-8")
+            start = bisect.bisect_left(self.words, prefix)
+            end = bisect.bisect_left(self.words, prefix[:-1] + bytes([prefix[-1] + 1]))
+            for i in range(start, end):
+                encoded = self.words[i]
+                if abs(len(encoded) - len(word)) > max_distance:
+                    continue
+                candidate = encoded.decode("utf-8")
+                if candidate in found:
+                    continue
+                distance = bounded_edit_distance(word, candidate, max_distance)
+                if distance <= max_distance:
+                    found[candidate] = distance
+
+        return sorted(found, key=lambda candidate: (found[candidate], abs(len(candidate) - len(word)), candidate))[:limit]
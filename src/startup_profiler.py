@@ -0,0 +1,49 @@
+"""
+Startup timing for Notexio text editor.
+"""
+import sys
+import time
+from contextlib import contextmanager
+
+
+class StartupProfiler:
+    """Records how long each startup phase takes (enabled by --startup-profile)."""
+
+    def __init__(self, enabled=False, start_time=None):
+        self.enabled = enabled
+        self.start_time = start_time if start_time is not None else time.perf_counter()
+        self.phases = []  # (name, seconds)
+
+    @contextmanager
+    def phase(self, name):
+        """Time the enclosed block as one phase."""
+        if not self.enabled:
+            yield
+            return
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases.append((name, time.perf_counter() - started))
+
+    def record(self, name, seconds):
+        """Record a phase measured elsewhere."""
+        if self.enabled:
+            self.phases.append((name, seconds))
+
+    def mark(self, name):
+        """Record the time elapsed since startup as a milestone."""
+        if self.enabled:
+            self.phases.append((f"[{name}]", time.perf_counter() - self.start_time))
+
+    def report(self, stream=None):
+        """Print the per-phase timing breakdown."""
+        if not self.enabled:
+            return
+        stream = stream or sys.stderr
+        width = max([len(name) for name, _ in self.phases] + [5])
+        print("Notexio startup profile", file=stream)
+        for name, seconds in self.phases:
+            print(f"  {name:<{width}}  {seconds * 1000:8.1f} ms", file=stream)
+        total = time.perf_counter() - self.start_time
+        print(f"  {'total':<{width}}  {total * 1000:8.1f} ms", file=stream)
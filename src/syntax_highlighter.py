@@ -0,0 +1,245 @@
+"""
+Syntax highlighting for Notexio text editor.
+"""
+import tkinter as tk
+
+from src.lexers import TOKEN_TYPES, select_lexer
+
+
+class HighlightState:
+    """Lexer and per-line cache of one document.
+
+    states[i] is the lexer state at the start of line i + 1; only the first
+    `valid` entries are known to be current. tagged[i] is 1 while line i + 1
+    carries up-to-date tags.
+    """
+
+    def __init__(self, lexer, filepath, line_count):
+        self.lexer = lexer
+        self.filepath = filepath
+        self.states = [None] * line_count
+        self.tagged = bytearray(line_count)
+        self.valid = 1
+
+
+class SyntaxHighlighter:
+    """Highlights the visible lines of each document with a line lexer.
+
+    The lexer state at the start of every line is cached. An edit re-lexes
+    from its first line only until the state matches the cached one again,
+    and tags are applied to the visible lines plus a margin, so the work per
+    keystroke does not depend on the length of the document.
+    """
+
+    MARGIN_LINES = 50
+    DETECT_LINES = 200  # lines sniffed when the extension does not decide
+    FETCH_LINES = 200  # lines read from the widget per get() while lexing
+    TAG_BATCH_SIZE = 2000
+    TAGS = tuple(f"syntax_{token_type}" for token_type in TOKEN_TYPES)
+
+    def __init__(self, editor, settings_manager):
+        self.editor = editor
+        self.settings_manager = settings_manager
+        self.enabled = settings_manager.get_setting("syntax_highlighting", True)
+        self.colors = {}  # token type -> foreground, set by the theme
+        self.documents = {}  # text widget -> HighlightState
+        self.active_widget = None
+        self.active_filepath = None
+        self.language = "Plain text"
+
+        self.editor.add_text_widget_callback(self.bind_text_widget)
+        self.editor.add_text_delta_listener(self.on_text_delta)
+
+    def toggle(self):
+        """Turn highlighting on or off."""
+        self.enabled = not self.enabled
+        self.settings_manager.set_setting("syntax_highlighting", self.enabled)
+        # Edits made while disabled were not tracked; start over either way
+        for text_widget in list(self.documents):
+            self.clear_tags(text_widget)
+        self.documents.clear()
+        self.active_widget = None
+        self.update_language()
+
+    def bind_text_widget(self, text_widget):
+        """Configure the syntax tags and follow scrolling in a document."""
+        self.configure_tags(text_widget)
+        text_widget.bind("<<ViewportChanged>>", lambda e: self.tag_visible(e.widget), add="+")
+        text_widget.bind("<Destroy>", self.on_destroy, add="+")
+
+    def configure_tags(self, text_widget):
+        for token_type, tag in zip(TOKEN_TYPES, self.TAGS):
+            text_widget.tag_config(tag, foreground=self.colors.get(token_type, ""))
+            # Below selection and the other markup tags
+            text_widget.tag_lower(tag)
+
+    def set_colors(self, colors):
+        """Use a theme's syntax colors (token type -> color)."""
+        self.colors = dict(colors)
+        for text_widget in self.editor.text_widgets:
+            self.configure_tags(text_widget)
+
+    def clear_tags(self, text_widget):
+        if text_widget.winfo_exists():
+            for tag in self.TAGS:
+                text_widget.tag_remove(tag, 1.0, tk.END)
+
+    def on_destroy(self, event):
+        self.documents.pop(event.widget, None)
+        if event.widget is self.active_widget:
+            self.active_widget = None
+
+    def update_language(self):
+        """Pick the lexer for the active document when its file changes."""
+        text_widget = self.editor.document_widget(self.editor.text_widget)
+        filepath = self.editor.current_file
+        if text_widget is self.active_widget and filepath == self.active_filepath:
+            return
+        self.active_widget = text_widget
+        self.active_filepath = filepath
+
+        document = self.documents.get(text_widget)
+        if document is None or document.filepath != filepath:
+            head = text_widget.get(1.0, f"{self.DETECT_LINES}.0")
+            lexer = select_lexer(filepath, head)
+            if document is not None and type(document.lexer) is type(lexer):
+                document.filepath = filepath
+            else:
+                if document is not None:
+                    self.clear_tags(text_widget)
+                document = HighlightState(lexer, filepath, self.line_count(text_widget))
+            if self.enabled:
+                self.documents[text_widget] = document
+
+        self.language = document.lexer.name
+        if self.editor.ui_components:
+            self.editor.ui_components.set_file_type(self.language)
+        if self.enabled:
+            self.tag_visible(text_widget)
+
+    @staticmethod
+    def line_count(text_widget):
+        return int(text_widget.index("end-1c").split(".")[0])
+
+    def visible_lines(self, text_widget):
+        """First and last line to highlight: the visible lines plus a margin."""
+        first = int(text_widget.index("@0,0").split(".")[0])
+        last = int(text_widget.index(f"@0,{text_widget.winfo_height()}").split(".")[0])
+        return max(1, first - self.MARGIN_LINES), min(self.line_count(text_widget), last + self.MARGIN_LINES)
+
+    def iter_lines(self, text_widget, first, last):
+        """Lines first..last of a document, read a block at a time."""
+        while first <= last:
+            block_last = min(last, first + self.FETCH_LINES - 1)
+            yield from text_widget.get(f"{first}.0", f"{block_last}.end").split("\n")
+            first = block_last + 1
+
+    def on_text_delta(self, text_widget, first_line, old_text, new_text):
+        """Shift the line cache over an edit and re-lex from its first line."""
+        document = self.documents.get(self.editor.document_widget(text_widget))
+        if document is None:
+            return
+        old_lines = old_text.count("\n") + 1
+        new_lines = new_text.count("\n") + 1
+        start = first_line - 1
+        # Whether the cached state after the edited lines can be compared against
+        state_after_known = document.valid > start + old_lines
+        document.states[start + 1:start + old_lines] = [None] * (new_lines - 1)
+        document.tagged[start:start + old_lines] = bytes(new_lines)
+        if document.valid <= start:
+            # Not lexed this far yet; tag_visible catches up when it is shown
+            return
+        if state_after_known:
+            document.valid += new_lines - old_lines
+        else:
+            document.valid = first_line
+
+        self.relex(text_widget, document, first_line, new_text.split("\n"))
+        # Every pane of a split document shows the new tags
+        for view in self.editor.text_views(text_widget):
+            self.tag_visible(view)
+
+    def relex(self, text_widget, document, first_line, edited_lines):
+        """Re-lex from an edit until the line state converges with the cache."""
+        last_edited = first_line + len(edited_lines) - 1
+        line_count = len(document.states)
+        # Past the viewport, stop and leave the rest to tag_visible
+        stop = max(first_line, self.visible_lines(text_widget)[1])
+        lines = iter(edited_lines)
+        lex_line = document.lexer.lex_line
+        state = document.states[first_line - 1]
+        line = first_line
+        while True:
+            text = next(lines, None)
+            if text is None:
+                lines = self.iter_lines(text_widget, line, line_count)
+                text = next(lines)
+            _, state = lex_line(text, state)
+            if line >= line_count:
+                document.valid = line_count
+                return
+            if line >= last_edited and line < document.valid and document.states[line] == state:
+                return
+            document.states[line] = state
+            document.tagged[line] = 0
+            line += 1
+            if line > stop:
+                document.valid = line
+                document.tagged[line:] = bytes(line_count - line)
+                return
+
+    def ensure_states(self, text_widget, document, last_line):
+        """Lex up to last_line so its start state is known."""
+        if document.valid >= last_line:
+            return
+        lex_line = document.lexer.lex_line
+        states = document.states
+        line = document.valid
+        state = states[line - 1]
+        for text in self.iter_lines(text_widget, line, last_line - 1):
+            _, state = lex_line(text, state)
+            if states[line] != state:
+                states[line] = state
+                document.tagged[line] = 0
+            line += 1
+        document.valid = last_line
+
+    def tag_visible(self, text_widget):
+        """Tag the untagged lines in and around the viewport."""
+        # The line cache belongs to the document; peers share it and the tags
+        document = self.documents.get(self.editor.document_widget(text_widget))
+        if document is None or not text_widget.winfo_exists():
+            return
+        if len(document.states) != self.line_count(text_widget):
+            # Out of step (content changed while untracked); start over
+            document = HighlightState(document.lexer, document.filepath, self.line_count(text_widget))
+            self.documents[self.editor.document_widget(text_widget)] = document
+            self.clear_tags(text_widget)
+
+        first, last = self.visible_lines(text_widget)
+        self.ensure_states(text_widget, document, last)
+        tagged = document.tagged
+        start = tagged.find(0, first - 1, last)
+        while start != -1:
+            end = tagged.find(1, start, last)
+            if end == -1:
+                end = last
+            self.tag_lines(text_widget, document, start + 1, end)
+            tagged[start:end] = b"\x01" * (end - start)
+            start = tagged.find(0, end, last)
+
+    def tag_lines(self, text_widget, document, first, last):
+        """Replace the syntax tags of lines first..last."""
+        lex_line = document.lexer.lex_line
+        states = document.states
+        indices = {}
+        for line, text in enumerate(self.iter_lines(text_widget, first, last), first):
+            tokens, _ = lex_line(text, states[line - 1])
+            for start, end, token_type in tokens:
+                indices.setdefault(token_type, []).extend((f"{line}.{start}", f"{line}.{end}"))
+
+        for tag in self.TAGS:
+            text_widget.tag_remove(tag, f"{first}.0", f"{last}.end")
+        for token_type, token_indices in indices.items():
+            for i in range(0, len(token_indices), self.TAG_BATCH_SIZE):
+                text_widget.tag_add(f"syntax_{token_type}", *token_indices[i:i + self.TAG_BATCH_SIZE])
@@ -0,0 +1,429 @@
+"""
+Multi-document tab management for Notexio text editor.
+"""
+import tkinter as tk
+from tkinter import messagebox
+import os
+import shutil
+import tempfile
+import time
+import zlib
+
+from src.file_io import read_text_file
+
+
+class Document:
+    """State of one open document (one tab)."""
+
+    def __init__(self, frame, filepath=None):
+        self.frame = frame
+        self.text_widget = None
+        self.filepath = filepath
+        self.is_modified = False
+        # Lazy tabs (e.g. restored from a session) are read on first selection
+        self.is_loaded = filepath is None
+        self.view_state = None
+        # Compressed content of a hibernated tab whose widget was destroyed
+        self.hibernated_path = None
+        # Formatting (styles, runs) of a hibernated tab, kept in memory since it
+        # is small; None when its widget had none loaded (see Formatter.formatting_loaded)
+        self.hibernated_formatting = None
+        # Unsaved content from a previous session, loaded instead of the file
+        self.recovery_path = None
+        self.last_active = time.monotonic()
+
+    @property
+    def is_hibernated(self):
+        """Whether the document content lives in the temp store."""
+        return self.hibernated_path is not None
+
+
+class TabManager:
+    """Manages document tabs, lazy loading and hibernation of inactive tabs."""
+
+    def __init__(self, editor, settings_manager, file_manager):
+        self.editor = editor
+        self.settings_manager = settings_manager
+        self.file_manager = file_manager
+        self.notebook = editor.notebook
+        self.documents = {}  # Notebook page path -> Document
+        self.current = None
+        self.store_dir = None
+        self.hibernate_after_id = None
+
+        # Adopt the tab created by the editor
+        frame = self.notebook.nametowidget(self.notebook.tabs()[0])
+        document = Document(frame)
+        document.text_widget = self.editor.text_widget
+        self.documents[str(frame)] = document
+        self.current = document
+
+        self.notebook.bind("<<NotebookTabChanged>>", self.on_tab_changed)
+        self.schedule_hibernation()
+
+    @property
+    def hibernate_after(self):
+        """Seconds a tab may stay inactive before it is hibernated (0 disables)."""
+        return int(self.settings_manager.get_setting("tab_hibernate_after", 600))
+
+    def get_documents(self):
+        """Get all documents in tab order."""
+        return [self.documents[path] for path in self.notebook.tabs() if path in self.documents]
+
+    def new_tab(self, filepath=None, select=True, lazy=False, view_state=None,
+                recovery_path=None, position=tk.END):
+        """Add a new tab, optionally for a file that is read on first selection."""
+        frame = tk.Frame(self.notebook)
+        document = Document(frame, filepath)
+        document.view_state = view_state
+        if recovery_path:
+            document.recovery_path = recovery_path
+            document.is_loaded = False
+            document.is_modified = True
+        self.documents[str(frame)] = document
+        self.notebook.insert(position, frame, text=self._tab_text(document))
+
+        if select:
+            # Materialized on activation
+            self.select(document)
+        elif not lazy:
+            self._materialize(document)
+        return document
+
+    def select(self, document):
+        """Select a document's tab and make it the active document."""
+        self.notebook.select(document.frame)
+        # <<NotebookTabChanged>> is queued, activate right away
+        self._activate(document)
+
+    def select_file(self, filepath):
+        """Select the tab showing filepath. Returns False if it is not open."""
+        target = os.path.normcase(os.path.abspath(filepath))
+        for document in self.get_documents():
+            path = self.get_document_path(document)
+            if path and os.path.normcase(os.path.abspath(path)) == target:
+                self.select(document)
+                return True
+        return False
+
+    def open_target(self):
+        """Return the tab a newly opened file should be loaded into.
+
+        A blank, unmodified Untitled tab is reused; otherwise a new tab is added.
+        """
+        if self.is_blank(self.current):
+            return self.current
+        return self.new_tab()
+
+    def is_blank(self, document):
+        """Whether a document is an empty, unmodified Untitled tab."""
+        if document is None or document.text_widget is None:
+            return False
+        return (not self.get_document_path(document)
+                and not self.is_document_modified(document)
+                and not document.text_widget.compare("end-1c", "!=", "1.0"))
+
+    def next_tab(self):
+        """Select the next tab."""
+        self._select_relative(1)
+
+    def previous_tab(self):
+        """Select the previous tab."""
+        self._select_relative(-1)
+
+    def _select_relative(self, step):
+        """Select the tab step positions away from the current one."""
+        tabs = self.notebook.tabs()
+        if len(tabs) < 2 or not self.current:
+            return
+        index = tabs.index(str(self.current.frame))
+        self.select(self.documents[tabs[(index + step) % len(tabs)]])
+
+    def on_tab_changed(self, event=None):
+        """Handle tab selection by the user."""
+        selected = self.notebook.select()
+        document = self.documents.get(str(selected))
+        if document:
+            self._activate(document)
+
+    def _activate(self, document):
+        """Point the editor at a document's widget and state."""
+        if document is self.current:
+            return
+        if not self._materialize(document):
+            self._activate_fallback(document)
+            return
+        if self.current:
+            self._store_editor_state(self.current)
+
+        self.current = document
+        document.last_active = time.monotonic()
+
+        self.editor.text_widget = document.text_widget
+        self.editor.current_file = document.filepath
+        self.editor.is_modified = document.is_modified
+        self.editor.update_title()
+        document.text_widget.focus_set()
+
+        ui_components = self.editor.ui_components
+        if ui_components:
+            if getattr(ui_components, 'status_bar', None):
+                ui_components.update_status_bar()
+            if ui_components.line_numbers_visible:
+                ui_components.update_line_numbers()
+
+    def _activate_fallback(self, failed):
+        """Show another tab after failed could not be loaded (it is retried when selected again)."""
+        fallback = self.current
+        if fallback is None or fallback.text_widget is None:
+            fallback = next(
+                (document for document in self.get_documents()
+                 if document is not failed and document.text_widget is not None),
+                None
+            )
+        if fallback is None:
+            fallback = self.new_tab(select=False)
+        self.notebook.select(fallback.frame)
+        self._activate(fallback)
+
+    def _store_editor_state(self, document):
+        """Copy the editor's per-document state back into a document."""
+        document.filepath = self.editor.current_file
+        document.is_modified = self.editor.is_modified
+        document.last_active = time.monotonic()
+        if document.text_widget is not None and document.text_widget.winfo_exists():
+            document.view_state = self.capture_view_state(document.text_widget)
+
+    def _materialize(self, document):
+        """Make sure a document has a text widget, loading its content if needed.
+
+        Returns False when the content cannot be read. The document then stays
+        unloaded (a hibernated one keeps its store file), so an empty buffer is
+        never attached to its file.
+        """
+        if document.text_widget is not None:
+            return True
+
+        content = None
+        from_file = False
+        formatting = None
+        if document.is_hibernated:
+            try:
+                with open(document.hibernated_path, 'rb') as f:
+                    content = zlib.decompress(f.read()).decode('utf-8')
+            except Exception as e:
+                messagebox.showerror("Error", f"Failed to restore tab:\n{str(e)}")
+                return False
+            try:
+                os.remove(document.hibernated_path)
+            except OSError:
+                pass
+            document.hibernated_path = None
+            formatting = document.hibernated_formatting
+            document.hibernated_formatting = None
+        elif not document.is_loaded and (document.recovery_path or document.filepath):
+            try:
+                content = read_text_file(document.recovery_path or document.filepath)
+            except Exception as e:
+                messagebox.showerror("Error", f"Failed to open file:\n{str(e)}")
+                return False
+            from_file = not document.recovery_path
+            document.recovery_path = None
+        document.is_loaded = True
+
+        text_widget = self.editor.create_text_widget(document.frame)
+        if content:
+            text_widget.insert(1.0, content)
+            # Formatting saved with the file (recovered text has none)
+            if from_file:
+                self.file_manager.restore_formatting(document.filepath, text_widget, content)
+        if formatting is not None and getattr(self.editor, 'formatter', None):
+            self.editor.formatter.apply_formatting(text_widget, content or "", *formatting)
+        text_widget.edit_reset()
+        text_widget.edit_modified(False)
+        if document.view_state:
+            self.apply_view_state(text_widget, document.view_state)
+        document.text_widget = text_widget
+        return True
+
+    def get_content(self, document):
+        """Get a loaded document's text, including hibernated tabs."""
+        if document.text_widget is not None:
+            return document.text_widget.get(1.0, tk.END + "-1c")
+        if document.is_hibernated:
+            with open(document.hibernated_path, 'rb') as f:
+                return zlib.decompress(f.read()).decode('utf-8')
+        return None
+
+    def get_view_state(self, document):
+        """Get a document's current view state, wherever it lives."""
+        if document.text_widget is not None and document.text_widget.winfo_exists():
+            return self.capture_view_state(document.text_widget)
+        return document.view_state
+
+    def is_document_modified(self, document):
+        """Whether a document has unsaved changes."""
+        if document is self.current:
+            return self.editor.is_modified
+        return document.is_modified
+
+    def get_document_path(self, document):
+        """Get the file path of a document."""
+        if document is self.current:
+            return self.editor.current_file
+        return document.filepath
+
+    def capture_view_state(self, text_widget):
+        """Capture cursor, scroll position and selection of a text widget."""
+        return {
+            "cursor": text_widget.index(tk.INSERT),
+            "yview": text_widget.yview()[0],
+            "selection": [str(index) for index in text_widget.tag_ranges(tk.SEL)]
+        }
+
+    def apply_view_state(self, text_widget, view_state):
+        """Restore cursor, scroll position and selection of a text widget."""
+        try:
+            text_widget.mark_set(tk.INSERT, view_state.get("cursor", "1.0"))
+            selection = view_state.get("selection") or []
+            if len(selection) >= 2:
+                text_widget.tag_add(tk.SEL, *selection)
+            text_widget.yview_moveto(view_state.get("yview", 0.0))
+            # Scroll again once the widget has its real size
+            text_widget.after_idle(text_widget.yview_moveto, view_state.get("yview", 0.0))
+        except tk.TclError:
+            pass
+
+    def update_tab_title(self, document=None):
+        """Refresh a tab's label (defaults to the current tab)."""
+        document = document or self.current
+        if document and str(document.frame) in self.documents:
+            self.notebook.tab(document.frame, text=self._tab_text(document))
+
+    def _tab_text(self, document):
+        """Build the label shown on a tab."""
+        filepath = self.get_document_path(document)
+        is_modified = self.is_document_modified(document)
+        title = os.path.basename(filepath) if filepath else "Untitled"
+        if is_modified:
+            title += " *"
+        return title
+
+    def close_tab(self, document=None):
+        """Close a tab after checking for unsaved changes."""
+        document = document or self.current
+        if document is None:
+            return False
+        if self.is_document_modified(document):
+            self.select(document)
+            if not self.file_manager.check_unsaved_changes():
+                return False
+
+        if len(self.documents) == 1:
+            # Keep one blank tab open, like closing the last document in Notepad
+            self.file_manager.stop_following()
+            self.editor.text_widget.delete(1.0, tk.END)
+            self.editor.text_widget.edit_reset()
+            self.editor.text_widget.edit_modified(False)
+            self.editor.current_file = None
+            self.editor.is_modified = False
+            self.editor.update_title()
+            return True
+
+        del self.documents[str(document.frame)]
+        self._discard_store(document)
+        was_current = document is self.current
+        if was_current:
+            self.current = None
+        self.notebook.forget(document.frame)
+        document.frame.destroy()
+        if was_current:
+            self.on_tab_changed()
+        return True
+
+    def check_all_unsaved(self):
+        """Prompt for every modified tab. Returns False if the user cancelled."""
+        for document in self.get_documents():
+            if self.is_document_modified(document):
+                self.select(document)
+                if not self.file_manager.check_unsaved_changes():
+                    return False
+        return True
+
+    def schedule_hibernation(self):
+        """Periodically hibernate tabs that have been inactive for too long."""
+        self.hibernate_after_id = self.editor.root.after(30000, self._hibernation_tick)
+
+    def _hibernation_tick(self):
+        """Timer callback for hibernate_inactive."""
+        self.hibernate_inactive()
+        self.schedule_hibernation()
+
+    def hibernate_inactive(self):
+        """Hibernate every loaded background tab inactive past the threshold."""
+        threshold = self.hibernate_after
+        if threshold <= 0:
+            return
+        now = time.monotonic()
+        for document in self.get_documents():
+            if document is self.current or document.text_widget is None:
+                continue
+            if now - document.last_active < threshold:
+                continue
+            follower = self.editor.log_follower
+            if follower and follower.text_widget is document.text_widget:
+                continue
+            self.hibernate(document)
+
+    def hibernate(self, document):
+        """Compress a background tab's content to the temp store and destroy its widget."""
+        text_widget = document.text_widget
+        document.view_state = self.capture_view_state(text_widget)
+        content = text_widget.get(1.0, tk.END + "-1c")
+
+        if self.store_dir is None:
+            self.store_dir = tempfile.mkdtemp(prefix="notexio-tabs-")
+        fd, path = tempfile.mkstemp(suffix=".tab", dir=self.store_dir)
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(zlib.compress(content.encode('utf-8'), 1))
+        except Exception as e:
+            print(f"Error hibernating tab: {e}")
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            return False
+
+        document.hibernated_path = path
+        formatter = getattr(self.editor, 'formatter', None)
+        if formatter:
+            styles, runs = formatter.formatting_runs(text_widget, content)
+            if runs or text_widget in formatter.formatting_loaded:
+                document.hibernated_formatting = (styles, runs)
+        document.text_widget = None
+        # ScrolledText forwards geometry methods to its frame but not destroy;
+        # destroying the frame takes the scrollbar with it
+        text_widget.frame.destroy()
+        return True
+
+    def _discard_store(self, document):
+        """Delete a document's hibernated content."""
+        if document.is_hibernated:
+            try:
+                os.remove(document.hibernated_path)
+            except OSError:
+                pass
+            document.hibernated_path = None
+
+    def cleanup(self):
+        """Stop timers and remove the hibernation store."""
+        if self.hibernate_after_id is not None:
+            try:
+                self.editor.root.after_cancel(self.hibernate_after_id)
+            except tk.TclError:
+                pass
+            self.hibernate_after_id = None
+        if self.store_dir:
+            shutil.rmtree(self.store_dir, ignore_errors=True)
+            self.store_dir = None
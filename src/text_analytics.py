@@ -0,0 +1,328 @@
+"""
+Tk-free document analytics for Notexio text editor.
+
+Documents are processed paragraph by paragraph (blank lines separate
+paragraphs; very long runs of lines are split into chunks), and can be read
+in pieces rather than as one string. Results are cached per paragraph hash
+within a size budget, so after an edit only the changed paragraphs are
+analysed again and the document totals are patched instead of recomputed.
+"""
+import hashlib
+import heapq
+import re
+from collections import Counter, OrderedDict
+from functools import lru_cache
+
+from src.text_operations import WORD_RE
+
+
+# Paragraphs longer than this are analysed in chunks of this many lines
+MAX_PARAGRAPH_LINES = 500
+
+_BLANK_LINES_RE = re.compile(r'\n[ \t]*\n')
+
+
+def iter_paragraphs(content, max_lines=MAX_PARAGRAPH_LINES):
+    """Yield the paragraphs of content without building a list of lines.
+
+    content is a string or an iterable of consecutive pieces of one; only
+    the paragraph being read is held in memory.
+    """
+    if isinstance(content, str):
+        content = (content,)
+    pending = ""
+    for piece in content:
+        pending += piece
+        position = 0
+        for match in _BLANK_LINES_RE.finditer(pending):
+            yield from _split_long(pending[position:match.start()], max_lines)
+            position = match.end()
+        pending = pending[position:]
+        # A paragraph with more lines than max_lines is split anyway; do it as it arrives
+        while _nth_newline(pending, max_lines + 1) != -1:
+            cut = _nth_newline(pending, max_lines)
+            yield pending[:cut]
+            pending = pending[cut + 1:]
+    yield from _split_long(pending, max_lines)
+
+
+def _nth_newline(text, n):
+    """Position of the nth newline in text, or -1 if it has fewer."""
+    position = -1
+    for _ in range(n):
+        position = text.find("\n", position + 1)
+        if position == -1:
+            break
+    return position
+
+
+def _split_long(paragraph, max_lines):
+    """Split a paragraph that has more than max_lines lines."""
+    if not paragraph.strip():
+        return
+    if paragraph.count("\n") < max_lines:
+        yield paragraph
+        return
+    lines = paragraph.split("\n")
+    for first in range(0, len(lines), max_lines):
+        yield "\n".join(lines[first:first + max_lines])
+
+
+def paragraph_key(paragraph):
+    """Stable cache key for a paragraph."""
+    return hashlib.blake2b(paragraph.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+
+
+class ParagraphCache:
+    """Per-paragraph results combined into document totals.
+
+    Subclasses implement new_totals(), analyse(paragraph) and
+    add(totals, result, sign); add() must also accept totals as the result.
+    Cached results are limited to CACHE_BUDGET by size(result), dropping the
+    oldest analysed first. When a paragraph whose result was dropped goes
+    away, the totals cannot be patched and are counted again from scratch.
+    """
+
+    CACHE_BUDGET = 100000
+
+    def __init__(self):
+        self.cache = OrderedDict()  # paragraph key -> analysis result, oldest first
+        self.cache_size = 0
+        self.counts = Counter()  # paragraph key -> occurrences in the document
+        self.totals = self.new_totals()
+
+    def new_totals(self):
+        """Empty document totals."""
+        raise NotImplementedError
+
+    def analyse(self, paragraph):
+        """Analyse one paragraph."""
+        raise NotImplementedError
+
+    def add(self, totals, result, sign):
+        """Add (sign=1) or remove (sign=-1) a paragraph result from the totals."""
+        raise NotImplementedError
+
+    def size(self, result):
+        """Share of CACHE_BUDGET a cached result takes."""
+        return 1
+
+    def _cache(self, key, result):
+        self.cache[key] = result
+        self.cache_size += self.size(result)
+        while self.cache_size > self.CACHE_BUDGET and len(self.cache) > 1:
+            _, dropped = self.cache.popitem(last=False)
+            self.cache_size -= self.size(dropped)
+
+    def update(self, content, cancel_event=None):
+        """Bring the totals up to date with content (a string or pieces of one).
+
+        Returns False if cancelled, and also when the totals had to be
+        cleared; the next update then counts the whole document.
+        """
+        counts = Counter()
+        added = self.new_totals()
+        for paragraph in iter_paragraphs(content):
+            if cancel_event is not None and cancel_event.is_set():
+                return False
+            key = paragraph_key(paragraph)
+            counts[key] += 1
+            if counts[key] <= self.counts[key]:
+                # Already in the totals
+                continue
+            result = self.cache.get(key)
+            if result is None:
+                result = self.analyse(paragraph)
+                self._cache(key, result)
+            self.add(added, result, 1)
+        if cancel_event is not None and cancel_event.is_set():
+            return False
+
+        removed = self.counts - counts
+        if any(key not in self.cache for key in removed):
+            self.counts = Counter()
+            self.totals = self.new_totals()
+            return False
+        for key, count in removed.items():
+            self.add(self.totals, self.cache[key], -count)
+        self.add(self.totals, added, 1)
+
+        for key in set(self.cache) - set(counts):
+            self.cache_size -= self.size(self.cache.pop(key))
+        self.counts = counts
+        return True
+
+
+class FrequencyIndex(ParagraphCache):
+    """Word, bigram and trigram frequencies of a document.
+
+    N-grams do not cross paragraph boundaries.
+    """
+
+    NGRAM_SIZES = (1, 2, 3)
+    CACHE_BUDGET = 250000  # cached terms, a few tens of MB
+
+    def new_totals(self):
+        return {"tokens": 0, **{n: Counter() for n in self.NGRAM_SIZES}}
+
+    def analyse(self, paragraph):
+        words = WORD_RE.findall(paragraph.lower())
+        result = {"tokens": len(words), 1: Counter(words)}
+        for n in self.NGRAM_SIZES[1:]:
+            result[n] = Counter(" ".join(words[i:i + n]) for i in range(len(words) - n + 1))
+        return result
+
+    def size(self, result):
+        return 1 + sum(len(result[n]) for n in self.NGRAM_SIZES)
+
+    def add(self, totals, result, sign):
+        totals["tokens"] += sign * result["tokens"]
+        for n in self.NGRAM_SIZES:
+            total = totals[n]
+            for term, count in result[n].items():
+                value = total[term] + sign * count
+                if value > 0:
+                    total[term] = value
+                else:
+                    del total[term]
+
+    def top(self, n, k=20, stop_words=frozenset()):
+        """The k most frequent n-grams as (term, count) pairs.
+
+        N-grams made up only of stop words are skipped.
+        """
+        items = self.totals[n].items()
+        if stop_words:
+            items = (item for item in items if not stop_words.issuperset(item[0].split(" ")))
+        return heapq.nlargest(k, items, key=lambda item: item[1])
+
+    def summary(self):
+        """Token count, vocabulary size and type/token ratio."""
+        tokens = self.totals["tokens"]
+        vocabulary = len(self.totals[1])
+        return {
+            "tokens": tokens,
+            "vocabulary": vocabulary,
+            "type_token_ratio": vocabulary / tokens if tokens else 0.0,
+        }
+
+
+_SENTENCE_END_RE = re.compile(r'(?<=[.!?])["\')\]]*\s+')
+_VOWEL_GROUPS_RE = re.compile(r'[aeiouy]+')
+
+
+@lru_cache(maxsize=65536)
+def count_syllables(word):
+    """Estimate the syllables in an English word (vowel groups, silent final e)."""
+    word = word.lower()
+    if not word.isalpha():
+        return 1
+    syllables = len(_VOWEL_GROUPS_RE.findall(word))
+    if word.endswith("e") and not word.endswith(("le", "ee", "ye")) and syllables > 1:
+        syllables -= 1
+    return max(1, syllables)
+
+
+def split_sentences(paragraph):
+    """Split a paragraph into sentences; the paragraph end always ends one."""
+    return [sentence for sentence in _SENTENCE_END_RE.split(paragraph) if WORD_RE.search(sentence)]
+
+
+class ReadabilityIndex(ParagraphCache):
+    """Sentence, word and syllable counts behind the readability scores."""
+
+    LONGEST_SENTENCES = 5
+    COUNTS = ("sentences", "words", "syllables", "complex_words")
+
+    def new_totals(self):
+        return dict.fromkeys(self.COUNTS, 0)
+
+    def analyse(self, paragraph):
+        result = self.new_totals()
+        longest = []
+        for sentence in split_sentences(paragraph):
+            words = WORD_RE.findall(sentence)
+            syllables = [count_syllables(word) for word in words]
+            result["sentences"] += 1
+            result["words"] += len(words)
+            result["syllables"] += sum(syllables)
+            # Gunning fog counts words of three or more syllables as complex
+            result["complex_words"] += sum(1 for count in syllables if count >= 3)
+            longest.append((len(words), " ".join(sentence.split())))
+        result["longest"] = heapq.nlargest(self.LONGEST_SENTENCES, longest)
+        return result
+
+    def add(self, totals, result, sign):
+        for key in self.COUNTS:
+            totals[key] += sign * result[key]
+
+    def longest_sentences(self, k=LONGEST_SENTENCES):
+        """The k longest sentences of the document as (word count, text) pairs.
+
+        Only paragraphs whose results are still cached are searched.
+        """
+        return heapq.nlargest(k, (
+            sentence
+            for key in self.counts if key in self.cache
+            for sentence in self.cache[key]["longest"]
+        ))
+
+    def scores(self):
+        """Flesch reading ease, Flesch-Kincaid grade, Gunning fog and sentence stats."""
+        totals = self.totals
+        sentences = totals["sentences"]
+        words = totals["words"]
+        if not sentences or not words:
+            return {"sentences": sentences, "words": words, "flesch_reading_ease": None,
+                    "flesch_kincaid_grade": None, "gunning_fog": None,
+                    "average_sentence_length": 0.0, "average_syllables_per_word": 0.0}
+        words_per_sentence = words / sentences
+        syllables_per_word = totals["syllables"] / words
+        return {
+            "sentences": sentences,
+            "words": words,
+            "flesch_reading_ease": 206.835 - 1.015 * words_per_sentence - 84.6 * syllables_per_word,
+            "flesch_kincaid_grade": 0.39 * words_per_sentence + 11.8 * syllables_per_word - 15.59,
+            "gunning_fog": 0.4 * (words_per_sentence + 100 * totals["complex_words"] / words),
+            "average_sentence_length": words_per_sentence,
+            "average_syllables_per_word": syllables_per_word,
+        }
+
+
+def describe_reading_ease(score):
+    """Plain-language band for a Flesch reading ease score."""
+    if score >= 90:
+        return "very easy"
+    if score >= 70:
+        return "easy"
+    if score >= 60:
+        return "standard"
+    if score >= 50:
+        return "fairly difficult"
+    if score >= 30:
+        return "difficult"
+    return "very difficult"
+
+
+def format_readability(scores, longest):
+    """Format readability scores and the longest sentences as report text."""
+    if scores["flesch_reading_ease"] is None:
+        return "Not enough text to score."
+    lines = [
+        f"Flesch reading ease: {scores['flesch_reading_ease']:.1f} "
+        f"({describe_reading_ease(scores['flesch_reading_ease'])})",
+        f"Flesch-Kincaid grade level: {scores['flesch_kincaid_grade']:.1f}",
+        f"Gunning fog index: {scores['gunning_fog']:.1f}",
+        "",
+        f"Sentences: {scores['sentences']:,}",
+        f"Words: {scores['words']:,}",
+        f"Average sentence length: {scores['average_sentence_length']:.1f} words",
+        f"Average syllables per word: {scores['average_syllables_per_word']:.2f}",
+    ]
+    if longest:
+        lines += ["", "Longest sentences:"]
+        for words, sentence in longest:
+            if len(sentence) > 120:
+                sentence = sentence[:117] + "..."
+            lines.append(f"  {words} words: {sentence}")
+    return "\n".join(lines)
@@ -0,0 +1,111 @@
+"""
+Tk-free text processing shared by the editor and the command line interface.
+"""
+import re
+
+
+# Average reading speed: 200-250 words per minute
+WORDS_PER_MINUTE = 225.0
+
+WORD_RE = re.compile(r'\b\w+\b')
+
+# Very common English words, skipped when looking for repeated words
+STOP_WORDS = frozenset("""
+a about after all also an and any are as at be been but by can could did do
+does for from had has have he her him his how i if in into is it its just me
+my no not of on one or our out she so than that the their them then there
+these they this to up us was we were what when which who will with would you
+your
+""".split())
+
+
+def word_count(content):
+    """Count whitespace-separated words."""
+    return len(content.split())
+
+
+def character_count(content, include_spaces=True):
+    """Count characters, optionally ignoring spaces, tabs and newlines."""
+    if include_spaces:
+        return len(content)
+    return len(content.replace(" ", "").replace("\n", "").replace("\t", ""))
+
+
+def line_count(content):
+    """Count lines (an empty document has one line)."""
+    return content.count("\n") + 1
+
+
+def reading_time(words):
+    """Format the estimated reading time for a number of words."""
+    minutes = words / WORDS_PER_MINUTE
+    if minutes < 1:
+        return f"{int(minutes * 60)} seconds"
+    return f"{minutes:.1f} minutes"
+
+
+def document_statistics(content):
+    """Collect the statistics shown by Tools.show_statistics."""
+    words = word_count(content)
+    return {
+        "words": words,
+        "characters": character_count(content, include_spaces=True),
+        "characters_no_spaces": character_count(content, include_spaces=False),
+        "lines": line_count(content),
+        "reading_time": reading_time(words),
+    }
+
+
+def find_duplicate_words(content, min_length=1, stop_words=frozenset()):
+    """Map each word (lowercased) that occurs more than once to its count."""
+    counts = {}
+    for word in WORD_RE.findall(content.lower()):
+        if len(word) >= min_length and word not in stop_words:
+            counts[word] = counts.get(word, 0) + 1
+    return {word: count for word, count in counts.items() if count > 1}
+
+
+def word_occurrences(content, min_length=1, stop_words=frozenset(), first_line=1):
+    """Map each lowercased word to its (line, start column, end column) occurrences.
+
+    One tokenization pass; columns are counted per line so callers can build
+    "line.column" text indices without counting characters from the start.
+    """
+    occurrences = {}
+    for line_number, line in enumerate(content.split("\n"), first_line):
+        for match in WORD_RE.finditer(line):
+            word = match.group().lower()
+            if len(word) < min_length or word in stop_words:
+                continue
+            spans = occurrences.get(word)
+            if spans is None:
+                occurrences[word] = spans = []
+            spans.append((line_number, match.start(), match.end()))
+    return occurrences
+
+
+def remove_extra_spaces(content):
+    """Collapse runs of spaces and strip spaces at line starts and ends."""
+    # Remove multiple spaces, but preserve single spaces
+    content = re.sub(r' +', ' ', content)
+    # Remove spaces at start of lines
+    content = re.sub(r'\n +', '\n', content)
+    # Remove trailing spaces
+    content = re.sub(r' +\n', '\n', content)
+    return content
+
+
+def replace_all(content, search_term, replace_term, case_sensitive=False):
+    """Replace every occurrence of search_term. Returns (new_content, count)."""
+    if not search_term:
+        return content, 0
+    if case_sensitive:
+        count = content.count(search_term)
+        return content.replace(search_term, replace_term), count
+    return re.subn(
+        re.escape(search_term),
+        # Replacement is literal text, not a regex template
+        lambda match: replace_term,
+        content,
+        flags=re.IGNORECASE
+    )
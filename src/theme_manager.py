@@ -3,126 +3,221 @@ Theme management for Notexio text editor.
 """
 import tkinter as tk
 
+from src.theme_packs import ThemeError, ThemeLibrary, validate_theme
+
 
 class ThemeManager:
-    """Manages themes."""
+    """Manages themes.
+    
+    Widgets register with a role (toolbar button, status label, menu, ...).
+    A theme is compiled once into options per role, so applying it is one
+    config call per registered widget.
+    """
+    
+    SAVE_DELAY = 1000  # ms before a theme change is written to the settings
+    # Used when not even the light pack can be loaded
+    FALLBACK_THEME = {"name": "Light", "bg": "#FFFFFF", "fg": "#000000"}
     
     def __init__(self, editor, settings_manager):
         self.editor = editor
         self.settings_manager = settings_manager
         self.current_theme = "light"
+        # widget -> role
+        self.registry = {}
+        # theme name -> (theme it was compiled from, role -> widget options)
+        self.compiled_themes = {}
+        # Options of the applied theme (None until a theme is applied)
+        self.compiled = None
+        self.save_after_id = None
+        
+        # Theme packs (themes/*.json, *.toml), parsed when first applied
+        self.library = ThemeLibrary()
+        
+        # Custom theme (user-defined), kept in the settings
+        self.custom_theme = self.load_custom_theme()
+        
+        self.register(self.editor.root, "root")
+        self.editor.add_text_widget_callback(lambda text_widget: self.register(text_widget, "text"))
         
-        # Windows Notepad-style theme color schemes
-        self.themes = {
-            "light": {
-                "bg": "#FFFFFF",
-                "fg": "#000000",
-                "select_bg": "#0078D4",
-                "select_fg": "#FFFFFF",
-                "insert_bg": "#000000",
-                "menu_bg": "#FAFAFA",
-                "menu_fg": "#000000",
-                "toolbar_bg": "#FAFAFA",
-                "status_bg": "#F0F0F0",
-                "border": "#E5E5E5"
+    def compile_theme(self, theme):
+        """Turn a theme's colors into widget options per role.
+        
+        Missing keys fall back to the basic colors, so a two-color custom
+        theme still styles every role.
+        """
+        bg = theme["bg"]
+        fg = theme["fg"]
+        select_bg = theme.get("select_bg", "#0078D4")
+        select_fg = theme.get("select_fg", "#FFFFFF")
+        menu_bg = theme.get("menu_bg", bg)
+        menu_fg = theme.get("menu_fg", fg)
+        toolbar_bg = theme.get("toolbar_bg", menu_bg)
+        status_bg = theme.get("status_bg", menu_bg)
+        status_fg = theme.get("status_fg", menu_fg)
+        border = theme.get("border", "#D0D0D0")
+        button_bg = theme.get("button_bg", toolbar_bg)
+        button_fg = theme.get("button_fg", menu_fg)
+        button_active_bg = theme.get("button_active_bg", border)
+        button_active_fg = theme.get("button_active_fg", button_fg)
+        return {
+            "root": {"bg": bg},
+            "text": {
+                "bg": bg,
+                "fg": fg,
+                "selectbackground": select_bg,
+                "selectforeground": select_fg,
+                "insertbackground": theme.get("insert_bg", fg)
+            },
+            "menubar": {"bg": menu_bg, "fg": menu_fg, "activebackground": select_bg, "activeforeground": select_fg},
+            "menu": {
+                "bg": theme.get("menu_dropdown_bg", bg),
+                "fg": theme.get("menu_dropdown_fg", fg),
+                "activebackground": select_bg,
+                "activeforeground": select_fg
+            },
+            "toolbar": {"bg": toolbar_bg},
+            "toolbar_border": {"bg": theme.get("toolbar_border", border)},
+            "toolbar_button": {
+                "bg": button_bg,
+                "fg": button_fg,
+                "activebackground": button_active_bg,
+                "activeforeground": button_active_fg
             },
-            "dark": {
-                "bg": "#202020",  # Modern Notepad dark background
-                "fg": "#D4D4D4",  # Light text
-                "select_bg": "#0078D4",  # Windows blue selection
-                "select_fg": "#FFFFFF",
-                "insert_bg": "#D4D4D4",
-                "menu_bg": "#2D2D30",  # Dark menu bar
-                "menu_fg": "#CCCCCC",
-                "toolbar_bg": "#2D2D30",  # Dark toolbar
-                "status_bg": "#007ACC",  # Blue status bar like Notepad
-                "border": "#3E3E42",
-                "status_fg": "#FFFFFF"  # White text on status bar
+            "toolbar_separator": {"bg": theme.get("separator", border)},
+            "status_bar": {"bg": status_bg},
+            "status_border": {"bg": theme.get("status_border", border)},
+            "status_label": {"bg": status_bg, "fg": status_fg},
+            "status_separator": {"bg": theme.get("status_separator", theme.get("separator", border))},
+            "gutter": {"bg": theme.get("gutter_bg", menu_bg), "fg": theme.get("gutter_fg", "#808080")},
+            "gutter_frame": {"bg": theme.get("gutter_bg", menu_bg)},
+            "gutter_border": {"bg": border},
+            "dialog": {"bg": theme.get("dialog_bg", menu_bg)},
+            "dialog_label": {"bg": theme.get("dialog_bg", menu_bg), "fg": menu_fg},
+            "dialog_button": {
+                "bg": button_bg,
+                "fg": button_fg,
+                "activebackground": button_active_bg,
+                "activeforeground": button_active_fg
+            },
+            "dialog_check": {
+                "bg": theme.get("dialog_bg", menu_bg),
+                "fg": menu_fg,
+                "activebackground": theme.get("dialog_bg", menu_bg),
+                "activeforeground": menu_fg,
+                "selectcolor": bg
+            },
+            "dialog_input": {
+                "bg": bg,
+                "fg": fg,
+                "selectbackground": select_bg,
+                "selectforeground": select_fg
             }
         }
         
-        # Custom theme (user-defined)
-        self.custom_theme = None
-        
-    def apply_theme(self, theme_name):
-        """Apply a theme."""
-        if theme_name == "custom" and self.custom_theme:
-            theme = self.custom_theme
-        elif theme_name in self.themes:
-            theme = self.themes[theme_name]
-        else:
-            theme = self.themes["light"]
-            
+    def get_theme(self, theme_name):
+        """Theme colors by name (unknown or broken packs fall back to light)."""
+        if theme_name == "custom":
+            # No colors saved with the preference (older settings): quietly use light
+            return self.custom_theme or self.get_theme("light")
+        try:
+            return self.library.load(theme_name)
+        except ThemeError as e:
+            print(f"Error loading theme: {e}")
+        if theme_name != "light":
+            return self.get_theme("light")
+        return self.FALLBACK_THEME
+        
+    def get_theme_names(self):
+        """Names of the installed theme packs."""
+        return self.library.names()
+        
+    def get_compiled(self, theme_name, theme):
+        """Role options for a theme, compiled once per version of its files."""
+        cached = self.compiled_themes.get(theme_name)
+        # The library hands out the same theme object until a file changes
+        if cached is None or cached[0] is not theme:
+            cached = (theme, self.compile_theme(theme))
+            self.compiled_themes[theme_name] = cached
+        return cached[1]
+        
+    def register(self, widget, role):
+        """Theme a widget by role, now and on every theme change."""
+        self.registry[widget] = role
+        if self.compiled is not None:
+            options = self.compiled.get(role)
+            if options:
+                widget.config(**options)
+                
+    # Dialog widget classes and their roles
+    DIALOG_ROLES = {
+        "Toplevel": "dialog",
+        "Frame": "dialog",
+        "Labelframe": "dialog_label",
+        "Label": "dialog_label",
+        "Button": "dialog_button",
+        "Checkbutton": "dialog_check",
+        "Radiobutton": "dialog_check",
+        "Entry": "dialog_input",
+        "Listbox": "dialog_input",
+        "Text": "dialog_input",
+    }
+    
+    def register_dialog(self, dialog, exclude=()):
+        """Register a dialog and its (classic Tk) widgets by class.
+        
+        ttk widgets follow the ttk style and are left alone, as are the
+        widgets in exclude (color previews and the like).
+        """
+        widgets = [dialog]
+        while widgets:
+            widget = widgets.pop()
+            if widget in exclude:
+                continue
+            role = self.DIALOG_ROLES.get(widget.winfo_class())
+            if role:
+                self.register(widget, role)
+            widgets.extend(widget.winfo_children())
+        # Forget the dialog's widgets when it closes
+        dialog.bind("<Destroy>", lambda e: self.registry.pop(e.widget, None), add="+")
+        
+    def apply_theme(self, theme_name, save=True):
+        """Apply a theme with one config call per registered widget."""
+        theme = self.get_theme(theme_name)
         self.current_theme = theme_name
+        self.compiled = self.get_compiled(theme_name, theme)
+        
+        for widget, role in list(self.registry.items()):
+            options = self.compiled.get(role)
+            if not options:
+                continue
+            try:
+                widget.config(**options)
+            except tk.TclError:
+                if not widget.winfo_exists():
+                    # Destroyed since it was registered
+                    del self.registry[widget]
+        
+        # Syntax colors; a theme without them borrows light's or dark's by its background
+        if self.editor.syntax_highlighter:
+            syntax = theme.get("syntax")
+            if not syntax:
+                red, green, blue = self.editor.root.winfo_rgb(theme["bg"])
+                syntax = self.get_theme("dark" if red + green + blue < 3 * 65535 / 2 else "light").get("syntax", {})
+            self.editor.syntax_highlighter.set_colors(syntax)
         
-        # Apply to text widget
-        self.editor.text_widget.config(
-            bg=theme["bg"],
-            fg=theme["fg"],
-            selectbackground=theme["select_bg"],
-            selectforeground=theme["select_fg"],
-            insertbackground=theme["insert_bg"]
-        )
-        
-        # Apply to root window
-        self.editor.root.config(bg=theme["bg"])
-        
-        # Apply to UI components if available - modern Notepad style
-        if hasattr(self.editor, 'ui_components') and self.editor.ui_components:
-            if hasattr(self.editor.ui_components, 'toolbar_frame') and self.editor.ui_components.toolbar_frame:
-                toolbar_bg = theme.get("toolbar_bg", theme["menu_bg"])
-                toolbar_fg = theme.get("menu_fg", theme["fg"])
-                    
-                self.editor.ui_components.toolbar_frame.config(bg=toolbar_bg)
-                # Update toolbar buttons
-                for widget in self.editor.ui_components.toolbar_frame.winfo_children():
-                    if isinstance(widget, tk.Frame):
-                        widget.config(bg=toolbar_bg)
-                        for btn in widget.winfo_children():
-                            if isinstance(btn, tk.Button):
-                                if theme_name == "dark":
-                                    btn.config(bg="#3E3E42", fg="#CCCCCC", activebackground="#505050", activeforeground="#FFFFFF")
-                                else:
-                                    btn.config(bg="#FAFAFA", fg="#000000", activebackground="#E8E8E8", activeforeground="#000000")
-                                    
-            if hasattr(self.editor.ui_components, 'status_bar') and self.editor.ui_components.status_bar:
-                status_bg = theme.get("status_bg", theme["menu_bg"])
-                status_fg = theme.get("status_fg", theme.get("menu_fg", theme["fg"]))
-                    
-                self.editor.ui_components.status_bar.config(bg=status_bg)
-                # Update status bar border
-                if hasattr(self.editor.ui_components, 'status_border'):
-                    if theme_name == "dark":
-                        self.editor.ui_components.status_border.config(bg="#4A9EFF")
-                    else:
-                        self.editor.ui_components.status_border.config(bg="#D0D0D0")
-                        
-                # Update all status bar labels directly
-                status_labels = [
-                    'status_text', 'position_label', 'word_count_label', 
-                    'file_type_label', 'zoom_label', 'line_ending_label', 'encoding_label'
-                ]
-                for label_name in status_labels:
-                    if hasattr(self.editor.ui_components, label_name):
-                        label = getattr(self.editor.ui_components, label_name)
-                        if label:
-                            label.config(bg=status_bg, fg=status_fg)
-                        
-                # Update status bar labels and separators in frames
-                for widget in self.editor.ui_components.status_bar.winfo_children():
-                    if isinstance(widget, tk.Frame):
-                        widget.config(bg=status_bg)
-                        for child in widget.winfo_children():
-                            if isinstance(child, tk.Label):
-                                child.config(bg=status_bg, fg=status_fg)
-                            elif isinstance(child, tk.Frame):  # Separator
-                                if theme_name == "dark":
-                                    child.config(bg="#4A9EFF")  # Lighter blue for separator
-                                else:
-                                    child.config(bg="#D0D0D0")
-        
-        # Store theme preference
-        self.settings_manager.save_theme(theme_name)
+        # Store theme preference once switching settles
+        if save:
+            self.schedule_save()
+            
+    def schedule_save(self):
+        """Save the theme preference after a short delay (restarts on every call)."""
+        if self.save_after_id is not None:
+            self.editor.root.after_cancel(self.save_after_id)
+        self.save_after_id = self.editor.root.after(self.SAVE_DELAY, self.save_theme)
+        
+    def save_theme(self):
+        self.save_after_id = None
+        self.settings_manager.save_theme(self.current_theme)
         
     def set_light_mode(self):
         """Set light mode."""
@@ -143,7 +238,20 @@ class ThemeManager:
             "menu_bg": bg_color,
             "menu_fg": fg_color
         }
+        self.settings_manager.set_setting("custom_theme", self.custom_theme)
         self.apply_theme("custom")
+
+    def load_custom_theme(self):
+        """Custom theme colors saved in the settings, or None."""
+        theme = self.settings_manager.get_setting("custom_theme")
+        if theme is None:
+            return None
+        try:
+            validate_theme(theme)
+        except ThemeError as e:
+            print(f"Error loading custom theme: {e}")
+            return None
+        return theme
         
     def customize_theme(self):
         """Open theme customization dialog."""
@@ -205,10 +313,12 @@ class ThemeManager:
                 
         tk.Button(button_frame, text="Apply", command=apply_theme, width=12, height=1).pack(side=tk.LEFT, padx=5)
         tk.Button(button_frame, text="Cancel", command=dialog.destroy, width=12, height=1).pack(side=tk.LEFT, padx=5)
+        self.register_dialog(dialog, exclude=(bg_preview, fg_preview))
             
     def load_theme(self):
         """Load theme from settings."""
         theme = self.settings_manager.load_theme()
         if theme:
-            self.apply_theme(theme)
+            # Already the stored preference - no need to rewrite the settings file
+            self.apply_theme(theme, save=False)
 
@@ -0,0 +1,175 @@
+"""
+Tk-free loading of theme packs for Notexio text editor.
+
+A theme pack is a JSON or TOML file in the themes directory; its name is the
+file name without the extension. A pack may extend another one and only list
+the colors it changes:
+
+    extends = "dark"
+    bg = "#000000"
+
+    [syntax]
+    comment = "#7CA668"
+
+Packs are parsed and validated when first used, and the resolved theme is
+kept until one of the files it was built from changes.
+"""
+import json
+import os
+import re
+
+try:
+    import tomllib
+except ImportError:  # Python < 3.11: only JSON packs
+    tomllib = None
+
+from src.lexers import TOKEN_TYPES
+
+
+# Project root (parent of the src directory), so themes are found from any working directory
+THEME_DIRECTORY = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "themes")
+
+# Colors a theme may set; everything but bg and fg is optional
+COLOR_KEYS = (
+    "bg", "fg", "select_bg", "select_fg", "insert_bg",
+    "menu_bg", "menu_fg", "menu_dropdown_bg", "menu_dropdown_fg",
+    "toolbar_bg", "toolbar_border", "separator", "border",
+    "button_bg", "button_fg", "button_active_bg", "button_active_fg",
+    "status_bg", "status_fg", "status_border", "status_separator",
+    "gutter_bg", "gutter_fg", "dialog_bg",
+)
+REQUIRED_KEYS = ("bg", "fg")
+
+# "#rgb" style hex colors; names are not accepted, since only Tk could tell a
+# real one ("dark slate gray") from a typo, and only once the theme is applied
+_COLOR_RE = re.compile(r"#(?:[0-9a-fA-F]{3}){1,4}")
+
+
+class ThemeError(ValueError):
+    """A theme pack that cannot be used."""
+
+
+def theme_label(name):
+    """Menu label for a pack name: high_contrast -> High Contrast"""
+    return name.replace("_", " ").replace("-", " ").title()
+
+
+def parse_theme_file(path):
+    """Raw contents of a theme file."""
+    if path.endswith(".toml"):
+        with open(path, "rb") as f:
+            return tomllib.load(f)
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def validate_theme(data):
+    """Check the keys and colors of one theme file; raises ThemeError."""
+    if not isinstance(data, dict):
+        raise ThemeError("a theme must be a table of colors")
+    for key, value in data.items():
+        if key == "name" or key == "extends":
+            if not isinstance(value, str):
+                raise ThemeError(f"'{key}' must be a string")
+        elif key == "syntax":
+            if not isinstance(value, dict):
+                raise ThemeError("'syntax' must be a table of token colors")
+            for token_type, color in value.items():
+                if token_type not in TOKEN_TYPES:
+                    raise ThemeError(f"unknown token type '{token_type}'")
+                _check_color(f"syntax.{token_type}", color)
+        elif key in COLOR_KEYS:
+            _check_color(key, value)
+        else:
+            raise ThemeError(f"unknown key '{key}'")
+
+
+def _check_color(key, color):
+    if not isinstance(color, str) or not _COLOR_RE.fullmatch(color):
+        raise ThemeError(f"'{key}' is not a hex color: {color!r}")
+
+
+class ThemeLibrary:
+    """The theme packs of a directory, loaded on first use."""
+
+    def __init__(self, directory=THEME_DIRECTORY):
+        self.directory = directory
+        self.paths = {}  # theme name -> file
+        self.paths_stamp = None  # directory mtime the paths were listed at
+        # theme name -> (((file, mtime), ...) of the theme and its bases, resolved theme)
+        self.cache = {}
+
+    def scan(self):
+        """Theme name -> file, re-listed only when the directory changes."""
+        try:
+            stamp = os.stat(self.directory).st_mtime_ns
+        except OSError:
+            self.paths, self.paths_stamp = {}, None
+            return self.paths
+        if stamp != self.paths_stamp:
+            extensions = (".json", ".toml") if tomllib else (".json",)
+            paths = {}
+            with os.scandir(self.directory) as entries:
+                for entry in entries:
+                    name, extension = os.path.splitext(entry.name)
+                    # JSON wins when both exist
+                    if extension in extensions and entry.is_file() and (name not in paths or extension == ".json"):
+                        paths[name] = entry.path
+            self.paths, self.paths_stamp = paths, stamp
+        return self.paths
+
+    def names(self):
+        """Names of the available theme packs (no pack is parsed)."""
+        return sorted(self.scan())
+
+    def load(self, name):
+        """Resolved theme by name (bases merged in); raises ThemeError."""
+        return self._load(name, ())
+
+    def _load(self, name, extending):
+        if name in extending:
+            raise ThemeError(f"themes extend each other: {' -> '.join(extending + (name,))}")
+        cached = self.cache.get(name)
+        if cached is not None and self._is_current(cached[0]):
+            return cached[1]
+
+        path = self.scan().get(name)
+        if path is None:
+            raise ThemeError(f"no theme named '{name}' in {self.directory}")
+        try:
+            stamp = os.stat(path).st_mtime_ns
+            data = parse_theme_file(path)
+        except (OSError, ValueError) as e:
+            # ValueError covers JSON and TOML syntax errors
+            raise ThemeError(f"{path}: {e}") from e
+        try:
+            validate_theme(data)
+        except ThemeError as e:
+            raise ThemeError(f"{path}: {e}") from e
+
+        stamps = ((path, stamp),)
+        theme = {}
+        base = data.get("extends")
+        if base:
+            theme = dict(self._load(base, extending + (name,)))
+            theme["syntax"] = dict(theme.get("syntax", {}))
+            stamps += self.cache[base][0]
+        for key, value in data.items():
+            if key == "syntax":
+                theme.setdefault("syntax", {}).update(value)
+            elif key not in ("extends", "name"):
+                theme[key] = value
+        theme["name"] = data.get("name", theme_label(name))
+        missing = [key for key in REQUIRED_KEYS if key not in theme]
+        if missing:
+            raise ThemeError(f"{path}: missing {', '.join(missing)}")
+
+        self.cache[name] = (stamps, theme)
+        return theme
+
+    @staticmethod
+    def _is_current(stamps):
+        try:
+            return all(os.stat(path).st_mtime_ns == stamp for path, stamp in stamps)
+        except OSError:
+            return False
@@ -3,114 +3,178 @@ Tools and statistics for Notexio text editor.
 """
 import tkinter as tk
 from tkinter import messagebox
-import re
+import zlib
+
+from src import text_operations
 
 
 class Tools:
     """Manages tools and statistics."""
     
-    def __init__(self, editor):
+    # Lines per lazily tagged block of duplicate-word highlights
+    DUPLICATE_BLOCK_LINES = 200
+    # Index pairs passed to a single tag_add call
+    TAG_BATCH_SIZE = 2000
+    
+    def __init__(self, editor, settings_manager=None):
         self.editor = editor
+        self.settings_manager = settings_manager
+        self.duplicate_state = {}  # text widget -> blocks still to be tagged
+        self.duplicate_bound = set()
+        
+    def get_setting(self, key, default):
+        """Read a setting, falling back to default without a settings manager."""
+        if self.settings_manager is None:
+            return default
+        return self.settings_manager.get_setting(key, default)
+        
+    def get_content(self):
+        """Get the document text."""
+        return self.editor.text_widget.get(1.0, tk.END + "-1c")
         
     def get_word_count(self):
         """Get word count."""
-        content = self.editor.text_widget.get(1.0, tk.END + "-1c")
-        words = content.split()
-        return len(words)
+        return text_operations.word_count(self.get_content())
         
     def get_character_count(self, include_spaces=True):
         """Get character count."""
-        content = self.editor.text_widget.get(1.0, tk.END + "-1c")
-        if include_spaces:
-            return len(content)
-        else:
-            return len(content.replace(" ", "").replace("\n", "").replace("\t", ""))
+        return text_operations.character_count(self.get_content(), include_spaces)
             
     def get_line_count(self):
         """Get line count."""
-        content = self.editor.text_widget.get(1.0, tk.END)
-        return len(content.split("\n"))
+        return text_operations.line_count(self.get_content())
         
     def get_reading_time(self):
         """Estimate reading time in minutes."""
-        word_count = self.get_word_count()
-        # Average reading speed: 200-250 words per minute
-        # Using 225 as average
-        minutes = word_count / 225.0
-        if minutes < 1:
-            return f"{int(minutes * 60)} seconds"
-        else:
-            return f"{minutes:.1f} minutes"
+        return text_operations.reading_time(self.get_word_count())
             
     def show_statistics(self):
         """Show document statistics."""
-        word_count = self.get_word_count()
-        char_count_with_spaces = self.get_character_count(include_spaces=True)
-        char_count_without_spaces = self.get_character_count(include_spaces=False)
-        line_count = self.get_line_count()
-        reading_time = self.get_reading_time()
+        stats = text_operations.document_statistics(self.get_content())
         
-        stats = f"""Document Statistics:
+        message = f"""Document Statistics:
 
-Words: {word_count:,}
-Characters (with spaces): {char_count_with_spaces:,}
-Characters (without spaces): {char_count_without_spaces:,}
-Lines: {line_count:,}
-Reading time: {reading_time}"""
+Words: {stats["words"]:,}
+Characters (with spaces): {stats["characters"]:,}
+Characters (without spaces): {stats["characters_no_spaces"]:,}
+Lines: {stats["lines"]:,}
+Reading time: {stats["reading_time"]}"""
         
-        messagebox.showinfo("Document Statistics", stats)
+        messagebox.showinfo("Document Statistics", message)
         
     def highlight_duplicate_words(self):
         """Highlight duplicate words in the document."""
-        content = self.editor.text_widget.get(1.0, tk.END + "-1c")
+        text_widget = self.editor.text_widget
+        content = self.get_content()
         
-        # Find all words
-        words = re.findall(r'\b\w+\b', content.lower())
-        
-        # Count word occurrences
-        word_count = {}
-        for word in words:
-            word_count[word] = word_count.get(word, 0) + 1
-            
-        # Find duplicates (words that appear more than once)
-        duplicates = {word: count for word, count in word_count.items() if count > 1}
+        # One tokenization pass records where every word occurs
+        stop_words = text_operations.STOP_WORDS if self.get_setting("duplicate_skip_stop_words", True) else frozenset()
+        occurrences = text_operations.word_occurrences(
+            content,
+            min_length=self.get_setting("duplicate_min_length", 3),
+            stop_words=stop_words
+        )
+        duplicates = {word: spans for word, spans in occurrences.items() if len(spans) > 1}
         
+        self.remove_duplicate_highlights()
         if not duplicates:
             messagebox.showinfo("Duplicate Words", "No duplicate words found.")
             return
             
-        # Highlight duplicates
-        self.editor.text_widget.tag_remove("duplicate", 1.0, tk.END)
-        self.editor.text_widget.tag_config("duplicate", background="#FFFF00")
-        
-        # Find and highlight all occurrences of duplicate words
-        content_lower = content.lower()
-        for word in duplicates.keys():
-            pattern = r'\b' + re.escape(word) + r'\b'
-            for match in re.finditer(pattern, content_lower):
-                start_pos = f"1.0 + {match.start()} chars"
-                end_pos = f"1.0 + {match.end()} chars"
-                self.editor.text_widget.tag_add("duplicate", start_pos, end_pos)
+        # Group the hits into blocks of lines; blocks are tagged when they scroll into view
+        blocks = {}
+        for spans in duplicates.values():
+            for span in spans:
+                blocks.setdefault((span[0] - 1) // self.DUPLICATE_BLOCK_LINES, []).append(span)
+        lines = content.split("\n")
+        checksums = [
+            zlib.crc32("\n".join(lines[first:first + self.DUPLICATE_BLOCK_LINES]).encode("utf-8"))
+            for first in range(0, len(lines), self.DUPLICATE_BLOCK_LINES)
+        ]
+        self.duplicate_state[text_widget] = {
+            "words": set(duplicates),
+            "blocks": blocks,
+            "checksums": checksums,
+            "pending": set(range(len(checksums))),
+        }
+        
+        text_widget.tag_config("duplicate", background="#FFFF00")
+        if text_widget not in self.duplicate_bound:
+            text_widget.bind("<<ViewportChanged>>", self.on_duplicate_viewport_changed, add="+")
+            text_widget.bind("<Destroy>", self.on_duplicate_widget_destroyed, add="+")
+            self.duplicate_bound.add(text_widget)
+        self.tag_visible_duplicates(text_widget)
                 
         messagebox.showinfo(
             "Duplicate Words",
             f"Found {len(duplicates)} duplicate word(s). Highlighted in yellow."
         )
         
+    def on_duplicate_viewport_changed(self, event):
+        """Tag duplicates that have scrolled into view."""
+        if event.widget in self.duplicate_state:
+            self.tag_visible_duplicates(event.widget)
+            
+    def on_duplicate_widget_destroyed(self, event):
+        """Forget state of closed or hibernated documents."""
+        self.duplicate_state.pop(event.widget, None)
+        self.duplicate_bound.discard(event.widget)
+        
+    def tag_visible_duplicates(self, text_widget):
+        """Tag the blocks around the visible lines that are not tagged yet."""
+        state = self.duplicate_state[text_widget]
+        first_line = int(text_widget.index("@0,0").split(".")[0])
+        last_line = int(text_widget.index(f"@0,{text_widget.winfo_height()}").split(".")[0])
+        
+        # One block of margin on each side so short scrolls are already highlighted
+        first_block = max(0, (first_line - 1) // self.DUPLICATE_BLOCK_LINES - 1)
+        last_block = (last_line - 1) // self.DUPLICATE_BLOCK_LINES + 1
+        for block in range(first_block, last_block + 1):
+            if block in state["pending"]:
+                state["pending"].discard(block)
+                self.tag_duplicate_block(text_widget, state, block)
+                
+        if not state["pending"]:
+            del self.duplicate_state[text_widget]
+            
+    def tag_duplicate_block(self, text_widget, state, block):
+        """Tag one block of lines with batched tag_add calls."""
+        first_line = block * self.DUPLICATE_BLOCK_LINES + 1
+        last_line = min(
+            first_line + self.DUPLICATE_BLOCK_LINES - 1,
+            int(text_widget.index("end-1c").split(".")[0])
+        )
+        if last_line < first_line:
+            return
+            
+        spans = state["blocks"].get(block, [])
+        block_text = text_widget.get(f"{first_line}.0", f"{last_line}.end")
+        if zlib.crc32(block_text.encode("utf-8")) != state["checksums"][block]:
+            # Edited since the scan: find the known duplicate words in the current text
+            words = state["words"]
+            spans = [
+                span
+                for word, word_spans in text_operations.word_occurrences(block_text, first_line=first_line).items()
+                if word in words
+                for span in word_spans
+            ]
+            
+        indices = []
+        for line, start, end in spans:
+            indices.append(f"{line}.{start}")
+            indices.append(f"{line}.{end}")
+        for i in range(0, len(indices), self.TAG_BATCH_SIZE):
+            text_widget.tag_add("duplicate", *indices[i:i + self.TAG_BATCH_SIZE])
+        
     def remove_duplicate_highlights(self):
         """Remove duplicate word highlights."""
+        self.duplicate_state.pop(self.editor.text_widget, None)
         self.editor.text_widget.tag_remove("duplicate", 1.0, tk.END)
         
     def remove_extra_spaces(self):
         """Remove extra spaces from document."""
-        content = self.editor.text_widget.get(1.0, tk.END + "-1c")
-        
-        # Remove multiple spaces, but preserve single spaces
-        content_new = re.sub(r' +', ' ', content)
-        # Remove spaces at start of lines
-        content_new = re.sub(r'\n +', '\n', content_new)
-        # Remove trailing spaces
-        content_new = re.sub(r' +\n', '\n', content_new)
+        content = self.get_content()
+        content_new = text_operations.remove_extra_spaces(content)
         
         if content_new != content:
             self.editor.text_widget.delete(1.0, tk.END)
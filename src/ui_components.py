@@ -2,23 +2,26 @@
 UI components for Notexio text editor.
 """
 import tkinter as tk
-from tkinter import ttk
 import os
 
 
 class UIComponents:
-    """Manages UI components like toolbar, status bar, and tabs."""
+    """Manages UI components like toolbar, status bar, and line numbers."""
     
     def __init__(self, editor):
         self.editor = editor
         self.toolbar_frame = None
         self.status_bar = None
-        self.notebook = None
-        self.tabs = {}  # Dictionary to track open tabs
+        self.file_type = "Plain text"
         self.line_numbers = None
         self.line_numbers_visible = False
         self.app = None  # Will be set by main app
         
+    def register_theme(self, widget, role):
+        """Let the theme manager color a widget by role."""
+        if getattr(self.editor, 'theme_manager', None):
+            self.editor.theme_manager.register(widget, role)
+            
     def create_toolbar(self):
         """Create Windows Notepad-style minimal toolbar."""
         # Clean, minimal toolbar matching Windows Notepad
@@ -28,16 +31,20 @@ class UIComponents:
             height=40,
             relief=tk.FLAT
         )
-        self.toolbar_frame.pack(side=tk.TOP, fill=tk.X, padx=0, pady=0)
+        # Packed ahead of the text area so it stays on top when built after it
+        self.toolbar_frame.pack(side=tk.TOP, fill=tk.X, padx=0, pady=0, before=self.editor.text_container)
         self.toolbar_frame.pack_propagate(False)
+        self.register_theme(self.toolbar_frame, "toolbar")
         
         # Subtle bottom border for separation
         border = tk.Frame(self.toolbar_frame, height=1, bg="#E1E1E1")
         border.pack(side=tk.BOTTOM, fill=tk.X)
+        self.register_theme(border, "toolbar_border")
         
         # Inner frame with proper spacing
         inner_frame = tk.Frame(self.toolbar_frame, bg="#FAFAFA")
         inner_frame.pack(side=tk.LEFT, padx=8, pady=6)
+        self.register_theme(inner_frame, "toolbar")
         
         # Clean toolbar buttons - Windows Notepad style
         buttons = [
@@ -58,6 +65,7 @@ class UIComponents:
                 # Clean separator
                 sep = tk.Frame(inner_frame, width=1, bg="#D0D0D0", height=20)
                 sep.pack(side=tk.LEFT, padx=4, pady=2, fill=tk.Y)
+                self.register_theme(sep, "toolbar_separator")
             else:
                 # Windows Notepad-style button
                 btn = tk.Button(
@@ -78,15 +86,17 @@ class UIComponents:
                     cursor="hand2"
                 )
                 btn.pack(side=tk.LEFT, padx=1, pady=0)
+                self.register_theme(btn, "toolbar_button")
                 
-                # Smooth hover effect
+                # Smooth hover effect in the theme's colors
                 def on_enter(e, b=btn):
                     if b.cget("state") != tk.DISABLED:
-                        b.config(bg="#E8E8E8")
+                        b.normal_bg = b.cget("bg")
+                        b.config(bg=b.cget("activebackground"))
                         
                 def on_leave(e, b=btn):
-                    if b.cget("state") != tk.DISABLED:
-                        b.config(bg="#FAFAFA")
+                    if b.cget("state") != tk.DISABLED and hasattr(b, 'normal_bg'):
+                        b.config(bg=b.normal_bg)
                         
                 btn.bind("<Enter>", on_enter)
                 btn.bind("<Leave>", on_leave)
@@ -121,16 +131,19 @@ class UIComponents:
             height=22,
             relief=tk.FLAT
         )
-        self.status_bar.pack(side=tk.BOTTOM, fill=tk.X, padx=0, pady=0)
+        self.status_bar.pack(side=tk.BOTTOM, fill=tk.X, padx=0, pady=0, before=self.editor.text_container)
         self.status_bar.pack_propagate(False)
+        self.register_theme(self.status_bar, "status_bar")
         
         # Top border - will be themed
         self.status_border = tk.Frame(self.status_bar, height=1, bg="#D0D0D0")
         self.status_border.pack(side=tk.TOP, fill=tk.X)
+        self.register_theme(self.status_border, "status_border")
         
         # Content frame
         content_frame = tk.Frame(self.status_bar, bg="#F0F0F0")
         content_frame.pack(fill=tk.BOTH, expand=True, padx=0, pady=0)
+        self.register_theme(content_frame, "status_bar")
         
         # Left side - file status
         self.status_text = tk.Label(
@@ -144,10 +157,12 @@ class UIComponents:
             font=("Segoe UI", 9)
         )
         self.status_text.pack(side=tk.LEFT)
+        self.register_theme(self.status_text, "status_label")
         
         # Right side - position and stats (like modern Notepad)
         right_frame = tk.Frame(content_frame, bg="#F0F0F0")
         right_frame.pack(side=tk.RIGHT)
+        self.register_theme(right_frame, "status_bar")
         
         # Encoding (like Notepad) - UTF-8
         self.encoding_label = tk.Label(
@@ -161,10 +176,12 @@ class UIComponents:
             font=("Segoe UI", 9)
         )
         self.encoding_label.pack(side=tk.RIGHT)
+        self.register_theme(self.encoding_label, "status_label")
         
         # Separator
         sep3 = tk.Frame(right_frame, width=1, bg="#D0D0D0", height=14)
         sep3.pack(side=tk.RIGHT, padx=4, pady=4, fill=tk.Y)
+        self.register_theme(sep3, "status_separator")
         
         # Line endings (like Notepad) - Windows (CRLF)
         self.line_ending_label = tk.Label(
@@ -178,10 +195,12 @@ class UIComponents:
             font=("Segoe UI", 9)
         )
         self.line_ending_label.pack(side=tk.RIGHT)
+        self.register_theme(self.line_ending_label, "status_label")
         
         # Separator
         sep2 = tk.Frame(right_frame, width=1, bg="#D0D0D0", height=14)
         sep2.pack(side=tk.RIGHT, padx=4, pady=4, fill=tk.Y)
+        self.register_theme(sep2, "status_separator")
         
         # Zoom level (like Notepad)
         self.zoom_label = tk.Label(
@@ -195,15 +214,17 @@ class UIComponents:
             font=("Segoe UI", 9)
         )
         self.zoom_label.pack(side=tk.RIGHT)
+        self.register_theme(self.zoom_label, "status_label")
         
         # Separator
         sep1 = tk.Frame(right_frame, width=1, bg="#D0D0D0", height=14)
         sep1.pack(side=tk.RIGHT, padx=4, pady=4, fill=tk.Y)
+        self.register_theme(sep1, "status_separator")
         
         # File type (like Notepad)
         self.file_type_label = tk.Label(
             right_frame,
-            text="Plain text",
+            text=self.file_type,
             anchor=tk.E,
             padx=8,
             pady=2,
@@ -212,10 +233,12 @@ class UIComponents:
             font=("Segoe UI", 9)
         )
         self.file_type_label.pack(side=tk.RIGHT)
+        self.register_theme(self.file_type_label, "status_label")
         
         # Separator
         sep0 = tk.Frame(right_frame, width=1, bg="#D0D0D0", height=14)
         sep0.pack(side=tk.RIGHT, padx=4, pady=4, fill=tk.Y)
+        self.register_theme(sep0, "status_separator")
         
         # Character count
         self.word_count_label = tk.Label(
@@ -229,10 +252,12 @@ class UIComponents:
             font=("Segoe UI", 9)
         )
         self.word_count_label.pack(side=tk.RIGHT)
+        self.register_theme(self.word_count_label, "status_label")
         
         # Separator - will be themed
         self.status_sep = tk.Frame(right_frame, width=1, bg="#D0D0D0", height=14)
         self.status_sep.pack(side=tk.RIGHT, padx=4, pady=4, fill=tk.Y)
+        self.register_theme(self.status_sep, "status_separator")
         
         # Line/Column info - Windows Notepad style
         self.position_label = tk.Label(
@@ -246,14 +271,29 @@ class UIComponents:
             font=("Segoe UI", 9)
         )
         self.position_label.pack(side=tk.RIGHT)
+        self.register_theme(self.position_label, "status_label")
+        
+        # Update status bar on text changes (in every tab)
+        self.editor.add_text_widget_callback(self.bind_status_events)
         
-        # Update status bar on text changes
-        self.editor.text_widget.bind("<KeyRelease>", self.update_status_bar)
-        self.editor.text_widget.bind("<Button-1>", self.update_status_bar)
-        self.editor.text_widget.bind("<Key>", lambda e: self.editor.root.after(10, self.update_status_bar))
+    def set_file_type(self, file_type):
+        """Show the language of the active document."""
+        self.file_type = file_type
+        if self.status_bar:
+            self.file_type_label.config(text=file_type)
+            
+    def bind_status_events(self, text_widget):
+        """Update the status bar when a document text widget changes."""
+        text_widget.bind("<KeyRelease>", self.update_status_bar)
+        text_widget.bind("<Button-1>", self.update_status_bar)
+        text_widget.bind("<Key>", lambda e: self.editor.root.after(10, self.update_status_bar))
         
     def update_status_bar(self, event=None):
         """Update status bar information - Windows Notepad style."""
+        # The status bar is built after the first paint
+        if not self.status_bar:
+            return
+            
         # Get cursor position
         cursor_pos = self.editor.text_widget.index(tk.INSERT)
         line, col = cursor_pos.split('.')
@@ -285,70 +325,6 @@ class UIComponents:
                 
         self.status_text.config(text=status)
         
-    def create_tabs(self):
-        """Create tabbed interface for multiple files."""
-        # Create notebook for tabs
-        self.notebook = ttk.Notebook(self.editor.root)
-        self.notebook.pack(fill=tk.BOTH, expand=True)
-        
-        # Create initial tab
-        self.add_tab("Untitled", None)
-        
-    def add_tab(self, title, filepath):
-        """Add a new tab."""
-        # Create frame for tab content
-        tab_frame = tk.Frame(self.notebook)
-        
-        # Create text widget in tab
-        from tkinter import scrolledtext
-        text_widget = scrolledtext.ScrolledText(
-            tab_frame,
-            wrap=tk.WORD,
-            undo=True,
-            font=("Consolas", 11)
-        )
-        text_widget.pack(fill=tk.BOTH, expand=True)
-        
-        # Add tab to notebook
-        self.notebook.add(tab_frame, text=title)
-        
-        # Store tab info
-        tab_id = len(self.tabs)
-        self.tabs[tab_id] = {
-            "frame": tab_frame,
-            "text_widget": text_widget,
-            "filepath": filepath,
-            "title": title,
-            "is_modified": False
-        }
-        
-        # Select the new tab
-        self.notebook.select(tab_id)
-        
-        return tab_id
-        
-    def close_tab(self, tab_id):
-        """Close a tab."""
-        if tab_id in self.tabs:
-            self.notebook.forget(tab_id)
-            del self.tabs[tab_id]
-            
-    def get_current_tab(self):
-        """Get current active tab."""
-        try:
-            selected = self.notebook.index(self.notebook.select())
-            return self.tabs.get(selected)
-        except:
-            return None
-            
-    def update_tab_title(self, tab_id, title, modified=False):
-        """Update tab title."""
-        if tab_id in self.tabs:
-            if modified:
-                title += " *"
-            self.notebook.tab(tab_id, text=title)
-            self.tabs[tab_id]["title"] = title
-            
     def create_line_numbers(self):
         """Create modern line numbers sidebar."""
         if self.line_numbers_visible and not self.line_numbers:
@@ -360,17 +336,23 @@ class UIComponents:
             
             # Clean line numbers frame - Windows Notepad style
             line_frame = tk.Frame(text_parent, width=50, bg="#FAFAFA")
-            # Pack to left side
-            line_frame.pack(side=tk.LEFT, fill=tk.Y)
+            # Pack to left side, in front of the document tabs
+            if hasattr(self.editor, 'notebook'):
+                line_frame.pack(side=tk.LEFT, fill=tk.Y, before=self.editor.notebook)
+            else:
+                line_frame.pack(side=tk.LEFT, fill=tk.Y)
             
             # Subtle right border
             border = tk.Frame(line_frame, width=1, bg="#E5E5E5")
             border.pack(side=tk.RIGHT, fill=tk.Y)
+            self.register_theme(line_frame, "gutter_frame")
+            self.register_theme(border, "gutter_border")
             
-            # Repack text widget to ensure proper layout
-            self.editor.text_widget.pack_forget()
-            self.editor.text_widget.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-            
+            # Shared gutter font: follows the document font size and zoom
+            gutter_font = ("Segoe UI", 11)
+            if getattr(self.editor, 'formatter', None) and self.editor.formatter.gutter_font:
+                gutter_font = self.editor.formatter.gutter_font
+                
             # Clean line numbers text widget
             self.line_numbers = tk.Text(
                 line_frame,
@@ -378,7 +360,7 @@ class UIComponents:
                 bg="#FAFAFA",
                 fg="#808080",
                 state=tk.DISABLED,
-                font=("Segoe UI", 11),
+                font=gutter_font,
                 padx=6,
                 pady=12,
                 wrap=tk.NONE,
@@ -386,6 +368,7 @@ class UIComponents:
                 highlightthickness=0
             )
             self.line_numbers.pack(side=tk.LEFT, fill=tk.Y)
+            self.register_theme(self.line_numbers, "gutter")
             
             # Mouse wheel is handled in editor.py, just sync line numbers on scroll
             def on_scroll(event):
@@ -400,8 +383,7 @@ class UIComponents:
             except:
                 pass
             
-            # Bind text changes
-            self.editor.text_widget.bind("<<Modified>>", lambda e: self.update_line_numbers())
+            # Text changes are forwarded by Editor.on_text_modified
             
             # Update line numbers
             self.update_line_numbers()
@@ -7,12 +7,17 @@ import tkinter as tk
 class ViewManager:
     """Manages view options."""
     
+    # Ctrl+wheel steps within this many ms are applied as one font change
+    ZOOM_COALESCE_DELAY = 50
+    
     def __init__(self, editor):
         self.editor = editor
         self.zoom_level = 100  # Percentage
+        self.zoom_after_id = None
         self.word_wrap = True
         self.line_numbers_visible = False
         self.is_fullscreen = False
+        self.splits = {}  # document text widget -> (paned window, peer) of split documents
         # Get initial font size from text widget
         try:
             current_font = self.editor.text_widget.cget("font")
@@ -52,39 +57,41 @@ class ViewManager:
             if hasattr(self.editor.ui_components, 'zoom_label'):
                 self.editor.ui_components.zoom_label.config(text=f"{self.zoom_level}%")
         
+    def zoom_wheel(self, steps):
+        """Zoom by mouse wheel steps; rapid steps share one relayout."""
+        zoom_level = min(200, max(50, self.zoom_level + 10 * steps))
+        if zoom_level == self.zoom_level:
+            return
+        self.zoom_level = zoom_level
+        self.update_zoom_label()
+        if self.zoom_after_id is None:
+            self.zoom_after_id = self.editor.root.after(self.ZOOM_COALESCE_DELAY, self.apply_zoom)
+        
     def apply_zoom(self):
         """Apply zoom level to text."""
-        # Get current font family
-        try:
-            current_font = self.editor.text_widget.cget("font")
-            if isinstance(current_font, (tuple, list)):
-                family = current_font[0]
-            elif isinstance(current_font, str):
-                font_parts = current_font.split()
-                family = font_parts[0] if font_parts else "Segoe UI"
-            else:
-                family = current_font.actual()["family"]
-        except:
-            family = "Segoe UI"
+        if self.zoom_after_id is not None:
+            self.editor.root.after_cancel(self.zoom_after_id)
+            self.zoom_after_id = None
+            
+        # The shared document font is resized in place (keeps weight and slant,
+        # and scales the line numbers with it)
+        formatter = getattr(self.editor, 'formatter', None)
+        if formatter:
+            formatter.set_zoom(self.zoom_level / 100)
+            return
             
-        # Calculate new size based on base font size
         new_size = int(self.base_font_size * (self.zoom_level / 100))
-        
-        # Apply new font
-        self.editor.text_widget.config(font=(family, new_size))
-        
-        # Update line numbers if visible
-        if hasattr(self.editor, 'ui_components') and self.editor.ui_components:
-            if hasattr(self.editor.ui_components, 'line_numbers') and self.editor.ui_components.line_numbers:
-                self.editor.ui_components.line_numbers.config(font=(family, new_size))
+        for text_widget in self.editor.text_widgets:
+            text_widget.config(font=("Segoe UI", new_size))
         
     def toggle_word_wrap(self):
         """Toggle word wrap."""
         self.word_wrap = not self.word_wrap
-        if self.word_wrap:
-            self.editor.text_widget.config(wrap=tk.WORD)
-        else:
-            self.editor.text_widget.config(wrap=tk.NONE)
+        for text_widget in self.editor.text_widgets:
+            if self.word_wrap:
+                text_widget.config(wrap=tk.WORD)
+            else:
+                text_widget.config(wrap=tk.NONE)
         # Force update
         self.editor.text_widget.update()
             
@@ -104,4 +111,70 @@ class ViewManager:
             self.editor.root.bind("<Escape>", lambda e: self.toggle_fullscreen())
         else:
             self.editor.root.unbind("<Escape>")
+            
+    def split_view(self, orient=tk.HORIZONTAL):
+        """Show the active document in two panes of one shared buffer.
+        
+        A horizontal split puts the panes one above the other, a vertical one
+        side by side. Splitting a split document changes its direction.
+        """
+        primary = self.editor.document_widget(self.editor.text_widget)
+        split = self.splits.get(primary)
+        # The panes are stacked when the sash between them is horizontal
+        paned_orient = tk.VERTICAL if orient == tk.HORIZONTAL else tk.HORIZONTAL
+        if split is not None:
+            split[0].config(orient=paned_orient)
+            return
+        
+        parent = primary.frame.master
+        paned = tk.PanedWindow(parent, orient=paned_orient, sashwidth=4, borderwidth=0)
+        primary.pack_forget()
+        paned.pack(fill=tk.BOTH, expand=True)
+        peer = self.editor.create_text_peer(primary, parent)
+        paned.add(primary.frame, stretch="always")
+        paned.add(peer.frame, stretch="always")
+        # The panes are siblings of the paned window; keep them above it
+        primary.frame.lift()
+        peer.frame.lift()
+        
+        # The new pane starts where the document is
+        peer.mark_set(tk.INSERT, primary.index(tk.INSERT))
+        peer.yview_moveto(primary.yview()[0])
+        self.splits[primary] = (paned, peer)
+        primary.bind("<Destroy>", self.on_split_widget_destroyed, add="+")
+        peer.focus_set()
+        
+    def close_split(self):
+        """Go back to one pane, keeping the cursor and scroll position of the focused one."""
+        focused = self.editor.text_widget
+        primary = self.editor.document_widget(focused)
+        split = self.splits.pop(primary, None)
+        if split is None:
+            return
+        paned, peer = split
+        if focused is peer:
+            primary.mark_set(tk.INSERT, peer.index(tk.INSERT))
+            primary.yview_moveto(peer.yview()[0])
+            self.editor.text_widget = primary
+        
+        paned.forget(primary.frame)
+        peer.frame.destroy()
+        paned.destroy()
+        primary.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        primary.focus_set()
+        ui_components = self.editor.ui_components
+        if ui_components:
+            ui_components.update_status_bar()
+            if ui_components.line_numbers_visible:
+                ui_components.update_line_numbers()
+                
+    def on_split_widget_destroyed(self, event):
+        """Drop the second pane of a document whose tab was closed or hibernated."""
+        split = self.splits.pop(event.widget, None)
+        if split is None:
+            return
+        paned, peer = split
+        for widget in (peer.frame, paned):
+            if widget.winfo_exists():
+                widget.destroy()
 
@@ -0,0 +1,107 @@
+"""
+Tk-free prefix index for word completion in Notexio text editor.
+"""
+import bisect
+import heapq
+import math
+import re
+from collections import Counter
+
+
+# Words worth completing: three or more characters, not starting with a digit
+COMPLETION_WORD_RE = re.compile(r'[^\W\d]\w{2,}')
+
+
+def completion_words(text):
+    """Count the completable words in text."""
+    return Counter(COMPLETION_WORD_RE.findall(text))
+
+
+class PrefixIndex:
+    """Sorted word list searched with bisect, with counts and recency.
+
+    Entries are "lowercase\\0Original" so prefix search is case-insensitive
+    while completions keep their spelling. Updates insert or remove single
+    entries; the list is never rebuilt.
+    """
+
+    RECENCY_WEIGHT = 2.0
+    RECENCY_HALF_LIFE = 200  # updates
+    BULK_INSERT = 64
+
+    def __init__(self):
+        self.entries = []
+        self.counts = Counter()
+        self.last_used = {}
+        self.clock = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    @staticmethod
+    def _entry(word):
+        return f"{word.lower()}\0{word}"
+
+    def add(self, words):
+        """Add a Counter of words."""
+        self.clock += 1
+        new_entries = []
+        for word, count in words.items():
+            if count <= 0:
+                continue
+            if word not in self.counts:
+                new_entries.append(self._entry(word))
+            self.counts[word] += count
+            self.last_used[word] = self.clock
+
+        if len(new_entries) > self.BULK_INSERT:
+            # Loading a document: one merge (timsort runs) beats many insorts
+            self.entries.extend(new_entries)
+            self.entries.sort()
+        else:
+            for entry in new_entries:
+                bisect.insort(self.entries, entry)
+
+    def remove(self, words):
+        """Remove a Counter of words (counts never go below zero)."""
+        for word, count in words.items():
+            if count <= 0 or word not in self.counts:
+                continue
+            remaining = self.counts[word] - count
+            if remaining > 0:
+                self.counts[word] = remaining
+                continue
+            del self.counts[word]
+            self.last_used.pop(word, None)
+            entry = self._entry(word)
+            i = bisect.bisect_left(self.entries, entry)
+            if i < len(self.entries) and self.entries[i] == entry:
+                del self.entries[i]
+
+    def touch(self, word):
+        """Mark a word as just used (an accepted completion)."""
+        self.clock += 1
+        if word in self.counts:
+            self.last_used[word] = self.clock
+
+    def score(self, word):
+        """Rank by frequency, boosted for recently typed or accepted words."""
+        age = self.clock - self.last_used.get(word, 0)
+        recency = 0.5 ** (age / self.RECENCY_HALF_LIFE)
+        return math.log1p(self.counts[word]) + self.RECENCY_WEIGHT * recency
+
+    def complete(self, prefix, limit=10):
+        """The best words starting with prefix (case-insensitive), excluding prefix itself."""
+        key = prefix.lower()
+        start = bisect.bisect_left(self.entries, key)
+        end = bisect.bisect_left(self.entries, key + "\uffff", start)
+        # Rank the whole range: alphabetical order says nothing about frequency
+        candidates = (
+            entry.split("\0", 1)[1]
+            for entry in self.entries[start:end]
+        )
+        return heapq.nlargest(
+            limit,
+            (word for word in candidates if word != prefix and len(word) > len(prefix)),
+            key=self.score
+        )